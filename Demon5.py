@@ -5,133 +5,71 @@
 
 
 # angel_demon_translator_tts_final.py
-import random, re, unicodedata, json
-import requests
+import secrets
 import streamlit as st
 
-# ================== Tokenizer & helpers ==================
-TOK_RE = re.compile(r"(\w+|\s+|[^\w\s]+)", re.UNICODE)  # words | whitespace | punctuation
-INV = "\u2063"  # Invisible Separator to mark inserts (prefix/suffix)
-
-def mark_insert(s):   return INV + s + INV
-def unmark_all(s):    return s.replace(INV, "")
-
-def to_fraktur(text):
-    normal = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-    fraktur = [
-        "𝔄𝔅ℭ𝔇𝔈𝔉𝔊ℌℑ𝔍𝔎𝔏𝔐𝔑𝔒𝔓𝔔ℜ𝔖𝔗𝔘𝔙𝔚𝔛𝔜ℨ",
-        "𝔞𝔟𝔠𝔡𝔢𝔣𝔤𝔥𝔦𝔧𝔨𝔩𝔪𝔫𝔬𝔭𝔮𝔯𝔰𝔱𝔲𝔳𝔴𝔵𝔶𝔷"
-    ]
-    mapping = {c: f for c, f in zip(normal, fraktur[0] + fraktur[1])}
-    return ''.join(mapping.get(ch, ch) for ch in text)
-
-# ================== Simple angel/demon styling (reversible) ==================
-_VOWELS_ANGEL = {'a':['ā','a'],'e':['ē','e'],'i':['ī','i'],'o':['ō','o'],'u':['ū','u'],'y':['ȳ','y']}
-_DIGRAPHS_ANGEL = [('the','θe'),('The','Θe'),('sh','š'),('Sh','Š'),('ph','φ'),('Ph','Φ')]
-
-_VOWELS_DEMON = {'a':['â','a'],'e':['ê','e'],'i':['î','i'],'o':['ô','o'],'u':['û','u'],'y':['ŷ','y']}
-_DIGRAPHS_DEMON = [('the','ðe'),('The','Ðe'),('th','þ'),('Th','Þ'),('sh','ʃ'),('Sh','ʃ'),
-                   ('ph','ƒ'),('Ph','Ƒ'),('qu','q͟u'),('Qu','Q͟u')]
-
-def _style_word(word, angel=False, intensity=2):
-    if not word or not word.isalnum():
-        return word
-    vowels = _VOWELS_ANGEL if angel else _VOWELS_DEMON
-    out = []
-    for c in word:
-        lc = c.lower()
-        if lc in vowels and random.random() < (0.35 + 0.12*intensity):
-            rep = vowels[lc][0]
-            out.append(rep.upper() if c.isupper() else rep); continue
-        out.append(c)
-    return "".join(out)
-
-def stylize_sentence_corruption(sentence, corruption=35, seed=None):
-    """
-    corruption: 0..100 (0=angel, 100=demon)
-    Returns stylized_text, voice_mode ('Angel'|'Neutral'|'Demon'), voice_intensity (1..3)
-    """
-    if seed:
-        random.seed(seed)
-
-    s = sentence
-    tokens = TOK_RE.findall(s)
-
-    if corruption < 40:
-        angel = True
-        intensity = max(1, 3 - int(corruption/14))  # 0-13→3, 14-27→2, 28-39→1
-        if random.random() < 0.06 * intensity:
-            tokens.insert(0 if random.random() < 0.5 else len(tokens), mark_insert("⟨amen⟩"))
-        out = []
-        for t in tokens:
-            out.append(_style_word(t, angel=True, intensity=intensity) if t.isalnum() else t)
-        return "".join(out), "Angel", intensity
-
-    if corruption < 55:
-        return s, "Neutral", 0
-
-    # Demon side
-    intensity = min(3, 1 + int((corruption-55)/15))  # 55-69→1, 70-84→2, 85-100→3
-    if random.random() < 0.09 * intensity:
-        tokens.insert(0 if random.random() < 0.5 else len(tokens), mark_insert("⟨by pact⟩"))
-
-    s2 = "".join(tokens)
-    for a,b in _DIGRAPHS_DEMON:
-        s2 = s2.replace(a,b)
-    out = []
-    for t in TOK_RE.findall(s2):
-        out.append(_style_word(t, angel=False, intensity=intensity) if t.isalnum() else t)
-    return "".join(out), "Demon", intensity
-
-# ================== Decoder (for the display “Reverse-Translated”) ==================
-def decore_word(w):
-    back = [
-        ('ðe','the'), ('Ðe','The'), ('þ','th'), ('Þ','Th'), ('ʃ','sh'), ('ƒ','ph'), ('Ƒ','Ph'),
-        ('q͟u','qu'), ('Q͟u','Qu'), ('θ','th'), ('Θ','Th'), ('š','sh'), ('Š','Sh'), ('φ','ph'), ('Φ','Ph'),
-    ]
-    for a,b in back:
-        w = w.replace(a,b)
-    w = ''.join(c for c in unicodedata.normalize('NFD', w) if unicodedata.category(c) != 'Mn')
-    w = w.translate(str.maketrans("âêîôûŷāēīōūȳ", "aeiouyaeiouy"))
-    return w
-
-def reverse_translate(text):
-    s = unmark_all(text)
-    tokens = TOK_RE.findall(s)
-    out = []
-    for t in tokens:
-        if t.isalnum():
-            out.append(decore_word(t))
-        elif t.startswith("⟨") and t.endswith("⟩"):
-            continue
+from infernal import to_fraktur
+from infernal.simple import stylize_sentence_corruption, reverse_translate
+from infernal.speech import speakable, speech_savings
+from infernal.tts import default_tts_params_for, default_cache
+from infernal.tts.backends import BrowserBackend, default_service, server_audio
+from infernal.tts.cache import default_media
+from infernal.tts.formats import format_for
+from infernal.tts.jobs import default_jobs
+from infernal.tts.prefetch import default_prefetcher
+from infernal.tts.server import default_relay
+from infernal.tts.segments import MAX_CHARS
+
+# ================== TTS status ==================
+def timing_caption(t):
+    if t and t.get("total_s") is not None:
+        st.caption(f"First audio after {t['ttfb_s'] * 1000:.0f} ms • synthesis {t['total_s'] * 1000:.0f} ms • "
+                   f"{t['bytes'] // 1024} KB ({t['kind']})")
+
+def job_status(job_id, polling=False):
+    """Progress and a cancel button while the job runs (polled as a fragment, which hands back with a full rerun
+    once the job is done), then the outcome and the download button."""
+    job = default_jobs().get(job_id)
+    if job is None: return
+    if polling and job.done:
+        st.rerun()
+    if not job.done:
+        p = job.progress()
+        ttfb = job.timing.get("ttfb_s")
+        label = f"Synthesizing… {job.size // 1024} KB" + (f" • first audio after {ttfb * 1000:.0f} ms" if ttfb is not None else "")
+        if p is not None:
+            st.progress(p, text=label)
         else:
-            out.append(t)
-    return re.sub(r"\s{2,}", " ", "".join(out)).strip()
-
-# ================== ElevenLabs TTS ==================
-def tts_elevenlabs(text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3):
-    """
-    Returns bytes (mp3). Raises on error.
-    """
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-    headers = {
-        "xi-api-key": api_key,
-        "accept": "audio/mpeg",
-        "content-type": "application/json",
-    }
-    payload = {
-        "text": text,
-        "model_id": "eleven_multilingual_v2",
-        "voice_settings": {
-            "stability": stability,
-            "similarity_boost": similarity,
-            "style": style,
-            "use_speaker_boost": True
-        }
-    }
-    r = requests.post(url, headers=headers, data=json.dumps(payload), timeout=60)
-    r.raise_for_status()
-    return r.content
+            st.caption(label)
+        if st.button("✖ Cancel"):
+            default_jobs().cancel(job_id)
+            st.session_state.pop("tts_job", None)
+            st.rerun()
+    elif job.cancelled:
+        st.info("TTS cancelled.")
+    elif job.error is not None:
+        st.error(f"TTS failed: {job.error}")
+    else:
+        download_link(job.media_key)
+        timing_caption(job.timing)
+
+def download_link(media):
+    """Download from the relay's media URL when there is one; otherwise the bytes go into the page."""
+    relay = default_relay()
+    if relay is not None:
+        st.link_button("Download MP3", relay.media_url(media, download=True))
+        return
+    data = default_media().get(media)
+    if data is not None:
+        st.download_button("Download MP3", data=data, file_name="voice.mp3", mime="audio/mpeg")
+
+def prefetch_tick(spoken, api_key, vid, mode, fmt, params, debounce):
+    """Start a background synthesis of the settled input (polled as a fragment) and report this session's tally."""
+    pf = default_prefetcher()
+    pf.tick(st.session_state, spoken, api_key, vid, mode=mode, output_format=fmt, debounce=debounce, **params)
+    ps = pf.stats(st.session_state)
+    st.caption(f"Prefetch: {ps['hits']} hits of {ps['hits'] + ps['misses']} clicks • {ps['issued']} issued • "
+               f"{ps['wasted']} wasted • {ps['chars']} chars")
 
 # ================== UI ==================
 st.set_page_config(page_title="Angelic ⇄ Demonic Translator (Real Voices)", page_icon="🔊")
@@ -143,6 +81,12 @@ with st.sidebar:
     api_key = st.text_input("ElevenLabs API Key", value="sk_09c439f46b32383ce61f4ddb237a6d270868b76f28490284")
     angel_voice = st.text_input("Angelic Voice ID", value="kJKMPwrIKzwVkMKOfRtr")
     demon_voice = st.text_input("Demonic Voice ID", value="si0svtk05vPEuvwAW93c")
+    # lower bitrates download faster on slow connections; each quality is cached separately
+    quality = st.selectbox("Audio quality", ["standard", "mobile", "download"],
+                           format_func=lambda q: {"standard": "Standard (128 kbps)", "mobile": "Mobile (64 kbps)",
+                                                  "download": "High (192 kbps, for download)"}[q])
+    prefetch = st.checkbox("Prefetch voice once the input settles (spends API credits)", value=False)
+    debounce = st.slider("Prefetch after (seconds unchanged)", 0.5, 5.0, 1.5, 0.5) if prefetch else None
 
 # Controls
 corruption = st.slider("Corruption (😇 → 😈)", 0, 100, 35)
@@ -151,19 +95,30 @@ seed_val = st.text_input("Seed (optional for consistent styling)", "")
 # Input
 text = st.text_area("Enter English text:", "")
 
-stylized = ""
+stylized = spoken = ""
 voice_used = "Neutral"
 voice_int = 0
 
 if text:
-    stylized, voice_used, voice_int = stylize_sentence_corruption(
-        text,
-        corruption=corruption,
-        seed=(seed_val.strip() or None),
-    )
+    # with prefetch on, an unseeded stylization is kept across reruns so the clip being prefetched is the one spoken
+    pinned = st.session_state.get("pinned")
+    if prefetch and pinned and pinned[0] == (text, corruption, seed_val):
+        stylized, voice_used, voice_int, spoken = pinned[1]
+    else:
+        stylized, voice_used, voice_int = stylize_sentence_corruption(
+            text,
+            corruption=corruption,
+            seed=(seed_val.strip() or None),
+        )
+        # the voices get the speakable rendition: glyphs folded, marks and separators dropped, oaths kept as words
+        spoken = speakable(stylized)
+        st.session_state["pinned"] = ((text, corruption, seed_val), (stylized, voice_used, voice_int, spoken))
     st.markdown(f"**Voice:** `{voice_used}`  •  **Intensity:** `{voice_int}`")
     st.markdown("**Stylized (this is what will be spoken):**")
     st.markdown(f"<div style='font-size:1.3em'>{stylized}</div>", unsafe_allow_html=True)
+    sv = speech_savings(stylized, spoken)
+    st.caption(f"Sent to the voice as {sv['spoken']} characters ({-sv['saved']:+d} vs the stylized text), "
+               f"{sv['spoken_bytes']} bytes ({sv['spoken_bytes'] - sv['stylized_bytes']:+d})")
 
     st.markdown("**Reverse-Translated (for reference):**")
     st.code(reverse_translate(stylized), language="text")
@@ -171,17 +126,7 @@ if text:
 st.write("---")
 st.subheader("🔈 Speak (reads the stylized text only)")
 
-use_eleven = bool(api_key and ((voice_used == "Angel" and angel_voice) or (voice_used == "Demon" and demon_voice) or (voice_used == "Neutral" and (angel_voice or demon_voice))))
-
-def default_tts_params_for(voice_used, corruption):
-    if voice_used == "Angel":
-        return dict(stability=0.5, similarity=0.8, style=0.35)
-    if voice_used == "Demon":
-        # darker style; lower stability for rasp/texture at high corruption
-        return dict(stability=(0.35 if corruption >= 85 else 0.45),
-                    similarity=0.75,
-                    style=(0.65 if corruption >= 85 else 0.5))
-    return dict(stability=0.5, similarity=0.8, style=0.4)
+use_eleven = server_audio() and bool(api_key and ((voice_used == "Angel" and angel_voice) or (voice_used == "Demon" and demon_voice) or (voice_used == "Neutral" and (angel_voice or demon_voice))))
 
 if not text:
     st.info("Type some text above first.")
@@ -189,38 +134,69 @@ else:
     if use_eleven:
         vid = angel_voice if voice_used == "Angel" else demon_voice if voice_used == "Demon" else (angel_voice or demon_voice)
         params = default_tts_params_for(voice_used, corruption)
+        jobs, relay = default_jobs(), default_relay()
+        # this session's place in the fair upstream queue
+        session = st.session_state.setdefault("tts_session", secrets.token_hex(8))
+        # streaming needs the relay, which is only there when the deploy opted in (INFERNAL_TTS_RELAY_URL)
+        streaming = relay is not None and st.checkbox("Stream playback (start speaking before synthesis finishes)",
+                                                      value=True, help=f"Plays from the audio relay at {relay.base_url}")
+        # long passages: sentence segments synthesized in parallel, each cached and retried on its own
+        mode = "segments" if len(spoken) > MAX_CHARS else "stream" if streaming else "full"
+        fmt = format_for(quality)
 
         c1, c2, c3 = st.columns([1,1,1])
         with c1:
             if st.button("🔊 Generate Voice (ElevenLabs)"):
-                try:
-                    audio = tts_elevenlabs(stylized, api_key, vid, **params)
-                    st.session_state["last_audio"] = audio
-                    st.success("Audio generated from stylized text.")
-                except Exception as e:
-                    st.error(f"TTS failed: {e}")
+                if prefetch:
+                    default_prefetcher().clicked(st.session_state, spoken, vid, mode=mode, output_format=fmt, **params)
+                st.session_state["tts_job"] = jobs.submit_tts(spoken, api_key, vid, mode=mode, output_format=fmt,
+                                                              session=session, replaces=st.session_state.get("tts_job"),
+                                                              **params)
 
         with c2:
             if st.button("⚡ Quick Test (very short sample)"):
-                try:
-                    sample_text = "Amen." if voice_used == "Angel" else "Speak."
-                    audio = tts_elevenlabs(sample_text, api_key, vid, **params)
-                    st.session_state["last_audio"] = audio
-                    st.success("Quick test audio generated.")
-                except Exception as e:
-                    st.error(f"TTS test failed: {e}")
+                sample_text = "Amen." if voice_used == "Angel" else "Speak."
+                st.session_state["tts_job"] = jobs.submit_tts(sample_text, api_key, vid, mode="full",
+                                                              output_format=format_for("preview"), session=session,
+                                                              replaces=st.session_state.get("tts_job"), **params)
 
         with c3:
             if st.button("🗑️ Clear last audio"):
-                st.session_state.pop("last_audio", None)
-
-        audio_bytes = st.session_state.get("last_audio")
-        if audio_bytes:
-            st.audio(audio_bytes, format="audio/mp3")
-            st.download_button("Download MP3", data=audio_bytes, file_name="voice.mp3", mime="audio/mpeg")
+                jobs.cancel(st.session_state.pop("tts_job", None))
+                st.session_state.pop("tts_media", None)
+
+        if prefetch:
+            st.fragment(prefetch_tick, run_every=0.5)(spoken, api_key, vid, mode, fmt, params, debounce)
+
+        # the session keeps only the job id and the finished clip's media key; the audio itself is served by URL
+        job_id = st.session_state.get("tts_job")
+        job = jobs.get(job_id)
+        if job is not None and job.media_key:
+            st.session_state["tts_media"] = job.media_key
+        media = st.session_state.get("tts_media") if job is None or job.ok else None
+        if relay is not None and job is not None and not job.cancelled and (streaming or job.ok):
+            st.audio(relay.url(job_id), format="audio/mpeg", autoplay=streaming)
+        elif relay is not None and media:
+            st.audio(relay.media_url(media), format="audio/mpeg")
+        elif media and (data := default_media().get(media)) is not None:
+            st.audio(data, format="audio/mp3")
+        if job is not None:
+            if job.done:
+                job_status(job_id)
+            else:
+                st.fragment(job_status, run_every=1.0)(job_id, polling=True)
+        elif media:
+            download_link(media)
+
+        cs = default_cache().stats()
+        st.caption(f"TTS cache: {cs['hits_hot'] + cs['hits_disk']} hits • {cs['misses']} misses • "
+                   f"{cs['disk_bytes'] // 1024} KB on disk")
+        qs = default_service().stats()
+        st.caption(f"TTS queue: {qs['in_flight']}/{qs['limit']} in flight • {qs['depth']} waiting • wait p95 "
+                   f"{qs['wait_p95_ms'] or 0:.0f} ms • upstream {qs['breaker']}")
 
     else:
-        # Fallback: Browser speech API (reads STYLIZED text as well)
+        # Fallback: Browser speech API (reads the same speakable rendition)
         st.caption("No ElevenLabs config — using browser speech (quality depends on your device).")
         if voice_used == "Angel":
             rate, pitch = 1.05, 1.25
@@ -230,53 +206,7 @@ else:
             rate, pitch = 1.0, 1.0
 
         st.write("Click **Speak** to hear the stylized text. Works best in Chrome/Edge.")
-        payload = {"text": stylized or "", "rate": rate, "pitch": pitch, "volume": 1.0}
-        html = f"""
-        <div style="display:flex;gap:8px;align-items:center;margin:6px 0 12px;">
-          <button id="speakBtn" style="padding:8px 14px;border-radius:8px;border:1px solid #555;cursor:pointer;">Speak</button>
-          <button id="stopBtn" style="padding:8px 14px;border-radius:8px;border:1px solid #555;cursor:pointer;">Stop</button>
-          <span id="voiceStatus" style="margin-left:8px;color:#666;font-size:0.9em;"></span>
-        </div>
-        <script>
-        (function() {{
-          const data = {json.dumps(payload)};
-          const synth = window.speechSynthesis;
-          const status = document.getElementById("voiceStatus");
-          const speakBtn = document.getElementById("speakBtn");
-          const stopBtn = document.getElementById("stopBtn");
-          const txt = data.text || "";
-          const rate = Number(data.rate) || 1.0;
-          const pitch = Number(data.pitch) || 1.0;
-          const volume = Number(data.volume) || 1.0;
-
-          function pickVoice() {{
-            const voices = synth.getVoices() || [];
-            const en = voices.filter(v => /en(-|_|\\b)/i.test(v.lang) || /English/i.test(v.name));
-            return en[0] || voices[0] || null;
-          }}
-
-          function speakNow() {{
-            if (!('speechSynthesis' in window)) {{
-              status.textContent = "Not supported in this browser.";
-              return;
-            }}
-            synth.cancel();
-            const u = new SpeechSynthesisUtterance(txt);
-            u.rate = rate; u.pitch = pitch; u.volume = volume;
-            const v = pickVoice();
-            if (v) u.voice = v;
-            synth.speak(u);
-            status.textContent = "Speaking" + (v ? " with " + v.name : "") + "...";
-            u.onend = () => status.textContent = "Done.";
-            u.onerror = () => status.textContent = "Speech error.";
-          }}
-
-          speakBtn.onclick = speakNow;
-          stopBtn.onclick = () => {{ synth.cancel(); status.textContent = "Stopped."; }};
-        }})();
-        </script>
-        """
-        st.components.v1.html(html, height=70)
+        st.components.v1.html(BrowserBackend.html(spoken, rate, pitch), height=70)
 
 # --- Decoder box ---
 st.write("---")
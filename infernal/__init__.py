@@ -0,0 +1,39 @@
+"""Angelic ⇄ Demonic translator core, importable without Streamlit.
+
+One submodule per translator generation; the Streamlit apps (``Demon*.py``) are thin front-ends over them:
+
+- ``persona``     Baal / Mephisto / Imp persona styling (``Demon.py``)
+- ``angelic``     0..100 slider over angel + demon personas (``Demon2.py``, ``Demon3.py``)
+- ``simple``      vowel pass + demon digraphs (``Demon4.py``, ``Demon5.py``, ``Demon6.py``)
+- ``ornate``      affixes, ornaments and Zalgo, deterministic (``Demon7.py``, ``Demon8.py``)
+- ``continuous``  per-tick style profiles (``Demon9.py``, ``Demon10.py``, ``Demon11.py``); ``sweep`` over many levels
+- ``profiles``    immutable per-level parameter table for corruption 0..100 (``LEVELS``)
+- ``engine``      compiled single-pass digraph / vowel / ornament / Zalgo stylizer shared by the deterministic cores
+- ``decoder``     decode folds (glyphs, ornaments, combining marks, accents) compiled once at import
+- ``stream``      line-by-line generators for large inputs (``python -m infernal encode|decode`` pipes stdin → stdout)
+- ``batch``       ``stylize_many`` / ``decode_many`` / ``sweep`` over a process pool (import explicitly)
+- ``incremental`` per-session encoder that re-styles only the paragraphs changed since the last keystroke
+- ``bench``       encode / decode benchmark over every variant (``python -m infernal.bench``)
+- ``st_cache``    ``st.cache_data`` / ``st.cache_resource`` wrappers for the apps (imports streamlit)
+- ``speech``      speakable rendition of stylized text for the voices (glyphs folded, marks dropped, oaths kept)
+- ``tts``         ElevenLabs client (imports ``requests`` lazily) and its audio cache
+"""
+ALGO_VERSION = "1"  # bump whenever any encoder / decoder output changes (keys the app result caches)
+
+from .text import TOK_RE, INV, mark_insert, unmark_all, to_fraktur
+from .fonts import FONT_CSS, band_for
+from .glyphs import DEMON_PERSONAS
+from .profiles import Level, LEVELS, level_for, angel_profile, demon_profile, neutral_profile
+from .continuous import stylize_sentence, stylize_sentence_corruption, decode_to_english, sweep
+from .stream import stylize_stream, decode_stream
+from .speech import speakable, speech_savings
+
+__all__ = [
+    "ALGO_VERSION",
+    "TOK_RE", "INV", "mark_insert", "unmark_all", "to_fraktur",
+    "FONT_CSS", "band_for", "DEMON_PERSONAS",
+    "stylize_sentence", "stylize_sentence_corruption", "decode_to_english", "sweep",
+    "angel_profile", "demon_profile", "neutral_profile", "Level", "LEVELS", "level_for",
+    "stylize_stream", "decode_stream",
+    "speakable", "speech_savings",
+]
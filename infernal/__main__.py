@@ -0,0 +1,40 @@
+"""Pipe stdin to stdout through the streaming encoder / decoder.
+
+    python -m infernal encode -c 77 < book.txt > book.demon.txt
+    python -m infernal decode < book.demon.txt
+"""
+import argparse, sys
+
+from .stream import stylize_stream, decode_stream
+
+_READ_SIZE = 1 << 16
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m infernal", description="Angelic ⇄ Demonic translator (stdin → stdout)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    enc = sub.add_parser("encode", help="stylize plain text")
+    enc.add_argument("-c", "--corruption", type=int, default=50, help="1 = angelic … 100 = demonic")
+    enc.add_argument("--seed", default=None)
+    enc.add_argument("--archaic", action="store_true", help="thou / thy pronouns (angel side)")
+    enc.add_argument("--latinisms", action="store_true", help="sprinkle ⟨latin⟩ asides")
+    enc.add_argument("--glitch", action="store_true", help="force combining marks on the demon side")
+    dec = sub.add_parser("decode", help="decode stylized text back to plain English")
+    dec.add_argument("--archaic", action="store_true", help="map thou / thy back to you / your")
+    dec.add_argument("--keep-latinisms", action="store_true", help="keep ⟨…⟩ asides")
+    args = ap.parse_args(argv)
+
+    sys.stdin.reconfigure(encoding="utf-8", errors="replace")
+    sys.stdout.reconfigure(encoding="utf-8")
+    chunks = iter(lambda: sys.stdin.read(_READ_SIZE), "")
+    if args.cmd == "encode":
+        out = stylize_stream(chunks, args.corruption, archaic=args.archaic, latinisms=args.latinisms,
+                             glitch_override=args.glitch, seed=args.seed)
+    else:
+        out = decode_stream(chunks, decode_archaic=args.archaic, strip_latinisms=not args.keep_latinisms)
+    write = sys.stdout.write
+    for piece in out:
+        write(piece)
+    sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
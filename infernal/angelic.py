@@ -0,0 +1,235 @@
+"""Angelic ⇄ Infernal translator: a 0..100 corruption slider over angel and demon personas.
+
+:class:`AngelicTranslator` owns its own generator; the module-level functions draw from the global ``random`` stream.
+"""
+import random, re
+from functools import lru_cache
+
+from .text import TOK_RE, mark_insert, unmark_all, replace_ci_bound
+from .glyphs import (V_DEMON_DARK as _VOWELS_DEMON, V_ANGEL as _VOWELS_ANGEL, DGR_DEMON as _DIGRAPHS_DEMON,
+                     DGR_ANGEL as _DIGRAPHS_ANGEL, AFFIXES as _AFFIXES, OATHS as _OATHS,
+                     ZALGO_L as _ZALGO_LIGHT, ZALGO_H as _ZALGO_HEAVY, ARCHAIC_PAIRS, LATINISMS)
+from .decoder import Folder, map_tokens, squeeze
+
+# ================== Optional add-ons ==================
+def apply_archaic_pronouns(text):
+    s = text
+    for a,b in sorted(ARCHAIC_PAIRS, key=lambda x: len(x[0]), reverse=True):
+        s = replace_ci_bound(s, a, b)
+    return s
+
+# ================== Encoders ==================
+class AngelicTranslator:
+    """Reentrant encoder: owns its generator (``random.Random(seed)``), so concurrent sessions or threads never
+    interleave draws and a seed gives the same text at any concurrency. Create one per request or session.
+    ``rng`` may be any object with ``random()`` / ``choice()``; the module-level functions pass ``random`` itself."""
+    __slots__ = ("rng",)
+
+    def __init__(self, seed=None, *, rng=None):
+        self.rng = rng if rng is not None else random.Random(seed)
+
+    def sprinkle_latinisms(self, sentence, rate=0.18):
+        rnd, choice = self.rng.random, self.rng.choice
+        tokens = TOK_RE.findall(sentence)
+        out = []
+        for t in tokens:
+            out.append(t)
+            if t.strip() and t[-1:].isalnum() and rnd() < rate:
+                out.append(mark_insert("⟨" + choice(LATINISMS) + "⟩"))
+        return "".join(out)
+
+    def style_word_demon(self, word, persona="Mephisto", intensity=2, glitch_mode=False, strict=False):
+        if not word or not word.isalnum():
+            return word
+        rnd, choice = self.rng.random, self.rng.choice
+        pre_opts, suf_opts = _AFFIXES[persona]
+
+        if rnd() < 0.12*intensity:
+            word = mark_insert(choice(pre_opts)) + word
+        if rnd() < 0.10*intensity:
+            word = word + mark_insert(choice(suf_opts))
+
+        for a,b in _DIGRAPHS_DEMON:
+            word = word.replace(a,b)
+
+        out = []
+        for c in word:
+            lc = c.lower()
+            if lc in _VOWELS_DEMON and rnd() < (0.5 + 0.15*intensity):
+                rep = choice(_VOWELS_DEMON[lc][:-1])
+                out.append(rep.upper() if c.isupper() else rep); continue
+            if strict:
+                out.append(c); continue
+            if lc == 's' and rnd() < 0.5:
+                out.append('ſ' if c.islower() else 'S'); continue
+            if lc == 't' and rnd() < 0.25:
+                out.append('†'); continue
+            if lc == 'h' and rnd() < 0.25:
+                out.append('ʰ'); continue
+            if lc == 'n' and rnd() < 0.20:
+                out.append('ñ'); continue
+            if c == "'":
+                out.append(choice(["'", "’"])); continue
+            if (glitch_mode or intensity >= 3) and c.isalpha() and rnd() < (0.12 if glitch_mode else 0.18):
+                marks = _ZALGO_HEAVY if glitch_mode else _ZALGO_LIGHT
+                stack = 1 + int(glitch_mode and rnd() < 0.5)
+                out.append(c + "".join(choice(marks) for _ in range(stack))); continue
+            out.append(c)
+        return "".join(out)
+
+    def style_word_angel(self, word, intensity=2, strict=False):
+        if not word or not word.isalnum():
+            return word
+        rnd, choice = self.rng.random, self.rng.choice
+        pre_opts, suf_opts = _AFFIXES['Angel']
+
+        if rnd() < 0.10*intensity:
+            word = mark_insert(choice(pre_opts)) + word
+        if rnd() < 0.08*intensity:
+            word = word + mark_insert(choice(suf_opts))
+
+        for a,b in _DIGRAPHS_ANGEL:
+            word = word.replace(a,b)
+
+        out = []
+        for c in word:
+            lc = c.lower()
+            if lc in _VOWELS_ANGEL and rnd() < (0.45 + 0.12*intensity):
+                rep = _VOWELS_ANGEL[lc][0]  # macron form
+                out.append(rep.upper() if c.isupper() else rep); continue
+            # keep strict ≈ same meaning: avoid extra ornaments
+            out.append(c)
+        return "".join(out)
+
+    def stylize_sentence_corruption(self, sentence, demon_persona="Mephisto", corruption=35, archaic=False,
+                                    latinisms=False, glitch_mode=False, strict=False):
+        """
+        corruption: 0..100  (0=angel, 100=demon)
+        Returns stylized_text, voice ('Angel'|'Neutral'|persona), intensity (0..3)
+        """
+        rnd, choice = self.rng.random, self.rng.choice
+        s = sentence
+        tokens = TOK_RE.findall(s)
+
+        # decide voice & intensity from slider
+        if corruption < 40:
+            # Angelic
+            intensity_ang = max(1, 3 - int(corruption/14))  # 0-13→3, 14-27→2, 28-39→1
+            # oath insert (gentle)
+            if rnd() < 0.08*intensity_ang:
+                tokens.insert(0 if rnd()<0.5 else len(tokens), mark_insert(choice(_OATHS['Angel'])))
+            out = []
+            for t in tokens:
+                if t.isalnum():
+                    out.append(self.style_word_angel(t, intensity=intensity_ang, strict=strict))
+                else:
+                    out.append(t)
+            return "".join(out), "Angel", intensity_ang
+
+        # Middle band: slight touch only (pass-through, no oaths)
+        if corruption < 55:
+            return s, "Neutral", 0
+
+        # Demon side
+        intensity_dem = min(3, 1 + int((corruption-55)/15))  # 55-69→1, 70-84→2, 85-100→3
+        if demon_persona == "Baal" and archaic:
+            s = apply_archaic_pronouns(s)
+
+        tokens = TOK_RE.findall(s)
+        if rnd() < 0.12*intensity_dem:
+            oath = choice(_OATHS.get(demon_persona, []))
+            if oath:
+                tokens.insert(0 if rnd()<0.5 else len(tokens), mark_insert(oath))
+
+        out = []
+        for t in tokens:
+            if t.isalnum():
+                if t == "I" and demon_persona != "Imp":
+                    out.append("Ì")
+                else:
+                    out.append(self.style_word_demon(t, persona=demon_persona, intensity=intensity_dem,
+                                                     glitch_mode=(glitch_mode or corruption>=85), strict=strict))
+            else:
+                out.append(t)
+        s2 = "".join(out)
+        if demon_persona == "Mephisto" and latinisms:
+            s2 = self.sprinkle_latinisms(s2, rate=0.16 + 0.04*intensity_dem)
+        return s2, demon_persona, intensity_dem
+
+_GLOBAL = AngelicTranslator(rng=random)  # the module-level functions keep drawing from the global stream
+
+def sprinkle_latinisms(sentence, rate=0.18):
+    return _GLOBAL.sprinkle_latinisms(sentence, rate)
+
+def _style_word_demon(word, persona="Mephisto", intensity=2, glitch_mode=False, strict=False):
+    return _GLOBAL.style_word_demon(word, persona, intensity, glitch_mode, strict)
+
+def _style_word_angel(word, intensity=2, strict=False):
+    return _GLOBAL.style_word_angel(word, intensity, strict)
+
+def stylize_sentence_corruption(sentence, demon_persona="Mephisto", corruption=35, archaic=False, latinisms=False, glitch_mode=False, strict=False):
+    """Global-``random`` form of :meth:`AngelicTranslator.stylize_sentence_corruption` (not safe across threads /
+    sessions). Returns stylized_text, voice ('Angel'|'Neutral'|persona), intensity (0..3)"""
+    return _GLOBAL.stylize_sentence_corruption(sentence, demon_persona, corruption, archaic, latinisms, glitch_mode,
+                                               strict)
+
+# ================== Decoder ==================
+_PREFIXES = sorted(set(sum([v[0] for v in _AFFIXES.values()], [])), key=len, reverse=True)
+_SUFFIXES = sorted(set(sum([v[1] for v in _AFFIXES.values()], [])), key=len, reverse=True)
+_BACK_PAIRS = [
+    ("thou art","you are"),
+    ("thou shalt","you will"),
+    ("shalt not","shall not"),
+    ("thy","your"),
+    ("thine","yours"),
+    ("thou","you"),
+]
+
+_BACK_ORDER = sorted(_BACK_PAIRS, key=lambda x: len(x[0]), reverse=True)
+_FOLD = Folder([
+    # undo demon digraphs
+    ('ðe','the'), ('Ðe','The'),
+    ('þ','th'),   ('Þ','Th'),
+    ('ʃ','sh'),   ('Χ','Ch'), ('χ','ch'),
+    ('ƒ','ph'),   ('Ƒ','Ph'),
+    ('q͟u','qu'), ('Q͟u','Qu'),
+    # undo angel digraphs
+    ('θ','th'),   ('Θ','Th'),
+    ('š','sh'),   ('Š','Sh'),
+    ('φ','ph'),   ('Φ','Ph'),
+    # strip ornaments (demon) + normalize apostrophe char
+    ('ſ','s'), ('ŕ','r'), ('†','t'), ('ʰ','h'), ('ñ','n'), ('Ì','I'), ("’","'"),
+], ("âàäáêèëéîïìíôöòóûüùúŷÿāēīōūȳ", "aaaaeeeeiiiioooouuuuyyaeiouy"))
+_OATH = re.compile(r"⟨[^⟩]+⟩")
+
+def decore_word(w):
+    # undo both angelic & demonic digraphs, ornaments, combining marks and accents
+    return _FOLD(w)
+
+def _strip_affixes_token(tok):
+    for pre in _PREFIXES:
+        if tok.startswith(pre):
+            tok = tok[len(pre):]; break
+    for suf in _SUFFIXES:
+        if tok.endswith(suf):
+            tok = tok[:-len(suf)]; break
+    return tok
+
+@lru_cache(maxsize=65536)
+def _decode_token(tok):
+    return _strip_affixes_token(_FOLD(tok))
+
+def de_demonify_sentence(text, decode_archaic=False, strip_latinisms=True):
+    s = unmark_all(text)
+
+    if strip_latinisms:
+        s = _OATH.sub("", s)
+
+    # strip all known affixes (angel + demon)
+    s2 = map_tokens(s, _decode_token)
+
+    if decode_archaic:
+        for a,b in _BACK_ORDER:
+            s2 = replace_ci_bound(s2, a, b)
+
+    return squeeze(s2)
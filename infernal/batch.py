@@ -0,0 +1,113 @@
+"""Multi-core batch encode / decode over a process pool.
+
+Each text is styled by :func:`stylize_sentence` exactly as in a serial loop (the RNG is seeded from the text and the
+corruption, not from call order), so results are byte-identical whatever the worker count. Texts are packed into tasks
+of roughly ``target_chars`` characters so millions of short sentences don't pay one round-trip each and a single huge
+text isn't stuck behind a queue of small ones; ``map`` keeps input order.
+
+:func:`stylize_document` does the same for one long text in counter mode (``stylize_sentence(..., counter=True)``):
+its draws are keyed on character positions, so the text is cut into slices that style independently on any worker
+and join into exactly the serial result.
+
+:func:`sweep` styles one text at many corruption levels (:func:`~infernal.continuous.sweep`), a run of levels per task.
+"""
+import os, time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .continuous import stylize_sentence, stylize_slice, counter_prepass, decode_to_english, sweep as _sweep
+from .engine import keyed_slices
+
+DEFAULT_TARGET_CHARS = 1 << 16
+_SERIAL_BELOW = 1 << 15  # total chars under which a pool costs more than it saves
+
+def _cpu_count():
+    # cores this process may run on (containers often pin fewer than os.cpu_count())
+    if hasattr(os, "sched_getaffinity"): return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def _init_worker():
+    # the compiled stylizer / decoder tables live at module level: importing builds them once per worker
+    stylize_sentence("warm up", 80)
+    decode_to_english("warm up")
+
+def _stylize_batch(corruption, opts, texts):
+    return [stylize_sentence(t, corruption, **opts)[0] for t in texts]
+
+def _slice_batch(corruption, opts, parts):
+    return [stylize_slice(t, corruption, offset=a, bol=bol, eol=eol, **opts) for t, a, bol, eol in parts]
+
+def _sweep_batch(text, opts, levels):
+    return list(_sweep(text, levels, **opts))
+
+def _decode_batch(opts, texts):
+    return [decode_to_english(t, **opts) for t in texts]
+
+def _batches(texts, target_chars, size_of=len):
+    batch, size = [], 0
+    for t in texts:
+        batch.append(t); size += size_of(t)
+        if size >= target_chars:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+def _run(fn, texts, args, workers, target_chars, stats, size_of=len):
+    texts = list(texts)
+    chars = sum(map(size_of, texts))
+    workers = workers or _cpu_count()
+    t0 = time.perf_counter()
+    if workers == 1 or chars < _SERIAL_BELOW:
+        workers = 1
+        out = fn(*args, texts)
+    else:
+        out = []
+        batches = list(_batches(texts, target_chars or max(1, min(DEFAULT_TARGET_CHARS, chars // (workers * 4))),
+                                size_of))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            for part in pool.map(partial(fn, *args), batches):
+                out.extend(part)
+    if stats is not None:
+        dt = time.perf_counter() - t0
+        stats.update(texts=len(texts), chars=chars, seconds=dt, workers=workers,
+                     chars_per_s=chars / dt if dt else float("inf"))
+    return out
+
+def stylize_many(texts, corruption:int, *, workers:int|None=None, target_chars:int|None=None, stats:dict|None=None,
+                 archaic=False, latinisms=False, glitch_override=False, seed:str|None=None):
+    """
+    Stylized text for every item of ``texts`` (same order), as ``[stylize_sentence(t, corruption, ...)[0] ...]``.
+    workers: process count (default: all cores; small inputs run serially). stats: dict filled with
+    texts / chars / seconds / workers / chars_per_s.
+    """
+    opts = dict(archaic=archaic, latinisms=latinisms, glitch_override=glitch_override, seed=seed)
+    return _run(_stylize_batch, texts, (corruption, opts), workers, target_chars, stats)
+
+def stylize_document(text:str, corruption:int, *, workers:int|None=None, target_chars:int|None=None,
+                     stats:dict|None=None, archaic=False, latinisms=False, glitch_override=False,
+                     seed:str|None=None, coupled=False) -> str:
+    """
+    ``stylize_sentence(text, corruption, counter=True, ...)[0]`` (or ``coupled=True``) for one long text, cut by
+    :func:`~infernal.engine.keyed_slices` into slices of about ``target_chars`` and styled over a process pool;
+    byte-identical to the serial result whatever the worker count or slice size. Other arguments as
+    :func:`stylize_many` (``stats["texts"]`` counts slices).
+    """
+    text = counter_prepass(text, corruption, archaic=archaic)
+    opts = dict(latinisms=latinisms, glitch_override=glitch_override, seed=seed, coupled=coupled)
+    target = target_chars or max(4096, min(DEFAULT_TARGET_CHARS, len(text) // ((workers or _cpu_count()) * 4)))
+    parts = [(text[a:b], a, bol, eol) for a, b, bol, eol in keyed_slices(text, target)]
+    return "".join(_run(_slice_batch, parts, (corruption, opts), workers, target, stats, lambda p: len(p[0])))
+
+def sweep(text:str, levels=range(1, 101), *, workers:int|None=None, stats:dict|None=None, **opts) -> list:
+    """
+    ``list(continuous.sweep(text, levels, **opts))`` over a process pool: each task plans the text once and styles a
+    run of levels; same tuples, same order. ``stats["texts"]`` counts levels, ``stats["chars"]`` the text per level.
+    """
+    return _run(partial(_sweep_batch, text), levels, (opts,), workers, None, stats, lambda c: len(text))
+
+def decode_many(texts, *, workers:int|None=None, target_chars:int|None=None, stats:dict|None=None,
+                decode_archaic=False, strip_latinisms=True):
+    """``[decode_to_english(t, ...) for t in texts]`` over a process pool; arguments as :func:`stylize_many`."""
+    opts = dict(decode_archaic=decode_archaic, strip_latinisms=strip_latinisms)
+    return _run(_decode_batch, texts, (opts,), workers, target_chars, stats)
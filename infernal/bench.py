@@ -0,0 +1,189 @@
+"""Encode / decode benchmark over every translator variant.
+
+    python -m infernal.bench                       # 100 B, 10 KB, 1 MB at every band, JSON to bench-<commit>.json
+    python -m infernal.bench --sizes 100,10k --variants ornate,continuous -o now.json --compare before.json
+
+Each (variant, op, size, level) cell times ``repeat`` calls on a fixed synthetic corpus and reports chars/s, p50/p99
+latency and, from one extra call under ``tracemalloc``, peak Python heap. Variants with a random stream get a fresh
+seeded one (a translator object, or the global ``random`` reseeded) before every call so runs are repeatable.
+
+``--parallel 1,2,4`` adds the counter-mode document encoder (:func:`infernal.batch.stylize_document`) at each worker
+count on the largest size, with its speedup over one worker; the outputs are checked identical.
+
+``--sweep`` adds a full 100-level sweep (:func:`infernal.continuous.sweep`) against one
+``stylize_sentence_corruption`` call per level, at every size; the outputs are checked identical.
+"""
+import argparse, json, os, platform, random, subprocess, sys, time, tracemalloc
+
+from . import persona, angelic, simple, ornate, continuous
+
+BANDS = tuple(range(5, 100, 10))  # one level per css band (band1..band10)
+SIZES = {"100": 100, "10k": 10_000, "1m": 1_000_000}
+_REPEAT = {100: 200, 10_000: 20, 1_000_000: 3}
+_WORDS = ("the quick brown fox jumps over the lazy dog thus spoke Zarathustra shush chaos philosophy queen question "
+          "Sister mission thirty three 42 you are your soul shall not pass through ashes and smoke whisper the night "
+          "I am Phone Church chthonic thou art").split()
+
+def corpus(n:int, seed:int=7) -> str:
+    """Deterministic pseudo-English text of exactly ``n`` characters (words, commas, full stops, newlines)."""
+    rnd = random.Random(seed); out = []; size = 0
+    while size < n:
+        w = rnd.choice(_WORDS); sep = rnd.choice([" "]*8 + [", ", ". ", "\n"])
+        out.append(w + sep); size += len(w) + len(sep)
+    return "".join(out)[:n]
+
+def _seeded(fn):
+    def call(*a):
+        random.seed(0)
+        return fn(*a)
+    return call
+
+# name -> (encode(text, level) -> str, decode(text) -> str, levels)
+VARIANTS = {
+    "persona":    (lambda t, i: persona.PersonaTranslator(0).stylize_sentence(t, "Mephisto", i),
+                   persona.de_demonify_sentence, (1, 2, 3)),
+    "angelic":    (lambda t, c: angelic.AngelicTranslator(0).stylize_sentence_corruption(t, "Mephisto", c)[0],
+                   angelic.de_demonify_sentence, BANDS),
+    "simple":     (_seeded(lambda t, c: simple.stylize_sentence_corruption(t, c)[0]),
+                   simple.reverse_translate, BANDS),
+    "simple-det": (lambda t, c: simple.stylize_deterministic(t, c)[0], simple.reverse_translate, BANDS),
+    "ornate":     (lambda t, c: ornate.stylize_sentence_corruption(t, c)[0], ornate.reverse_translate, BANDS),
+    "continuous": (lambda t, c: continuous.stylize_sentence(t, c)[0], continuous.decode_to_english, BANDS),
+    "continuous-counter": (lambda t, c: continuous.stylize_sentence(t, c, counter=True)[0],
+                           continuous.decode_to_english, BANDS),
+    "continuous-fonts": (lambda t, c: continuous.stylize_sentence_corruption(t, c)[0],
+                         continuous.decode_to_english, BANDS),
+}
+
+def _pct(sorted_vals, q):
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))]
+
+def _measure(fn, args, chars, repeat, memory):
+    lat = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); fn(*args); lat.append(time.perf_counter() - t0)
+    lat.sort()
+    row = {"chars": chars, "calls": repeat, "chars_per_s": chars * repeat / sum(lat),
+           "p50_ms": _pct(lat, 0.50) * 1e3, "p99_ms": _pct(lat, 0.99) * 1e3}
+    if memory:
+        tracemalloc.start()
+        fn(*args)
+        row["peak_kb"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return row
+
+def run(sizes=tuple(SIZES.values()), variants=tuple(VARIANTS), memory=True, repeat=None, log=None):
+    results = []
+    for size in sizes:
+        text = corpus(size)
+        n = repeat or _REPEAT.get(size, max(3, 2_000_000 // max(size, 1)))
+        for name in variants:
+            encode, decode, levels = VARIANTS[name]
+            for level in levels:
+                enc = _measure(encode, (text, level), size, n, memory)
+                styled = encode(text, level)
+                dec = _measure(decode, (styled,), len(styled), n, memory)
+                for op, row in (("encode", enc), ("decode", dec)):
+                    row.update(variant=name, op=op, size=size, level=level)
+                    results.append(row)
+                    if log: log(row)
+    return results
+
+def parallel(size:int, workers=(1, 2, 4), level:int=85, repeat:int=3, log=None):
+    """Counter-mode document encode at each worker count: chars/s (best of ``repeat``) and speedup over the first."""
+    from .batch import stylize_document
+
+    text, rows, ref = corpus(size), [], None
+    for w in workers:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter(); out = stylize_document(text, level, workers=w); best = min(best, time.perf_counter() - t0)
+        if ref is None: ref, base = out, best
+        if out != ref: raise AssertionError(f"workers={w}: output differs from workers={workers[0]}")
+        row = {"variant": "continuous-counter", "op": "encode-parallel", "size": size, "level": level, "workers": w,
+               "chars_per_s": size / best, "speedup": base / best}
+        rows.append(row)
+        if log: log(row)
+    return rows
+
+def sweep(sizes=tuple(SIZES.values()), repeat:int=3, log=None):
+    """All 100 levels per size: one :func:`~infernal.continuous.sweep` against a per-level loop (best of ``repeat``)."""
+    rows = []
+    for size in sizes:
+        text, best = corpus(size), [float("inf")] * 2
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            ref = [continuous.stylize_sentence_corruption(text, c) for c in range(1, 101)]
+            t1 = time.perf_counter()
+            out = [tuple(r) for _, *r in continuous.sweep(text, fonts=True)]
+            t2 = time.perf_counter()
+            best = [min(best[0], t1 - t0), min(best[1], t2 - t1)]
+        if out != ref: raise AssertionError(f"size={size}: sweep differs from the per-level calls")
+        row = {"variant": "continuous-fonts", "op": "sweep", "size": size, "levels": 100, "per_level_s": best[0],
+               "sweep_s": best[1], "speedup": best[0] / best[1]}
+        rows.append(row)
+        if log: log(row)
+    return rows
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def _key(r):
+    return r["variant"], r["op"], r["size"], r["level"]
+
+def _fmt(r):
+    mem = f" {r['peak_kb']:9.0f} KB" if "peak_kb" in r else ""
+    return (f"{r['variant']:17s} {r['op']:6s} {r['size']:>8d} L{r['level']:<3d} {r['chars_per_s']/1e6:7.2f} Mc/s"
+            f"  p50 {r['p50_ms']:9.3f} ms  p99 {r['p99_ms']:9.3f} ms{mem}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m infernal.bench", description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="100,10k,1m", help="comma list of 100 / 10k / 1m or a char count")
+    ap.add_argument("--variants", default=",".join(VARIANTS), help="comma list of " + ", ".join(VARIANTS))
+    ap.add_argument("--repeat", type=int, default=None, help="calls per cell (default depends on size)")
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory call")
+    ap.add_argument("-o", "--output", default=None, help="JSON path (default bench-<commit>.json)")
+    ap.add_argument("--compare", default=None, help="earlier JSON to compare chars/s against")
+    ap.add_argument("--parallel", default=None, help="comma list of worker counts for the document encoder")
+    ap.add_argument("--sweep", action="store_true", help="time a 100-level sweep against per-level calls")
+    args = ap.parse_args(argv)
+
+    sizes = [SIZES.get(s.lower(), None) or int(s) for s in args.sizes.split(",")]
+    variants = args.variants.split(",")
+    for v in variants:
+        if v not in VARIANTS: ap.error(f"unknown variant {v!r}")
+    commit = _commit()
+    results = run(sizes, variants, memory=not args.no_memory, repeat=args.repeat, log=lambda r: print(_fmt(r)))
+    doc = {"commit": commit, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+           "platform": platform.platform(), "results": results}
+    if args.parallel:
+        doc["cpus"] = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+        doc["parallel"] = parallel(max(sizes), [int(w) for w in args.parallel.split(",")], log=lambda r: print(
+            f"{r['variant']:17s} parallel {r['size']:>8d} x{r['workers']:<3d} {r['chars_per_s']/1e6:7.2f} Mc/s"
+            f"  speedup {r['speedup']:5.2f} ({doc['cpus']} cpus)"))
+    if args.sweep:
+        doc["sweep"] = sweep(sizes, log=lambda r: print(
+            f"{r['variant']:17s} sweep    {r['size']:>8d} x{r['levels']:<3d} {r['sweep_s']*1e3:9.1f} ms"
+            f"  per-level {r['per_level_s']*1e3:9.1f} ms  speedup {r['speedup']:5.2f}"))
+    out = args.output or f"bench-{commit or 'local'}.json"
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=1)
+    print(f"wrote {out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = {_key(r): r for r in json.load(f)["results"]}
+        print(f"speed vs {args.compare} (new / old chars/s):")
+        for r in results:
+            o = old.get(_key(r))
+            if o:
+                ratio = r["chars_per_s"] / o["chars_per_s"]
+                flag = "  <-- slower" if ratio < 0.9 else ""
+                print(f"{r['variant']:17s} {r['op']:6s} {r['size']:>8d} L{r['level']:<3d} x{ratio:5.2f}{flag}")
+
+if __name__ == "__main__":
+    main()
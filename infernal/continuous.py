@@ -0,0 +1,355 @@
+"""Deterministic translator whose style probabilities move on every slider tick (continuous profiles)."""
+import random, re, unicodedata
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+from .text import mark_insert, unmark_all, _rng
+from .profiles import lerp, angel_profile, demon_profile, neutral_profile, LEVELS  # profiles re-exported
+from .glyphs import (V_ANGEL, DGR_ANGEL, AFFX_ANGEL_PRE, AFFX_ANGEL_SUF, OATHS_ANGEL,
+                     V_DEMON, DGR_DEMON, AFFX_DEMON_PRE, AFFX_DEMON_SUF, OATHS_DEMON,
+                     ARCHAIC_MAP, LATINISMS)
+from .engine import (Stylizer, Keyed, CoupledSide, compile_digraphs, chain_digraphs, insert_oath_affixes,
+                     draw_oath_affixes, style_keyed, S_DG, D_DG2, _ALNUM_TOKEN, _first_alnum, _last_alnum)
+from .decoder import Folder, squeeze
+
+# ========= archaic + latinisms =========
+def apply_archaic_pronouns(s:str)->str:
+    for k in sorted(ARCHAIC_MAP, key=len, reverse=True):
+        s = s.replace(k, ARCHAIC_MAP[k]).replace(k.capitalize(), ARCHAIC_MAP[k].capitalize())
+    return s
+
+def sprinkle_latinisms(s:str, rng:random.Random, rate:float)->str:
+    tokens = s.split()
+    out=[]
+    for t in tokens:
+        out.append(t)
+        if rng.random() < rate and t[-1].isalnum():
+            out.append(mark_insert("⟨"+rng.choice(LATINISMS)+"⟩"))
+    return " ".join(out)
+
+# ========= compiled stylizers =========
+_ANGEL = Stylizer(V_ANGEL)
+_DEMON_SOFT = Stylizer(V_DEMON)  # neutral band: demon vowels only
+_DEMON = Stylizer(V_DEMON, ornaments="draw", glitch="alpha")
+_DEMON_DRAW_ALL = Stylizer(V_DEMON, ornaments="draw", glitch="alpha-draw-all")  # fonts app drew the glitch roll for digits too
+_DGR_ANGEL = compile_digraphs(DGR_ANGEL)
+_DGR_DEMON = compile_digraphs(DGR_DEMON)
+_DGR_BOTH = chain_digraphs(_DGR_ANGEL, _DGR_DEMON)
+_DGR_NEUTRAL = {(False, False): None, (True, False): _DGR_ANGEL, (False, True): _DGR_DEMON, (True, True): _DGR_BOTH}
+
+# ========= sentence stylizer =========
+def _stylize(sentence, corruption, rng, archaic=False, latinisms=False, glitch_override=False, _draw_nonalpha=False):
+    s = sentence
+
+    # Optional global flavor pre-pass
+    if corruption<=39 and archaic:
+        s = apply_archaic_pronouns(s.lower())
+
+    L = LEVELS[corruption]
+    if corruption<=39:  # Angelic
+        if latinisms:  # harmless on angel side too if desired
+            s = sprinkle_latinisms(s, rng, 0.10)
+        s = insert_oath_affixes(s, rng, L.p_oath, OATHS_ANGEL, L.p_pref, AFFX_ANGEL_PRE, L.p_suf, AFFX_ANGEL_SUF)
+        dg = _DGR_ANGEL if rng.random()<L.p_dg else None
+        return _ANGEL.style(s, rng, L.p_vowel, digraphs=dg), L.band, L.intensity
+
+    if corruption<=54:  # Neutral blend
+        dg_ang = rng.random()<L.p_dg_ang
+        dg_dem = rng.random()<L.p_dg_dem
+        # each token flips between angel/demon vowels
+        out = _ANGEL.style_split(s, rng, _DEMON_SOFT, L.p_vowel_ang, L.p_vowel_dem,
+                                 digraphs=_DGR_NEUTRAL[dg_ang, dg_dem])
+        return out, L.band, 0
+
+    # Demonic
+    if latinisms: s = sprinkle_latinisms(s, rng, 0.16 + 0.04*L.intensity)
+    s = insert_oath_affixes(s, rng, L.p_oath, OATHS_DEMON, L.p_pref, AFFX_DEMON_PRE, L.p_suf, AFFX_DEMON_SUF)
+    dg = _DGR_DEMON if rng.random()<L.p_dg else None
+    p_glitch = (L.p_glitch if not glitch_override else max(L.p_glitch, 0.15))
+    stylizer = _DEMON_DRAW_ALL if _draw_nonalpha else _DEMON
+    out = stylizer.style(s, rng, L.p_vowel, digraphs=dg, p_orn=L.p_orn, p_glitch=p_glitch, intensity=L.intensity)
+    return out, L.band, L.intensity
+
+# ========= counter mode =========
+@lru_cache(maxsize=None)
+def _side(angel, glitch_override):
+    # coupled-mode thresholds per side, levels ordered from neutral outward
+    levels = tuple(range(39, 0, -1)) if angel else tuple(range(55, 101))
+    rows = [LEVELS[c] for c in levels]
+    col = lambda f: tuple(f(L) * 65536 for L in rows)
+    p_glitch = lambda L: max(L.p_glitch, 0.15) if glitch_override else L.p_glitch
+    if angel:
+        params = tuple(dict(p_vowel=L.p_vowel) for L in rows)
+    else:
+        params = tuple(dict(p_vowel=L.p_vowel, p_orn=L.p_orn, p_glitch=p_glitch(L), intensity=L.intensity) for L in rows)
+    return CoupledSide(levels, _DGR_ANGEL if angel else _DGR_DEMON, col(lambda L: L.p_dg),
+                       ((0,) * len(levels), col(lambda L: L.p_vowel), (0,) * len(levels),
+                        col(lambda L: 0.0 if angel else L.p_orn)),
+                       col(lambda L: 0.0 if angel else p_glitch(L)), tuple(L.intensity for L in rows), params)
+
+def _stylize_keyed(s, corruption, key, offset, bol, eol, latinisms=False, glitch_override=False, memo=None):
+    L = LEVELS[corruption]
+    at, u = key.at, key.u
+    if memo is not None and not 40 <= corruption <= 54:  # coupled text: words re-render only where a draw flips
+        side = _side(corruption<=39, bool(glitch_override))
+        idx, stylizer = side.levels.index(corruption), (_ANGEL if corruption<=39 else _DEMON)
+        style = lambda t, p, lane: stylizer.style_coupled(t, key, p, side, idx, memo, lane=lane)
+    if corruption<=39:  # Angelic
+        dg_at = lambda p: _DGR_ANGEL if at(p, S_DG) < L.p_dg else None
+        if memo is None:
+            style = lambda t, p, lane: _ANGEL.style_keyed(t, key, p, L.p_vowel, lane=lane, digraphs_at=dg_at)
+        return style_keyed(s, key, style, offset=offset, bol=bol, eol=eol, p_oath=L.p_oath, oaths=OATHS_ANGEL,
+                           p_pref=L.p_pref, pre_pool=AFFX_ANGEL_PRE, p_suf=L.p_suf, suf_pool=AFFX_ANGEL_SUF,
+                           p_latin=0.10 if latinisms else 0.0, latin_pool=LATINISMS)
+
+    if corruption<=54:  # Neutral blend
+        dg_at = lambda p: _DGR_NEUTRAL[at(p, S_DG) < L.p_dg_ang, u(p, D_DG2) < L.p_dg_dem]
+        return _ANGEL.style_split_keyed(s, key, offset, _DEMON_SOFT, L.p_vowel_ang, L.p_vowel_dem, digraphs_at=dg_at)
+
+    # Demonic
+    dg_at = lambda p: _DGR_DEMON if at(p, S_DG) < L.p_dg else None
+    p_glitch = (L.p_glitch if not glitch_override else max(L.p_glitch, 0.15))
+    if memo is None:
+        style = lambda t, p, lane: _DEMON.style_keyed(t, key, p, L.p_vowel, lane=lane, digraphs_at=dg_at,
+                                                      p_orn=L.p_orn, p_glitch=p_glitch, intensity=L.intensity)
+    return style_keyed(s, key, style, offset=offset, bol=bol, eol=eol, p_oath=L.p_oath, oaths=OATHS_DEMON,
+                       p_pref=L.p_pref, pre_pool=AFFX_DEMON_PRE, p_suf=L.p_suf, suf_pool=AFFX_DEMON_SUF,
+                       p_latin=0.16 + 0.04*L.intensity if latinisms else 0.0, latin_pool=LATINISMS)
+
+@lru_cache(maxsize=32)
+def _key(corruption, seed):
+    # held across calls so a key's draw tables are hashed once; corruption None is the coupled key of every level
+    return Keyed("continuous", corruption, seed, keep=1024)
+
+def counter_prepass(text:str, corruption:int, *, archaic=False) -> str:
+    """The whole-document pre-pass of counter mode (archaic pronouns on the angel side); it draws nothing, so a
+    document is prepared once and then cut into slices for :func:`stylize_slice`."""
+    corruption = max(1, min(100, int(corruption)))
+    return apply_archaic_pronouns(text.lower()) if corruption<=39 and archaic else text
+
+def stylize_slice(text:str, corruption:int, *, offset:int=0, bol=True, eol=True, latinisms=False,
+                  glitch_override=False, seed:str|None=None, coupled=False) -> str:
+    """
+    Counter-mode styling of ``text``, the slice of a prepared document (:func:`counter_prepass`) starting at character
+    ``offset``; ``bol`` / ``eol``: the slice starts / ends a line of that document. Every decision is a hash of
+    (version, seed, corruption, position, decision kind), so slices cut by :func:`~infernal.engine.keyed_slices` style
+    independently, in any order or process, and join into exactly the whole document's output.
+
+    coupled: leave the corruption out of the hash. Every level then compares the same per-character draws against its
+    own probabilities, and those only grow moving away from neutral: on either side, a character (or line, or token)
+    changed at one level is changed at every stronger level of that side, which only adds changes (a changed
+    character may take a stronger form: a digraph, a heavier Zalgo stack).
+    """
+    corruption = max(1, min(100, int(corruption)))
+    return _stylize_keyed(text, corruption, _key(None if coupled else corruption, seed), offset, bol, eol,
+                          latinisms=latinisms, glitch_override=glitch_override)
+
+class CoupledText:
+    """One text in coupled mode, ready for any level: ``at(c)`` equals ``stylize_sentence(text, c, coupled=True,
+    ...)``. The draws are shared by every level, so each word is rendered once per run of levels over which none of
+    its draws crosses a threshold and reused after that; a slider tick re-renders only the words that change."""
+    def __init__(self, text:str, *, archaic=False, latinisms=False, glitch_override=False, seed:str|None=None):
+        self.text, self.archaic, self.latinisms, self.glitch_override = text, archaic, latinisms, glitch_override
+        self._key = _key(None, seed)
+        self._sides = {}  # angel? -> (pre-passed text, word memo)
+
+    def at(self, corruption:int):
+        """Returns stylized_text, css_band, intensity step, as :func:`stylize_sentence`."""
+        c = max(1, min(100, int(corruption)))
+        angel = c<=39
+        side = self._sides.get(angel)
+        if side is None:
+            side = self._sides[angel] = (counter_prepass(self.text, c, archaic=self.archaic), {})
+        L = LEVELS[c]
+        return _stylize_keyed(side[0], c, self._key, 0, True, True, latinisms=self.latinisms,
+                              glitch_override=self.glitch_override, memo=side[1]), L.band, L.intensity
+
+    def levels(self, levels=range(1, 101)):
+        """Yield ``(level, stylized, band, intensity)`` for each level."""
+        for c in levels:
+            yield (c, *self.at(c))
+
+@lru_cache(maxsize=64)
+def _coupled_text(text, archaic, latinisms, glitch_override, seed):
+    return CoupledText(text, archaic=archaic, latinisms=latinisms, glitch_override=glitch_override, seed=seed)
+
+def coupled_levels(text:str, levels=range(1, 101), **opts):
+    """``CoupledText(text, **opts).levels(levels)``: every level of a text in coupled mode from one set of draws."""
+    return CoupledText(text, **opts).levels(levels)
+
+def stylize_sentence(sentence:str, corruption:int, *, archaic=False, latinisms=False, glitch_override=False,
+                     seed:str|None=None, counter=False, coupled=False):
+    """
+    corruption: 1..100 (1=angelic, 100=demonic). Deterministic per (sentence, corruption, options, seed).
+    counter: opt-in counter mode (:func:`stylize_slice`, pinned by ``engine.COUNTER_VERSION``): position-keyed draws
+    instead of one sequential stream seeded from the text. coupled: counter mode with the same draws at every level,
+    so moving the slider away from neutral only adds changes (implies counter).
+    Returns stylized_text, css_band ('band1'..'band10'), intensity step (0..3)
+    """
+    corruption=max(1, min(100, int(corruption)))
+    if coupled:  # slider moves on a recent text re-use its rendered words
+        return _coupled_text(sentence, archaic, latinisms, glitch_override, seed).at(corruption)
+    if counter:
+        L = LEVELS[corruption]
+        out = stylize_slice(counter_prepass(sentence, corruption, archaic=archaic), corruption, latinisms=latinisms,
+                            glitch_override=glitch_override, seed=seed, coupled=coupled)
+        return out, L.band, L.intensity
+    return _stylize(sentence, corruption, _rng(corruption, sentence, seed),
+                    archaic=archaic, latinisms=latinisms, glitch_override=glitch_override)
+
+def stylize_sentence_corruption(sentence:str, corruption:int):
+    """Option-less form of :func:`stylize_sentence` as shipped by the continuous-fonts app."""
+    corruption = max(1, min(100, int(corruption)))
+    return _stylize(sentence, corruption, _rng(corruption, sentence), _draw_nonalpha=True)
+
+# ========= sweeps =========
+class _SweepSide:
+    # one side's pre-passed text, planned once: whitespace-split tokens (latinisms), alnum spans (affixes) and a
+    # compiled program per digraph table; a level splices its inserts in as separate parts instead of re-tokenizing
+    def __init__(self, s, latinisms):
+        if latinisms:  # sprinkle_latinisms re-joins the tokens on single spaces
+            toks = s.split()
+            s = " ".join(toks)
+            ends, at = [], -1
+            for t in toks:
+                at += 1 + len(t); ends.append((at, t[-1].isalnum()))
+            self.tokens = ends
+        self.s = s
+        spans = [m.span() for m in _ALNUM_TOKEN.finditer(s)]
+        self.starts, self.ends = [a for a, _ in spans], [b for _, b in spans]
+        self._progs = {}
+
+    def prog(self, stylizer, digraphs, s=None):
+        # the side's text, or an insert (drawn from small pools, so each is compiled once too)
+        p = self._progs.get((stylizer, digraphs, s))
+        if p is None:
+            p = self._progs[stylizer, digraphs, s] = stylizer.compile(self.s if s is None else s, digraphs)
+        return p
+
+    def parts(self, rng, rate):
+        # sprinkle_latinisms' draws; the text as base ranges (a, b) and insert strings
+        parts, prev = [], 0
+        for at, alnum in self.tokens:
+            if rng.random() < rate and alnum:
+                parts.append((prev, at)); parts.append(" " + mark_insert("⟨" + rng.choice(LATINISMS) + "⟩"))
+                prev = at
+        parts.append((prev, len(self.s)))
+        return parts
+
+    def first(self, parts):
+        for n, p in enumerate(parts):
+            if p.__class__ is str:
+                span = _first_alnum(p)
+                if span: return n, *span
+                continue
+            k = bisect_left(self.starts, p[0])
+            if k < len(self.starts) and self.ends[k] <= p[1]:
+                return n, self.starts[k], self.ends[k]
+
+    def last(self, parts):
+        for n in range(len(parts) - 1, -1, -1):
+            p = parts[n]
+            if p.__class__ is str:
+                span = _last_alnum(p)
+                if span: return n, *span
+                continue
+            k = bisect_right(self.ends, p[1]) - 1
+            if k >= 0 and self.starts[k] >= p[0]:
+                return n, self.starts[k], self.ends[k]
+
+    def inserts(self, parts, rng, p_oath, oaths, p_pref, pre_pool, p_suf, suf_pool):
+        # insert_oath_affixes over the parts (same draws, same splice)
+        oath, at_front, pre, first, suf, last = draw_oath_affixes(
+            rng, bool(self.s), lambda: self.first(parts), lambda: self.last(parts), p_oath, oaths, p_pref, pre_pool,
+            p_suf, suf_pool)
+        points = [(last[0], last[2], suf)] if suf else []
+        if pre: points.append((first[0], first[1], pre))  # the suffix is later in the text: splice it first
+        for n, at, text in points:
+            p = parts[n]
+            parts[n:n+1] = [p[:at] + text + p[at:]] if p.__class__ is str else [(p[0], at), text, (at, p[1])]
+        if oath is not None:
+            parts.insert(0, oath) if at_front else parts.append(oath)
+        return parts
+
+    def style(self, parts, stylizer, rng, p_vowel, digraphs, **kw):
+        prog = self.prog(stylizer, digraphs)
+        return stylizer.style_compiled([(self.prog(stylizer, digraphs, p), 0, None) if p.__class__ is str else
+                                        (prog, *p) for p in parts], rng, p_vowel, **kw)
+
+def sweep(text:str, levels=range(1, 101), *, archaic=False, latinisms=False, glitch_override=False,
+          seed:str|None=None, counter=False, coupled=False, fonts=False):
+    """
+    Yield ``(level, stylized, band, intensity)`` for each of ``levels``, lazily, each equal to
+    ``stylize_sentence(text, level, ...)`` (``fonts=True``: :func:`stylize_sentence_corruption`'s draws, equal to it
+    when no other option is set). The text is tokenized and planned once per side; a level only replays its draws.
+    ``batch.sweep`` spreads the levels over a process pool.
+    """
+    if coupled:
+        yield from CoupledText(text, archaic=archaic, latinisms=latinisms, glitch_override=glitch_override,
+                               seed=seed).levels(levels)
+        return
+    if fonts and counter:
+        raise ValueError("counter mode has no fonts variant")
+    sides, splits = {}, {}
+    for level in levels:
+        c = max(1, min(100, int(level)))
+        L = LEVELS[c]
+        if counter:
+            key = c<=39
+            if key not in sides: sides[key] = counter_prepass(text, c, archaic=archaic)
+            yield level, stylize_slice(sides[key], c, latinisms=latinisms, glitch_override=glitch_override,
+                                       seed=seed), L.band, L.intensity
+            continue
+        rng = _rng(c, text, seed)
+        if 40 <= c <= 54:  # neutral: the split pass over the text as given
+            dg = _DGR_NEUTRAL[rng.random()<L.p_dg_ang, rng.random()<L.p_dg_dem]
+            ops = splits.get(dg)
+            if ops is None:
+                ops = splits[dg] = _ANGEL.compile_split(text, _DEMON_SOFT, dg)
+            yield level, _ANGEL.style_split_compiled(ops, rng, L.p_vowel_ang, L.p_vowel_dem), L.band, 0
+            continue
+        angel = c<=39
+        side = sides.get(angel)
+        if side is None:
+            side = sides[angel] = _SweepSide(apply_archaic_pronouns(text.lower()) if angel and archaic else text,
+                                             latinisms)
+        if angel:
+            parts = side.parts(rng, 0.10) if latinisms else [(0, len(side.s))]
+            parts = side.inserts(parts, rng, L.p_oath, OATHS_ANGEL, L.p_pref, AFFX_ANGEL_PRE, L.p_suf, AFFX_ANGEL_SUF)
+            dg = _DGR_ANGEL if rng.random()<L.p_dg else None
+            yield level, side.style(parts, _ANGEL, rng, L.p_vowel, dg), L.band, L.intensity
+            continue
+        parts = side.parts(rng, 0.16 + 0.04*L.intensity) if latinisms else [(0, len(side.s))]
+        parts = side.inserts(parts, rng, L.p_oath, OATHS_DEMON, L.p_pref, AFFX_DEMON_PRE, L.p_suf, AFFX_DEMON_SUF)
+        dg = _DGR_DEMON if rng.random()<L.p_dg else None
+        p_glitch = (L.p_glitch if not glitch_override else max(L.p_glitch, 0.15))
+        out = side.style(parts, _DEMON_DRAW_ALL if fonts else _DEMON, rng, L.p_vowel, dg, p_orn=L.p_orn,
+                         p_glitch=p_glitch, intensity=L.intensity)
+        yield level, out, L.band, L.intensity
+
+# ========= decoder =========
+_BACK_MAP = {
+    "thou art":"you are", "thou shalt":"you will", "shalt not":"shall not",
+    "thy":"your", "thine":"yours", "thou":"you", "art":"are"
+}
+_BACK_ORDER = sorted(_BACK_MAP.items(), key=lambda x:len(x[0]), reverse=True)
+_FOLD = Folder([
+    # undo digraphs
+    ('ðe','the'), ('Ðe','The'), ('þ','th'), ('Þ','Th'), ('ʃ','sh'),
+    ('Χ','Ch'), ('χ','ch'), ('ƒ','ph'), ('Ƒ','Ph'), ('q͟u','qu'), ('Q͟u','Qu'),
+    ('θ','th'), ('Θ','Th'), ('š','sh'), ('Š','Sh'), ('φ','ph'), ('Φ','Ph'),
+    # strip ornaments / apostrophes
+    ('ſ','s'),('†','t'),('ʰ','h'),('ñ','n'),('ŕ','r'),("’","'"),
+], ("âêîôûŷāēīōūȳ", "aeiouyaeiouy"))
+_OATH = re.compile(r"⟨[^⟩]+⟩")
+
+def decode_to_english(text:str, *, decode_archaic=False, strip_latinisms=True)->str:
+    # remove markers, fold font-like codepoints, then glyphs / ornaments / combining marks / accents in one fold
+    s = _FOLD(unicodedata.normalize('NFKC', unmark_all(text)))
+    # drop ⟨oaths⟩
+    if strip_latinisms:
+        s = _OATH.sub("", s)
+    if decode_archaic:
+        for k,v in _BACK_ORDER:
+            s = s.replace(k, v).replace(k.capitalize(), v.capitalize())
+    return squeeze(s)
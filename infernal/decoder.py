@@ -0,0 +1,67 @@
+"""Decoder tables compiled once at import.
+
+The per-call decoders rebuilt their ``back`` lists and ``str.maketrans`` tables, ran one ``str.replace`` per glyph and
+filtered combining marks with a ``unicodedata.category`` call per character. Here the multi-codepoint glyphs (``ðe``,
+``q͟u``) become one regex alternation, every single-codepoint fold goes into one ``str.translate`` table and the
+combining marks are removed by a translate table built once from ``unicodedata``.
+"""
+import re, unicodedata
+from functools import lru_cache
+
+from .engine import compile_digraphs, _ALNUM_TOKEN
+
+_WORD_CACHE_MAX = 65536
+_OATH_TOKEN = r"(?<![^\w\s])⟨[^\w\s]*⟩(?![^\w\s])"  # a TOK_RE punctuation token of the form ⟨…⟩
+_ALNUM_OR_OATH = re.compile(f"({_ALNUM_TOKEN.pattern})|{_OATH_TOKEN}")
+_WS = re.compile(r"\s{2,}")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]+")
+
+# ---------- combining marks ----------
+@lru_cache(maxsize=None)
+def _mark_table():
+    # built on first decode: category Mn only occurs in planes 0, 1 and 14
+    return {cp: None for cp in (*range(0x20000), *range(0xE0000, 0xE1000)) if unicodedata.category(chr(cp)) == 'Mn'}
+
+def strip_marks(s):
+    """Same as ``''.join(c for c in NFD(s) if category(c) != 'Mn')``."""
+    if s.isascii():
+        return s
+    return unicodedata.normalize('NFD', s).translate(_mark_table())
+
+# ---------- glyph folds ----------
+class Folder:
+    """``for a,b in pairs: s = s.replace(a,b)``, then ``strip_marks``, then ``accents`` (a translate spec).
+
+    The multi-codepoint pairs run as one regex alternation over the text. Every other fold only touches non-ASCII
+    codepoints and ASCII characters are NFD starters, so the rest is applied per run of non-ASCII characters and cached
+    by run. Valid when no replacement introduces a source glyph, which holds for every decoder table here (all outputs
+    are ASCII letters). The accent folds run before the mark filter; the accented vowels decompose to their base letter
+    under NFD anyway, so the result is the same.
+    """
+    def __init__(self, pairs, accents=("", "")):
+        multi = [(a, b) for a, b in pairs if len(a) > 1]
+        single = {a: b for a, b in pairs if len(a) == 1}
+        single.update(zip(*accents))
+        assert all(not a.isascii() for a in single)
+        self._multi = compile_digraphs(multi) if multi else None
+        self._table = str.maketrans(single)
+        run = lru_cache(maxsize=_WORD_CACHE_MAX)(self._fold_run)
+        self._sub = lambda m: run(m.group())
+        self.word = lru_cache(maxsize=_WORD_CACHE_MAX)(self.__call__)
+
+    def _fold_run(self, run):
+        return strip_marks(run.translate(self._table))
+
+    def __call__(self, s):
+        if self._multi: s = self._multi(s)
+        return _NON_ASCII.sub(self._sub, s)
+
+# ---------- token walk ----------
+def map_tokens(s, word, drop_oaths=False):
+    """Apply ``word`` to each alnum TOK_RE token (optionally dropping ``⟨…⟩`` tokens) without tokenizing the text."""
+    if drop_oaths:
+        return _ALNUM_OR_OATH.sub(lambda m: word(m.group(1)) if m.group(1) else "", s)
+    return _ALNUM_TOKEN.sub(lambda m: word(m.group()), s)
+
+def squeeze(s):
+    return _WS.sub(" ", s).strip()
@@ -0,0 +1,636 @@
+"""Compiled single-pass stylizer.
+
+The token-list code joined the tokens, ran every digraph ``str.replace`` over the whole text, re-tokenized and then
+walked each word character by character. Here the digraph table becomes one regex alternation, the vowel / ornament /
+Zalgo rules become a per-word plan that is compiled once and cached, and the text is styled in one left-to-right
+scan. The RNG is drawn in exactly the same order as before, so output is identical for the same seed.
+
+Counter mode (:class:`Keyed`, :meth:`Stylizer.style_keyed`, :func:`style_keyed`) replaces that one sequential stream
+with draws keyed on (seed, corruption, character position, decision kind), so any slice of a document styles on its
+own — in any order, on any core — exactly as it does inside the whole. Its output is pinned by ``COUNTER_VERSION``.
+"""
+import hashlib, re, sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+from .text import TOK_RE, mark_insert
+from .glyphs import CONS_ORN, ZALGO_L, ZALGO_H
+
+WORD_RE = re.compile(r"\w+")
+_ALNUM_TOKEN = re.compile(r"(?<!\w)[^\W_]+(?!\w)")  # a TOK_RE word token for which .isalnum() holds
+_PLAN_CACHE_MAX = 65536
+
+# ---------- digraphs ----------
+def compile_digraphs(pairs):
+    """One-pass equivalent of ``for a,b in pairs: s = s.replace(a,b)`` (longest source first).
+
+    Equivalent because no digraph source overlaps another's tail and no replacement contains a source."""
+    table = dict(pairs)
+    if not table:
+        return lambda s: s
+    rx = re.compile("|".join(re.escape(a) for a in sorted(table, key=len, reverse=True)))
+    sub = rx.sub
+    def apply(s):
+        return sub(lambda m: table[m.group()], s)
+    def index(s):
+        # apply(s) plus, per output char, the index of the source char it stands for: a replacement's last char
+        # keeps its own source when it is unchanged (ðe ← the, q͟u ← qu), every other char maps to the match start
+        out, src, prev = [], [], 0
+        for m in rx.finditer(s):
+            a, st = m.group(), m.start()
+            b = table[a]
+            out.append(s[prev:st]); src.extend(range(prev, st))
+            out.append(b); src.extend([st] * (len(b) - 1)); src.append(st + len(a) - 1 if b[-1] == a[-1] else st)
+            prev = m.end()
+        out.append(s[prev:]); src.extend(range(prev, len(s)))
+        return "".join(out), src
+    apply.index = index
+    return apply
+
+def chain_digraphs(first, then):
+    """``then(first(s))`` as one digraph callable (with the composed ``index``)."""
+    def apply(s):
+        return then(first(s))
+    def index(s):
+        w, i1 = first.index(s)
+        w, i2 = then.index(w)
+        return w, [i1[j] for j in i2]
+    apply.index = index
+    return apply
+
+# ---------- oath / affix inserts ----------
+def _first_alnum(s):
+    m = _ALNUM_TOKEN.search(s)
+    return m.span() if m else None
+
+def _last_alnum(s):
+    # token runs are symmetric, so the last token is the first one of the reversed text
+    m = _ALNUM_TOKEN.search(s[::-1])
+    return (len(s) - m.end(), len(s) - m.start()) if m else None
+
+def draw_oath_affixes(rng, has_toks, first, last, p_oath, oaths, p_pref=None, pre_pool=(), p_suf=None, suf_pool=()):
+    """The draws of :func:`insert_oath_affixes` without the splice: ``(oath, at_front, pre, first, suf, last)``.
+
+    ``first`` / ``last`` are called (at most once, only when needed) for the span of the first / last alnum token, in
+    any coordinates that compare equal for the same token."""
+    oath = at_front = None
+    if rng.random() < p_oath:
+        at_front = rng.random() < 0.5
+        oath = mark_insert(oaths if isinstance(oaths, str) else rng.choice(oaths))
+        has_toks = True
+    pre = suf = f = l = None
+    if p_pref is not None and has_toks and rng.random() < p_pref:
+        f = first()
+        if f:
+            pre = mark_insert(rng.choice(pre_pool))
+    if p_suf is not None and has_toks and rng.random() < p_suf:
+        l = last()
+        if l and not (pre and l == f):  # a prefixed token is no longer alnum
+            suf = mark_insert(rng.choice(suf_pool))
+    return oath, at_front, pre, f, suf, l
+
+def insert_oath_affixes(s, rng, p_oath, oaths, p_pref=None, pre_pool=(), p_suf=None, suf_pool=()):
+    """Oath at either end, then a prefix on the first and a suffix on the last alnum token.
+
+    Draws ``rng`` in the order the token-list code did (oath?, where, which; prefix?, which; suffix?, which)."""
+    oath, at_front, pre, first, suf, last = draw_oath_affixes(rng, bool(s), lambda: _first_alnum(s),
+                                                              lambda: _last_alnum(s), p_oath, oaths, p_pref,
+                                                              pre_pool, p_suf, suf_pool)
+    if pre or suf:
+        a = first[0] if pre else 0
+        b = last[1] if suf else a
+        b = max(a, b)
+        s = s[:a] + (pre or "") + s[a:b] + (suf or "") + s[b:]
+    if oath is not None:
+        s = oath + s if at_front else s + oath
+    return s
+
+# ---------- counter-based draws ----------
+COUNTER_VERSION = 2  # bump whenever a keyed draw or its position / kind changes (keyed output is pinned per version)
+_M64 = (1 << 64) - 1
+_INV53 = 1.0 / (1 << 53)
+
+_BLOCK, _SLOTS = 64, 4   # positions per draw table, table slots per position
+_INV16 = 1.0 / 65536
+
+class Keyed:
+    """Counter-based uniform draws, each a pure function of the key, an absolute character position and a decision
+    kind, so no decision depends on the draws made before it.
+
+    Per-character decisions (slots ``S_*``) read 16-bit uniforms from tables of ``_BLOCK`` positions, one
+    ``shake_128`` output each (``table(lane, block)``); the rarer ones (kinds ``D_*``) hash with splitmix64 (``u``).
+    """
+    __slots__ = ("key", "_prefix", "_tables", "_keep")
+
+    def __init__(self, *parts, keep:int=256):
+        self._prefix = repr((COUNTER_VERSION,) + parts).encode("utf-8")
+        self.key = int.from_bytes(hashlib.blake2b(self._prefix, digest_size=8).digest(), "little")
+        self._tables = {}
+        self._keep = keep  # tables held (``_BLOCK`` positions each); a long-lived key keeps its draws across calls
+
+    def table(self, lane, block):
+        t = self._tables.get((lane, block))
+        if t is None:
+            if len(self._tables) >= self._keep: self._tables.clear()
+            raw = hashlib.shake_128(self._prefix + b"|%d|%d" % (lane, block)).digest(2 * _BLOCK * _SLOTS)
+            t = array("H", raw)
+            if sys.byteorder == "big": t.byteswap()  # the draws are little-endian everywhere
+            self._tables[lane, block] = t
+        return t
+
+    def at(self, pos, slot, lane=0):
+        return self.table(lane, pos // _BLOCK)[pos % _BLOCK * _SLOTS + slot] * _INV16
+
+    def u(self, pos, kind):
+        x = (self.key + pos * 0x9E3779B97F4A7C15 + kind * 0xD1B54A32D192ED03) & _M64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _M64
+        return ((x ^ (x >> 31)) >> 11) * _INV53
+
+    def pick(self, pos, kind, pool):
+        return pool[int(self.u(pos, kind) * len(pool))]
+
+# table slots (per character) and hashed kinds; an insert styles in its own lane so it never reuses the text's draws
+S_STEP, S_GLITCH, S_SIDE, S_DG = range(_SLOTS)
+D_STACK, D_MARK, D_DG2 = 0, 1, 3  # D_MARK + j for the j-th mark of a stack; kinds of lane n are offset by 16 * n
+D_OATH_FRONT, D_OATH_BACK, D_PREF, D_SUF, D_LATIN = 4, 5, 6, 7, 8  # per line / token; the pool choice is kind + 32
+LANE_TEXT, LANE_OATH_FRONT, LANE_PREF, LANE_SUF, LANE_LATIN, LANE_OATH_BACK = range(6)
+_TOKEN_END = re.compile(r"\S+")
+
+def _keyed_line(line, key, base, style, at_start, at_end, p_oath, oaths, p_pref, pre_pool, p_suf, suf_pool,
+                p_latin, latin_pool):
+    u, pick = key.u, key.pick
+    body = line[:-1] if line.endswith("\r") else line
+    ins = []  # (position in line, order, lane, text)
+    if p_latin:
+        for m in _TOKEN_END.finditer(body):
+            e = m.end()
+            if m.group()[-1].isalnum() and u(base + e, D_LATIN) < p_latin:
+                ins.append((e, 2, LANE_LATIN, " " + mark_insert("⟨" + pick(base + e, D_LATIN + 32, latin_pool) + "⟩")))
+    first = _first_alnum(body)
+    if first:
+        pre = None
+        if at_start:
+            if p_oath and u(base, D_OATH_FRONT) < p_oath / 2:
+                ins.append((0, 0, LANE_OATH_FRONT, mark_insert(pick(base, D_OATH_FRONT + 32, oaths))))
+            if p_pref and u(base + first[0], D_PREF) < p_pref:
+                pre = mark_insert(pick(base + first[0], D_PREF + 32, pre_pool))
+                ins.append((first[0], 1, LANE_PREF, pre))
+        if at_end:
+            last = _last_alnum(body)
+            if p_suf and u(base + last[1], D_SUF) < p_suf and not (pre and last == first):
+                ins.append((last[1], 1, LANE_SUF, mark_insert(pick(base + last[1], D_SUF + 32, suf_pool))))
+            if p_oath and u(base + len(body), D_OATH_BACK) < p_oath / 2:
+                ins.append((len(body), 3, LANE_OATH_BACK,
+                            mark_insert(pick(base + len(body), D_OATH_BACK + 32, oaths))))
+    if not ins:
+        return style(line, base, LANE_TEXT)
+    out, prev = [], 0
+    for at, _, lane, text in sorted(ins):
+        if at > prev: out.append(style(line[prev:at], base + prev, LANE_TEXT))
+        out.append(style(text, base + at, lane))
+        prev = at
+    out.append(style(line[prev:], base + prev, LANE_TEXT))
+    return "".join(out)
+
+def style_keyed(s, key, style, *, offset=0, bol=True, eol=True, p_oath=0.0, oaths=(), p_pref=0.0, pre_pool=(),
+                p_suf=0.0, suf_pool=(), p_latin=0.0, latin_pool=()):
+    """Counter-mode oath / affix / latinism inserts around ``style(text, pos, lane)``, line by line.
+
+    ``s`` is the slice of a document starting at ``offset``; ``bol`` / ``eol`` say whether it starts / ends a line of
+    that document. Each line with an alnum token may get an oath at either end (``p_oath / 2`` each), a prefix on its
+    first and a suffix on its last alnum token; any token ending in a letter or digit may be followed by a latinism.
+    Every decision is keyed on the position it applies at, so a document cut between two alnum tokens (or after a
+    newline) styles the same in pieces as whole."""
+    out = []
+    pos, n = 0, len(s)
+    while True:
+        nl = s.find("\n", pos)
+        end = n if nl < 0 else nl
+        out.append(_keyed_line(s[pos:end], key, offset + pos, style, bol or pos > 0, eol or nl >= 0,
+                               p_oath, oaths, p_pref, pre_pool, p_suf, suf_pool, p_latin, latin_pool))
+        if nl < 0: break
+        out.append("\n")
+        pos = nl + 1
+    return "".join(out)
+
+class CoupledSide(NamedTuple):
+    """One side of the slider for coupled mode, its levels ordered from neutral outward; every threshold column
+    (probability × 65536, compared with the 16-bit draws) is non-decreasing along that order."""
+    levels: tuple     # corruption at each index
+    digraphs: object  # digraph table a word uses when its S_DG draw passes
+    t_dg: tuple
+    t_step: tuple     # threshold column per step kind (none, vowel, medial s, ornament)
+    t_glitch: tuple
+    intensity: tuple
+    params: tuple     # per index: Stylizer.style_keyed keyword arguments
+
+    def breaks(self, draw, column):
+        """First index at which ``draw < column[index]`` holds (``len(levels)`` if never)."""
+        return bisect_right(column, draw)
+
+_CUT = re.compile(r"(?<!\w)[^\W_]+([^\S\n]+)(?=[^\W_]+(?!\w))")  # whitespace between two alnum tokens of a line
+
+def keyed_slices(s, target):
+    """``(start, end, bol, eol)`` cuts of ``s`` into slices of about ``target`` characters, each one safe for
+    :func:`style_keyed`: after a newline, or at the whitespace between two alnum tokens of a line."""
+    cuts, start, n = [], 0, len(s)
+    while n - start > target:
+        at = start + target
+        nl = s.rfind("\n", start, at)
+        if nl >= 0 and nl + 1 > start + target // 2:
+            cut = nl + 1
+        else:
+            cut = None
+            for m in _CUT.finditer(s, max(start, at - 4096), min(n, at + 4096)):
+                cut = m.start(1)
+                if cut >= at: break
+            if cut is None or cut <= start:
+                nl = s.find("\n", at)
+                cut = nl + 1 if nl >= 0 else n
+        cuts.append(cut)
+        start = cut
+    bounds = [0] + cuts + ([n] if not cuts or cuts[-1] != n else [])
+    return [(a, b, a == 0 or s[a-1] == "\n", b == n or s[b] == "\n") for a, b in zip(bounds, bounds[1:]) if b > a]
+
+class Compiled(NamedTuple):
+    """A text planned once by :meth:`Stylizer.compile`: word spans and the flat op list (strings and draw steps)."""
+    s: str
+    starts: list  # word start / end offsets in s
+    ends: list
+    first: list   # index in ops of each word's first op (its gap is the op before)
+    ops: list
+
+# ---------- per-word plans ----------
+# A plan is a tuple of pieces (the alnum tokens a word splits into after digraphs, e.g. q͟u) where each piece is either
+# a literal string or (head, steps); each step is (char, kind, replacement, glitch, tail) with kind 0 = no draw,
+# 1 = vowel, 2 = medial s, 3 = consonant ornament, and glitch 0 = none, 1 = may glitch, 2 = draws but never glitches.
+_K_VOWEL, _K_MEDIAL_S, _K_ORN = 1, 2, 3
+
+class Stylizer:
+    """Vowel / ornament / Zalgo pass compiled for one glyph set.
+
+    ornaments: None, "medial" (medial s checked before the draw; ſ/S by case) or "draw" (every s,t,h,n,r draws, only a
+    medial s is replaced). glitch: None, "any" (every char), "alpha" or "alpha-draw-all" (non-letters still draw).
+    """
+    def __init__(self, vowels, *, ornaments=None, glitch=None):
+        self.vowels = {}
+        for lc, pool in vowels.items():
+            self.vowels[lc] = pool[0]
+            self.vowels[lc.upper()] = pool[0].upper()
+        self.ornaments = ornaments
+        self.glitch = glitch
+        self._plans = {}
+
+    def _steps(self, word):
+        # (head, steps) for one alnum token
+        head, steps = [], []
+        n = len(word)
+        for i, c in enumerate(word):
+            lc = c.lower()
+            kind, rep = 0, None
+            if c in self.vowels:
+                kind, rep = _K_VOWEL, self.vowels[c]
+            elif self.ornaments == "medial" and lc == 's':
+                if 0 < i < n-1:
+                    kind, rep = _K_MEDIAL_S, ('ſ' if c.islower() else 'S')
+            elif self.ornaments == "medial" and lc in ('t','h','n','r'):
+                kind, rep = _K_ORN, CONS_ORN[lc]
+            elif self.ornaments == "draw" and lc in CONS_ORN:
+                kind, rep = _K_ORN, (CONS_ORN[lc] if lc != 's' or 0 < i < n-1 else None)
+            g = 0
+            if self.glitch == "any":
+                g = 1
+            elif self.glitch == "alpha":
+                g = 1 if c.isalpha() else 0
+            elif self.glitch == "alpha-draw-all":
+                g = 1 if c.isalpha() else 2
+            if not kind and not g:
+                if steps:
+                    steps[-1][4] += c
+                else:
+                    head.append(c)
+                continue
+            steps.append([c, kind, rep, g, ""])
+        return "".join(head), tuple(tuple(s) for s in steps)
+
+    def plan(self, word, digraphs=None):
+        key = (digraphs, word)
+        p = self._plans.get(key)
+        if p is None:
+            if len(self._plans) >= _PLAN_CACHE_MAX:
+                self._plans.clear()
+            w = digraphs(word) if digraphs else word
+            p = tuple(self._steps(t) if t.isalnum() else t for t in TOK_RE.findall(w))
+            self._plans[key] = p
+        return p
+
+    def plan_src(self, word, digraphs=None):
+        """:meth:`plan` whose steps carry a sixth field: the index in ``word`` (before digraphs) of their char."""
+        key = (digraphs, word, True)
+        p = self._plans.get(key)
+        if p is None:
+            if len(self._plans) >= _PLAN_CACHE_MAX:
+                self._plans.clear()
+            w, src = digraphs.index(word) if digraphs else (word, range(len(word)))
+            out, at = [], 0
+            for t in TOK_RE.findall(w):
+                if t.isalnum():
+                    head, steps = self._steps(t)
+                    j, marked = at + len(head), []
+                    for step in steps:
+                        marked.append(step + (src[j],))
+                        j += 1 + len(step[4])
+                    out.append((head, tuple(marked)))
+                else:
+                    out.append(t)
+                at += len(t)
+            p = self._plans[key] = tuple(out)
+        return p
+
+    def style(self, s, rng, p_vowel, *, digraphs=None, p_s=0.0, p_orn=0.0, p_glitch=0.0, intensity=1):
+        """Style every alnum word of ``s`` (after ``digraphs``), copying everything else through."""
+        return "".join(self.iter_style(s, rng, p_vowel, digraphs=digraphs, p_s=p_s, p_orn=p_orn,
+                                       p_glitch=p_glitch, intensity=intensity))
+
+    def iter_style(self, s, rng, p_vowel, *, digraphs=None, p_s=0.0, p_orn=0.0, p_glitch=0.0, intensity=1):
+        """:meth:`style` as a lazy stream of pieces: ``rng`` is only drawn as far as the output is consumed."""
+        rnd = rng.random
+        P = (0.0, p_vowel, p_s, p_orn)
+        marks = ZALGO_H if intensity == 3 else ZALGO_L
+        plan = self.plan
+        pos = 0
+        for m in WORD_RE.finditer(s):
+            st, en = m.span()
+            if st > pos: yield s[pos:st]
+            pos = en
+            for piece in plan(m.group(), digraphs):
+                if piece.__class__ is str:
+                    yield piece; continue
+                head, steps = piece
+                if head: yield head
+                for c, k, rep, g, tail in steps:
+                    if k and rnd() < P[k] and rep is not None:
+                        yield rep
+                    elif g and rnd() < p_glitch and g == 1:
+                        stack = 1 + int(intensity == 3 and rnd() < 0.5)
+                        yield c + "".join(rng.choice(marks) for _ in range(stack))
+                    else:
+                        yield c
+                    if tail: yield tail
+        if pos < len(s): yield s[pos:]
+
+    def compile(self, s, digraphs=None):
+        """``s`` planned once for :meth:`style_compiled`: every word's plan flattened into one list of ops."""
+        starts, ends, first, ops = [], [], [], []
+        app, plan = ops.append, self.plan
+        pos = 0
+        for m in WORD_RE.finditer(s):
+            st, en = m.span()
+            app(s[pos:st])  # the gap before each word is an op of its own, so a range can replace it
+            starts.append(st); ends.append(en); first.append(len(ops))
+            lit = ""
+            for piece in plan(m.group(), digraphs):
+                if piece.__class__ is str:
+                    lit += piece; continue
+                head, steps = piece
+                lit += head
+                for c, k, rep, g, tail in steps:
+                    if lit: app(lit)
+                    app((c, k, rep, g))
+                    lit = tail
+            if lit: app(lit)
+            pos = en
+        app(s[pos:])
+        return Compiled(s, starts, ends, first, ops)
+
+    def style_compiled(self, pieces, rng, p_vowel, *, p_s=0.0, p_orn=0.0, p_glitch=0.0, intensity=1):
+        """:meth:`style` of the concatenation of ``pieces``, each ``(prog, a, b)``: the range ``prog.s[a:b]`` of a
+        :meth:`compile`-d text (with its digraphs), where neither ``a`` nor ``b`` (``None``: the end) falls inside a
+        word. The same draws in the same order, without re-tokenizing."""
+        rnd = rng.random
+        P = (0.0, p_vowel, p_s, p_orn)
+        marks = ZALGO_H if intensity == 3 else ZALGO_L
+        out = []
+        app = out.append
+        for prog, a, b in pieces:
+            s, starts, ops = prog.s, prog.starts, prog.ops
+            b = len(s) if b is None else b
+            i, j = bisect_left(starts, a), bisect_left(starts, b)
+            if i == j:
+                app(s[a:b]); continue
+            app(s[a:starts[i]])
+            for op in ops[prog.first[i]:prog.first[j] - 1 if j < len(starts) else len(ops) - 1]:
+                if op.__class__ is str:
+                    app(op); continue
+                c, k, rep, g = op
+                if k and rnd() < P[k] and rep is not None:
+                    app(rep)
+                elif g and rnd() < p_glitch and g == 1:
+                    stack = 1 + int(intensity == 3 and rnd() < 0.5)
+                    app(c + "".join(rng.choice(marks) for _ in range(stack)))
+                else:
+                    app(c)
+            app(s[prog.ends[j-1]:b])
+        return "".join(out)
+
+    def style_keyed(self, s, key, pos, p_vowel, *, lane=0, digraphs_at=None, p_s=0.0, p_orn=0.0, p_glitch=0.0,
+                    intensity=1):
+        """Counter-mode :meth:`style`: ``s`` starts at absolute position ``pos``; a character's draws are keyed on the
+        position of the source character it comes from, so a digraph never shifts the draws of its neighbours.
+        ``digraphs_at(word_pos)`` picks the digraph table per word (``None``: no digraphs)."""
+        T = (0, p_vowel * 65536, p_s * 65536, p_orn * 65536)  # thresholds on the 16-bit draws
+        t_glitch = p_glitch * 65536
+        marks = ZALGO_H if intensity == 3 else ZALGO_L
+        nm = len(marks)
+        k0 = 16 * lane
+        plan, table, u = self.plan_src, key.table, key.u
+        lo = hi = -1
+        tab = None
+        out = []
+        app = out.append
+        prev = 0
+        for m in WORD_RE.finditer(s):
+            st, en = m.span()
+            if st > prev: app(s[prev:st])
+            prev = en
+            w0 = pos + st
+            for piece in plan(m.group(), digraphs_at(w0) if digraphs_at else None):
+                if piece.__class__ is str:
+                    app(piece); continue
+                head, steps = piece
+                if head: app(head)
+                for c, k, rep, g, tail, src in steps:
+                    i = w0 + src
+                    if not lo <= i < hi:
+                        tab = table(lane, i // _BLOCK); lo = i - i % _BLOCK; hi = lo + _BLOCK
+                    j = (i - lo) * _SLOTS
+                    if k and rep is not None and tab[j + S_STEP] < T[k]:
+                        app(rep)
+                    elif g == 1 and tab[j + S_GLITCH] < t_glitch:
+                        stack = 2 if intensity == 3 and u(i, k0 + D_STACK) < 0.5 else 1
+                        app(c + "".join(marks[int(u(i, k0 + D_MARK + n) * nm)] for n in range(stack)))
+                    else:
+                        app(c)
+                    if tail: app(tail)
+        if prev < len(s): app(s[prev:])
+        return "".join(out)
+
+    def style_coupled(self, s, key, pos, side, idx, memo, *, lane=0):
+        """:meth:`style_keyed` at level ``side.levels[idx]`` in coupled mode. A word's output only changes at the
+        indices where one of its draws crosses a threshold column, so each word is rendered once per run of levels
+        between those breaks, and each piece ``s`` once per run between the breaks of all its words; both are kept
+        in ``memo`` (one dict per text), so a slider move re-renders only what changes. The word's digraph draw is
+        read at lane 0, as ``digraphs_at`` does in counter mode."""
+        entry = memo.get((lane, pos, s))
+        if entry is None:
+            parts, cuts, prev = [], set(), 0
+            for m in WORD_RE.finditer(s):
+                st, en = m.span()
+                if st > prev: parts.append(s[prev:st])
+                prev = en
+                breaks = self._coupled_breaks(m.group(), pos + st, key, side, lane)
+                cuts.update(breaks)
+                parts.append((m.group(), pos + st, breaks, {}))
+            if prev < len(s): parts.append(s[prev:])
+            entry = memo[lane, pos, s] = (sorted(cuts), {}, parts)
+        cuts, seen, parts = entry
+        seg = bisect_right(cuts, idx)
+        out = seen.get(seg)
+        if out is None:
+            out = seen[seg] = "".join(p if p.__class__ is str else self._coupled_word(p, key, side, idx, lane)
+                                      for p in parts)
+        return out
+
+    def _coupled_word(self, part, key, side, idx, lane):
+        w, w0, breaks, seen = part
+        seg = bisect_right(breaks, idx)
+        out = seen.get(seg)
+        if out is None:
+            d = key.table(0, w0 // _BLOCK)[w0 % _BLOCK * _SLOTS + S_DG] < side.t_dg[idx]
+            dg = side.digraphs
+            out = seen[seg] = self.style_keyed(w, key, w0, lane=lane, digraphs_at=(lambda p: dg) if d else None,
+                                               **side.params[idx])
+        return out
+
+    def _coupled_breaks(self, w, w0, key, side, lane):
+        n, table, cols = len(side.levels), key.table, side.t_step
+        b = {side.breaks(table(0, w0 // _BLOCK)[w0 % _BLOCK * _SLOTS + S_DG], side.t_dg)}
+        glitch = False
+        for dg in (None, side.digraphs):
+            for piece in self.plan_src(w, dg):
+                if piece.__class__ is str: continue
+                for c, k, rep, g, tail, src in piece[1]:
+                    i = w0 + src
+                    tab = table(lane, i // _BLOCK)
+                    j = i % _BLOCK * _SLOTS
+                    if k and rep is not None:
+                        b.add(side.breaks(tab[j + S_STEP], cols[k]))
+                    if g == 1:
+                        b.add(side.breaks(tab[j + S_GLITCH], side.t_glitch)); glitch = True
+        if glitch:  # the Zalgo pool and stack size follow the intensity step
+            b.update(x for x in range(1, n) if side.intensity[x] != side.intensity[x-1])
+        b.discard(n)
+        b.discard(0)
+        return sorted(b)
+
+    def style_split_keyed(self, s, key, pos, other, p_self, p_other, *, lane=0, digraphs_at=None):
+        """Counter-mode :meth:`style_split`: each alnum piece draws its side at its own position."""
+        table = key.table
+        t_self, t_other = p_self * 65536, p_other * 65536
+        lo = hi = -1
+        tab = None
+        out = []
+        app = out.append
+        prev = 0
+        for m in WORD_RE.finditer(s):
+            st, en = m.span()
+            if st > prev: app(s[prev:st])
+            prev = en
+            w, w0 = m.group(), pos + st
+            dg = digraphs_at(w0) if digraphs_at else None
+            mine, theirs = self.plan_src(w, dg), other.plan_src(w, dg)
+            for n, piece in enumerate(mine):
+                if piece.__class__ is str:
+                    app(piece); continue
+                if piece[1]:  # the piece draws its side at its first styled char
+                    i = w0 + piece[1][0][5]
+                    if not lo <= i < hi:
+                        tab = table(lane, i // _BLOCK); lo = i - i % _BLOCK; hi = lo + _BLOCK
+                    mine_side = tab[(i - lo) * _SLOTS + S_SIDE] < 32768
+                else:
+                    mine_side = True
+                head, steps = piece if mine_side else theirs[n]
+                t = t_self if mine_side else t_other
+                if head: app(head)
+                for c, k, rep, g, tail, src in steps:
+                    i = w0 + src
+                    if not lo <= i < hi:
+                        tab = table(lane, i // _BLOCK); lo = i - i % _BLOCK; hi = lo + _BLOCK
+                    app(rep if tab[(i - lo) * _SLOTS + S_STEP] < t else c)
+                    if tail: app(tail)
+        if prev < len(s): app(s[prev:])
+        return "".join(out)
+
+    def style_split(self, s, rng, other, p_self, p_other, *, digraphs=None):
+        """Vowel-only pass where each alnum token first draws which of two stylizers (self / other) to use."""
+        out = []
+        app = out.append
+        rnd = rng.random
+        pos = 0
+        for m in WORD_RE.finditer(s):
+            st, en = m.span()
+            if st > pos: app(s[pos:st])
+            pos = en
+            w = m.group()
+            mine, theirs = self.plan(w, digraphs), other.plan(w, digraphs)
+            for j, piece in enumerate(mine):
+                if piece.__class__ is str:
+                    app(piece); continue
+                if rnd() < 0.5:
+                    head, steps = piece; p = p_self
+                else:
+                    head, steps = theirs[j]; p = p_other
+                if head: app(head)
+                for c, k, rep, g, tail in steps:
+                    app(rep if rnd() < p else c)
+                    if tail: app(tail)
+        if pos < len(s): app(s[pos:])
+        return "".join(out)
+
+    def compile_split(self, s, other, digraphs=None):
+        """``s`` planned once for :meth:`style_split_compiled`: literals and, per alnum piece, both sides' steps."""
+        ops, lit, pos = [], "", 0
+        for m in WORD_RE.finditer(s):
+            lit += s[pos:m.start()]
+            pos = m.end()
+            w = m.group()
+            for mine, theirs in zip(self.plan(w, digraphs), other.plan(w, digraphs)):
+                if mine.__class__ is str:
+                    lit += mine; continue
+                if lit: ops.append(lit)
+                ops.append(tuple((head, tuple((c, rep, tail) for c, k, rep, g, tail in steps))
+                                 for head, steps in (mine, theirs)))
+                lit = ""
+        lit += s[pos:]
+        if lit: ops.append(lit)
+        return ops
+
+    def style_split_compiled(self, ops, rng, p_self, p_other):
+        """:meth:`style_split` of a :meth:`compile_split`-ed text: the same draws, without re-tokenizing."""
+        out = []
+        app = out.append
+        rnd = rng.random
+        for op in ops:
+            if op.__class__ is str:
+                app(op); continue
+            if rnd() < 0.5:
+                head, steps = op[0]; p = p_self
+            else:
+                head, steps = op[1]; p = p_other
+            if head: app(head)
+            for c, rep, tail in steps:
+                app(rep if rnd() < p else c)
+                if tail: app(tail)
+        return "".join(out)
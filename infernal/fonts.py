@@ -0,0 +1,25 @@
+"""Display fonts per 10-point corruption band (visual only; decoders fold fancy codepoints back)."""
+
+# We load a bunch of Google fonts and define 10 classes (.band1 .. .band10)
+FONT_CSS = """
+<link href="https://fonts.googleapis.com/css2?family=Cinzel:wght@400;700&family=EB+Garamond:wght@400;600&family=Spectral+SC:wght@400;600&family=Playfair+Display:wght@400;700&family=Tenor+Sans&family=UnifrakturMaguntia&family=Fruktur&family=Metal+Mania&family=Nosifer&family=Creepster&display=swap" rel="stylesheet">
+<style>
+  .band1  { font-family: "Cinzel","EB Garamond",serif; letter-spacing:0.1px; }
+  .band2  { font-family: "EB Garamond","Playfair Display",serif; letter-spacing:0.15px; }
+  .band3  { font-family: "Spectral SC","Playfair Display",serif; letter-spacing:0.2px; }
+  .band4  { font-family: "Tenor Sans","Spectral SC",serif; letter-spacing:0.25px; }
+  /* transition into gothic */
+  .band5  { font-family: "Spectral SC","UnifrakturMaguntia",serif; letter-spacing:0.3px; text-shadow: 0 0 0.5px rgba(0,0,0,.35); }
+  .band6  { font-family: "UnifrakturMaguntia","Fruktur",serif; letter-spacing:0.35px; text-shadow: 0 0 1px rgba(0,0,0,.45); }
+  .band7  { font-family: "Fruktur","UnifrakturMaguntia",serif; letter-spacing:0.4px; text-shadow: 0 0 1.2px rgba(120,0,0,.5); }
+  .band8  { font-family: "Metal Mania","Fruktur","UnifrakturMaguntia",serif; letter-spacing:0.45px; text-shadow: 0 0 1.5px rgba(160,0,0,.6); transform: skewX(-1deg); }
+  .band9  { font-family: "Nosifer","Metal Mania","UnifrakturMaguntia",serif; letter-spacing:0.5px; text-shadow: 0 0 2px rgba(200,0,0,.7); transform: skewX(-2deg); }
+  .band10 { font-family: "Creepster","Nosifer","Metal Mania",serif; letter-spacing:0.6px; text-shadow: 0 0 3px rgba(255,0,0,.8); transform: skewX(-3deg) rotate(-0.2deg); }
+  .small-note { color:#777; font-size:0.9em; }
+</style>
+"""
+
+def band_for(corruption:int) -> str:
+    # 1–10 -> band1, 11–20 -> band2, ..., 91–100 -> band10
+    idx = (max(1, min(100, corruption)) - 1) // 10 + 1
+    return f"band{idx}"
@@ -0,0 +1,63 @@
+"""Reversible glyph tables: vowels, digraphs, affixes, oaths, ornaments, Zalgo marks and add-on phrase lists."""
+
+DEMON_PERSONAS = ("Baal", "Mephisto", "Imp")
+
+# ---------- vowels (dark = demon; bright = angel) – decoders strip diacritics ----------
+V_ANGEL = {'a':['ā','a'],'e':['ē','e'],'i':['ī','i'],'o':['ō','o'],'u':['ū','u'],'y':['ȳ','y']}
+V_DEMON = {'a':['â','a'],'e':['ê','e'],'i':['î','i'],'o':['ô','o'],'u':['û','u'],'y':['ŷ','y']}
+# persona apps pick any diacritic from the wider pool (last entry = plain vowel)
+V_DEMON_DARK = {
+    'a': ['â','à','ä','á','a'],
+    'e': ['ê','è','ë','é','e'],
+    'i': ['î','ï','ì','í','i'],
+    'o': ['ô','ö','ò','ó','o'],
+    'u': ['û','ü','ù','ú','u'],
+    'y': ['ŷ','ÿ','y'],
+}
+
+# ---------- reversible digraph swaps (applied in order) ----------
+DGR_ANGEL = [('the','θe'),('The','Θe'),('sh','š'),('Sh','Š'),('ph','φ'),('Ph','Φ')]
+DGR_DEMON = [('the','ðe'),('The','Ðe'),('th','þ'),('Th','Þ'),('sh','ʃ'),('Sh','ʃ'),
+             ('ch','χ'),('Ch','Χ'),('ph','ƒ'),('Ph','Ƒ'),('qu','q͟u'),('Qu','Q͟u')]
+# the simple voice apps leave 'ch' alone
+DGR_DEMON_SIMPLE = [(a,b) for a,b in DGR_DEMON if a.lower() != 'ch']
+
+# ---------- affixes & oaths ----------
+AFFIXES = {
+    'Baal': (["ba’","’ba"], ["-oth","-’rim","-az"]),
+    'Mephisto': (["me’","’me"], ["-ius","-orum","-atrix"]),
+    'Imp': (["za’","ka’","’za"], ["-zik","-gob","-’hii"]),
+    'Angel': (["el’","sa’","’el"], ["-iel","-ael","-hosanna"]),
+}
+OATHS = {
+    'Baal': ["⟨behold⟩","⟨thus bound⟩"],
+    'Mephisto': ["⟨by pact⟩","⟨ipso facto⟩","⟨inter alia⟩"],
+    'Imp': ["⟨khkh⟩","⟨hehe⟩"],
+    'Angel': ["⟨amen⟩","⟨selah⟩","⟨gloria⟩","⟨hallelujah⟩"],
+}
+# flattened pools for the persona-less apps
+AFFX_ANGEL_PRE, AFFX_ANGEL_SUF = AFFIXES['Angel']
+AFFX_DEMON_PRE = [p for k in DEMON_PERSONAS for p in AFFIXES[k][0]]
+AFFX_DEMON_SUF = [s for k in DEMON_PERSONAS for s in AFFIXES[k][1]]
+OATHS_ANGEL = OATHS['Angel']
+OATHS_DEMON = OATHS['Baal'] + OATHS['Mephisto']
+
+# ---------- ornaments & combining marks ----------
+CONS_ORN = {'s':'ſ','t':'†','h':'ʰ','n':'ñ','r':'ŕ'}  # 's' only medial
+ZALGO_L = [u"\u0301", u"\u0302", u"\u0308", u"\u0336", u"\u034f"]
+ZALGO_H = ZALGO_L + [u"\u0317", u"\u0316", u"\u0352", u"\u035B", u"\u0360", u"\u0362"]
+
+# ---------- encoding-time add-ons ----------
+ARCHAIC_MAP = {
+    # order matters: longer tokens first
+    "you are": "thou art",
+    "you will": "thou shalt",
+    "shall not": "shalt not",
+    "your": "thy",
+    "yours": "thine",
+    "you": "thou",
+    "are": "art",   # be careful, only used in Baal mode and coarse
+}
+# word-bounded pairs (no bare "are")
+ARCHAIC_PAIRS = [(k, v) for k, v in ARCHAIC_MAP.items() if k != "are"]
+LATINISMS = ["ergo", "inter alia", "ipso facto", "sine die", "ad infinitum", "mutatis mutandis"]
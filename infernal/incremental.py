@@ -0,0 +1,82 @@
+"""Incremental re-stylization for the apps' input box: only the paragraphs that changed since the last call are styled.
+
+Each paragraph (line) is styled on its own, as :func:`~infernal.stream.stylize_stream` does: its RNG is seeded from
+its own text, so its output depends on nothing else in the document. :meth:`IncrementalEncoder.encode` splits the new
+input into lines, keeps the styled lines of the longest unchanged prefix and suffix, looks the rest up in a bounded
+cache (undo, a pasted-back or moved paragraph) and styles only what is left. A keystroke costs the edited paragraph,
+not the document; the result is always :func:`stylize_paragraphs` of the whole input.
+
+    enc = IncrementalEncoder()                      # one per session (st.session_state)
+    stylized, band, intensity = enc.encode(text, 80, latinisms=True)
+    enc.last    # {"paragraphs": 120, "styled": 1, "reused": 119, "styled_chars": 84, "seconds": 0.0004}
+"""
+import time
+
+from .continuous import stylize_sentence
+
+CACHE_MAX = 4096  # styled paragraphs kept beyond the current document
+
+def _style_line(func, line, corruption, opts):
+    body, cr = (line[:-1], "\r") if line.endswith("\r") else (line, "")
+    if not body.strip():
+        return line, None
+    styled, *meta = func(body, corruption, **opts)
+    return styled + cr, tuple(meta)
+
+def stylize_paragraphs(text:str, corruption:int, func=stylize_sentence, **opts):
+    """Non-incremental reference: ``func`` over every non-blank line of ``text`` (line endings kept);
+    returns ``(stylized, *meta)`` where meta is what ``func`` returns after the text (band, intensity)."""
+    lines = [_style_line(func, l, corruption, opts)[0] for l in text.split("\n")]
+    return ("\n".join(lines), *func("", corruption, **opts)[1:])
+
+class IncrementalEncoder:
+    """Per-session encoder that re-styles only changed paragraphs; ``func`` is any ``(text, corruption, **opts) ->
+    (stylized, *meta)`` translator whose output depends only on its arguments."""
+    def __init__(self, func=stylize_sentence, *, keep:int=CACHE_MAX):
+        self.func, self.keep = func, keep
+        self._key = None
+        self._src, self._out = [], []
+        self._cache = {}
+        self._meta = None
+        self.last = {}
+        self.counters = dict(calls=0, styled=0, reused=0, styled_chars=0)
+
+    def _style(self, line, corruption, opts):
+        out = self._cache.get(line)
+        if out is not None:
+            return out, False
+        out, meta = _style_line(self.func, line, corruption, opts)
+        if meta is not None:
+            self._meta = meta
+        if len(self._cache) >= self.keep:
+            self._cache.clear()
+        self._cache[line] = out
+        return out, True
+
+    def encode(self, text:str, corruption:int, **opts):
+        """``stylize_paragraphs(text, corruption, func, **opts)``, re-using every unchanged paragraph's output."""
+        t0 = time.perf_counter()
+        key = (corruption, tuple(sorted(opts.items())))
+        if key != self._key:  # another slider position / option set: nothing carries over
+            self._key, self._src, self._out, self._cache, self._meta = key, [], [], {}, None
+        new, old = text.split("\n"), self._src
+        n, m = len(new), len(old)
+        p = 0
+        while p < n and p < m and new[p] == old[p]: p += 1
+        s = 0
+        while s < n - p and s < m - p and new[n-1-s] == old[m-1-s]: s += 1
+        mid, styled, chars = [], 0, 0
+        for line in new[p:n-s]:
+            out, fresh = self._style(line, corruption, opts)
+            mid.append(out)
+            if fresh:
+                styled += 1; chars += len(line)
+        self._out = self._out[:p] + mid + self._out[m-s:]
+        self._src = new
+        if self._meta is None:
+            self._meta = tuple(self.func("", corruption, **opts)[1:])
+        self.last = dict(paragraphs=n, styled=styled, reused=n - styled, styled_chars=chars,
+                         seconds=time.perf_counter() - t0)
+        c = self.counters
+        c["calls"] += 1; c["styled"] += styled; c["reused"] += n - styled; c["styled_chars"] += chars
+        return ("\n".join(self._out), *self._meta)
@@ -0,0 +1,56 @@
+"""Deterministic translator with affixes, oaths, consonant ornaments and Zalgo at the top demon step."""
+from .text import unmark_all, _rng
+from .glyphs import (V_ANGEL, DGR_ANGEL, AFFX_ANGEL_PRE, AFFX_ANGEL_SUF, OATHS_ANGEL,
+                     V_DEMON, DGR_DEMON, AFFX_DEMON_PRE, AFFX_DEMON_SUF, OATHS_DEMON)
+from .profiles import LEVELS
+from .engine import Stylizer, compile_digraphs, insert_oath_affixes
+from .decoder import Folder, map_tokens, squeeze
+
+# ---------- compiled stylizers ----------
+_ANGEL = Stylizer(V_ANGEL)
+_DEMON = Stylizer(V_DEMON, ornaments="medial")
+_DEMON_GLITCH = Stylizer(V_DEMON, ornaments="medial", glitch="any")  # top step adds combining marks
+_DGR_ANGEL = compile_digraphs(DGR_ANGEL)
+_DGR_DEMON = compile_digraphs(DGR_DEMON)
+
+def stylize_sentence_corruption(sentence:str, corruption:int):
+    """
+    corruption: 1..100 (1=angelic, 100=demonic). Deterministic & reversible.
+    Returns stylized_text, mode ('Angel'|'Neutral'|'Demon'), intensity (0..3)
+    """
+    corruption = max(1, min(100, int(corruption)))
+    rng = _rng(corruption, sentence)
+
+    intensity = LEVELS[corruption].step
+    # Angelic zone
+    if corruption <= 39:
+        # maybe oath, maybe angelic affixes
+        s = insert_oath_affixes(sentence, rng, 0.06 * intensity, OATHS_ANGEL,
+                                0.08 * intensity, AFFX_ANGEL_PRE, 0.07 * intensity, AFFX_ANGEL_SUF)
+        return _ANGEL.style(s, rng, 0.45 + 0.1*intensity, digraphs=_DGR_ANGEL), "Angel", intensity
+
+    # Neutral zone
+    if corruption <= 54:
+        return sentence, "Neutral", 0
+
+    # Demonic zone
+    s = insert_oath_affixes(sentence, rng, 0.10 * intensity, OATHS_DEMON,
+                            0.12 * intensity, AFFX_DEMON_PRE, 0.10 * intensity, AFFX_DEMON_SUF)
+    stylizer = _DEMON_GLITCH if intensity == 3 else _DEMON
+    out = stylizer.style(s, rng, 0.5 + 0.1*intensity, digraphs=_DGR_DEMON,
+                         p_s=0.4 + 0.1*intensity, p_orn=0.18 + 0.08*intensity,
+                         p_glitch=0.08 + 0.06*intensity, intensity=intensity)
+    return out, "Demon", intensity
+
+# ---------- decoder ----------
+_FOLD = Folder([
+    # reverse digraphs (both sides)
+    ('ðe','the'), ('Ðe','The'), ('þ','th'), ('Þ','Th'), ('ʃ','sh'),
+    ('Χ','Ch'), ('χ','ch'), ('ƒ','ph'), ('Ƒ','Ph'), ('q͟u','qu'), ('Q͟u','Qu'),
+    ('θ','th'), ('Θ','Th'), ('š','sh'), ('Š','Sh'), ('φ','ph'), ('Φ','Ph'),
+    # strip ornaments
+    ('ſ','s'), ('†','t'), ('ʰ','h'), ('ñ','n'), ('ŕ','r'),
+], ("âêîôûŷāēīōūȳ", "aeiouyaeiouy"))
+
+def reverse_translate(text):
+    return squeeze(map_tokens(unmark_all(text), _FOLD.word, drop_oaths=True))
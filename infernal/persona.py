@@ -0,0 +1,199 @@
+"""Persona translator (Baal / Mephisto / Imp) with intensity 1..3.
+
+:class:`PersonaTranslator` owns its own generator; the module-level functions draw from the global ``random`` stream.
+"""
+import random
+from functools import lru_cache
+
+from .glyphs import (DEMON_PERSONAS, V_DEMON_DARK as _VOWELS, DGR_DEMON as _DIGRAPHS, AFFIXES, OATHS,
+                     ZALGO_L as _ZALGO_LIGHT, ZALGO_H as _ZALGO_HEAVY, ARCHAIC_MAP, LATINISMS)
+from .decoder import Folder
+
+_AFFIXES = {k: AFFIXES[k] for k in DEMON_PERSONAS}
+_OATHS = {k: OATHS[k] for k in DEMON_PERSONAS}
+
+# ================== Optional add-ons (encoding-time) ==================
+def apply_archaic_pronouns(text):
+    # very lightweight, phrase-level replacements
+    s = text
+    for k in sorted(ARCHAIC_MAP.keys(), key=len, reverse=True):
+        s = s.replace(k, ARCHAIC_MAP[k]).replace(k.capitalize(), ARCHAIC_MAP[k].capitalize())
+    return s
+
+# ================== Encoder ==================
+class PersonaTranslator:
+    """Reentrant encoder: owns its generator (``random.Random(seed)``), so concurrent sessions or threads never
+    interleave draws and a seed gives the same text at any concurrency. Create one per request or session.
+    ``rng`` may be any object with ``random()`` / ``choice()``; the module-level functions pass ``random`` itself."""
+    __slots__ = ("rng",)
+
+    def __init__(self, seed=None, *, rng=None):
+        self.rng = rng if rng is not None else random.Random(seed)
+
+    def sprinkle_latinisms(self, sentence, rate=0.18):
+        """Insert short Latinisms at comma/space boundaries; decoder can remove them."""
+        rnd, choice = self.rng.random, self.rng.choice
+        tokens = sentence.split()
+        out = []
+        for i, t in enumerate(tokens):
+            out.append(t)
+            if rnd() < rate and t[-1].isalnum():
+                out.append("⟨" + choice(LATINISMS) + "⟩")
+        return " ".join(out)
+
+    def style_word(self, word, persona="Mephisto", intensity=2, glitch_mode=False):
+        if not word:
+            return word
+        rnd, choice = self.rng.random, self.rng.choice
+
+        pre_opts, suf_opts = _AFFIXES.get(persona, _AFFIXES['Mephisto'])
+
+        # affixes (scale by intensity)
+        if rnd() < 0.12*intensity and word[0].isalnum():
+            word = choice(pre_opts) + word
+        if rnd() < 0.10*intensity and word[-1].isalnum():
+            word = word + choice(suf_opts)
+
+        # digraph swaps
+        w2 = word
+        for a,b in _DIGRAPHS:
+            if a in w2:
+                w2 = w2.replace(a,b)
+
+        # per-char tweaks
+        out = []
+        for i, c in enumerate(w2):
+            lc = c.lower()
+
+            # vowels (darken)
+            if lc in _VOWELS and rnd() < (0.5 + 0.15*intensity):
+                pool = _VOWELS[lc]
+                rep = choice(pool[:-1])  # prefer diacritics
+                rep = rep.upper() if c.isupper() else rep
+                out.append(rep)
+                continue
+
+            # medial s → ſ
+            if lc == 's' and 0 < i < len(w2)-1 and w2[i-1].isalnum() and w2[i+1].isalnum():
+                if rnd() < (0.45 + 0.15*intensity):
+                    out.append('ſ' if c.islower() else 'S')
+                    continue
+
+            # r, t, h, n spices
+            if lc == 'r' and rnd() < 0.35:
+                out.append('ŕ' if c.islower() else 'R'); continue
+            if lc == 't' and rnd() < 0.25:
+                out.append('†'); continue
+            if lc == 'h' and rnd() < 0.25:
+                out.append('ʰ'); continue
+            if lc == 'n' and rnd() < 0.20:
+                out.append('ñ'); continue
+
+            if c == "'":
+                out.append(choice(["'", "’"])); continue
+
+            # glitch mode or intensity 3: add combining marks
+            if (glitch_mode or intensity >= 3) and c.isalpha() and rnd() < (0.12 if glitch_mode else 0.18):
+                marks = _ZALGO_HEAVY if glitch_mode else _ZALGO_LIGHT
+                # maybe stack 1–2 marks when glitch_mode
+                stack = 1 + int(glitch_mode and rnd() < 0.5)
+                out.append(c + "".join(choice(marks) for _ in range(stack)))
+                continue
+
+            out.append(c)
+
+        return "".join(out)
+
+    def stylize_sentence(self, sentence, persona="Mephisto", intensity=2, archaic=False, latinisms=False,
+                         glitch_mode=False):
+        s = sentence
+
+        # persona-based pre-style
+        if persona == "Baal" and archaic:
+            s = apply_archaic_pronouns(s.lower())
+
+        # optional oath insert
+        tokens = s.split()
+        if tokens and self.rng.random() < 0.12*intensity:
+            oath = self.rng.choice(_OATHS.get(persona, []))
+            if oath:
+                where = self.rng.choice([0, len(tokens)])
+                tokens.insert(where, oath)
+        s = " ".join(tokens)
+
+        # optional Latinisms sprinkle
+        if persona == "Mephisto" and latinisms:
+            s = self.sprinkle_latinisms(s, rate=0.16 + 0.04*intensity)
+
+        # word-level styling
+        out = []
+        for w in s.split():
+            if w == "I" and persona != "Imp":
+                out.append("Ì")
+            else:
+                out.append(self.style_word(w, persona, intensity, glitch_mode=glitch_mode))
+        return " ".join(out)
+
+_GLOBAL = PersonaTranslator(rng=random)  # the module-level functions keep drawing from the global stream
+
+def sprinkle_latinisms(sentence, rate=0.18):
+    """Insert short Latinisms at comma/space boundaries; decoder can remove them."""
+    return _GLOBAL.sprinkle_latinisms(sentence, rate)
+
+def demon_style(word, persona="Mephisto", intensity=2, glitch_mode=False):
+    return _GLOBAL.style_word(word, persona, intensity, glitch_mode)
+
+def demon_stylize_sentence(sentence, persona="Mephisto", intensity=2, archaic=False, latinisms=False, glitch_mode=False):
+    """Global-``random`` form of :meth:`PersonaTranslator.stylize_sentence` (not safe across threads / sessions)."""
+    return _GLOBAL.stylize_sentence(sentence, persona, intensity, archaic, latinisms, glitch_mode)
+
+# ================== Decoder (adds options to undo add-ons) ==================
+_PREFIXES = sorted(set(sum([v[0] for v in _AFFIXES.values()], [])), key=len, reverse=True)
+_SUFFIXES = sorted(set(sum([v[1] for v in _AFFIXES.values()], [])), key=len, reverse=True)
+_BACK_MAP = {
+    "thou art": "you are",
+    "thou shalt": "you will",
+    "shalt not": "shall not",
+    "thy": "your",
+    "thine": "yours",
+    "thou": "you",
+    "art": "are",
+}
+
+_FOLD = Folder([
+    # undo digraphs
+    ('ðe','the'), ('Ðe','The'),
+    ('þ','th'),   ('Þ','Th'),
+    ('ʃ','sh'),   ('Χ','Ch'), ('χ','ch'),
+    ('ƒ','ph'),   ('Ƒ','Ph'),
+    ('q͟u','qu'), ('Q͟u','Qu'),
+    # strip ornaments
+    ('ſ','s'), ('ŕ','r'), ('†','t'), ('ʰ','h'), ('ñ','n'), ('Ì','I'), ("’","'"),
+], ("âàäáêèëéîïìíôöòóûüùúŷÿ", "aaaaeeeeiiiioooouuuuyy"))  # also removes combining marks (covers glitch/zalgo)
+_BACK_ORDER = sorted(_BACK_MAP, key=len, reverse=True)
+
+@lru_cache(maxsize=65536)
+def de_demonify_word(word):
+    # strip known affixes (both directions)
+    for pre in _PREFIXES:
+        if word.startswith(pre):
+            word = word[len(pre):]; break
+    for suf in _SUFFIXES:
+        if word.endswith(suf):
+            word = word[:-len(suf)]; break
+    # undo digraphs, strip ornaments, combining marks and accents
+    return _FOLD(word)
+
+def de_demonify_sentence(sentence, decode_archaic=False, strip_latinisms=False):
+    # remove ⟨latinism⟩ tokens if requested
+    if strip_latinisms:
+        sentence = " ".join(t for t in sentence.split() if not (t.startswith("⟨") and t.endswith("⟩")))
+
+    # per-word cleanup
+    s = " ".join(map(de_demonify_word, sentence.split()))
+
+    if decode_archaic:
+        # map common archaic → modern
+        for k in _BACK_ORDER:
+            s = s.replace(k, _BACK_MAP[k]).replace(k.capitalize(), _BACK_MAP[k].capitalize())
+    return s
@@ -0,0 +1,91 @@
+"""Per-level style parameters, precomputed for every integer corruption 0..100 at import.
+
+``LEVELS[c]`` is an immutable row holding everything a stylizer needs for level ``c`` (mode, font band, 3-step and
+continuous intensity, continuous-profile probabilities), so the encoders index a slot instead of rebuilding the profile
+dict and step ladders per call. ``COLUMNS`` exposes the same values as read-only ``array`` views for sweeps.
+"""
+from array import array
+from types import MappingProxyType
+from typing import NamedTuple
+
+from .fonts import band_for
+
+# ========= continuous style profiles =========
+def lerp(a,b,t): return a + (b-a)*t
+
+def angel_profile(c:int):
+    # c in [1..39] → t in [1..0] (more angelic at low c)
+    t = 1 - (min(39, max(1, c)) - 1)/38.0
+    return {
+        "p_vowel":  lerp(0.25, 0.55, t),
+        "p_dg":     lerp(0.08, 0.22, t),
+        "p_oath":   lerp(0.02, 0.10, t),
+        "p_pref":   lerp(0.02, 0.10, t),
+        "p_suf":    lerp(0.02, 0.09, t),
+        "intensity": 1 + int(t>0.33) + int(t>0.66),  # 1..3
+    }
+
+def demon_profile(c:int):
+    # c in [55..100] → t in [0..1] (more demonic at high c)
+    t = (min(100, max(55, c)) - 55)/45.0
+    return {
+        "p_vowel":  lerp(0.30, 0.65, t),
+        "p_dg":     lerp(0.20, 0.45, t),
+        "p_oath":   lerp(0.05, 0.16, t),
+        "p_pref":   lerp(0.06, 0.18, t),
+        "p_suf":    lerp(0.05, 0.16, t),
+        "p_orn":    lerp(0.12, 0.35, t),  # consonant ornaments
+        "p_glitch": lerp(0.00, 0.12, t),  # combining marks
+        "intensity": 1 + int(t>0.33) + int(t>0.66),  # 1..3
+    }
+
+def neutral_profile(c:int):
+    # c in [40..54] → very light, symmetric
+    t = (min(54, max(40, c)) - 40)/14.0
+    return {
+        "p_vowel_ang": lerp(0.04, 0.07, 1-t),
+        "p_vowel_dem": lerp(0.04, 0.07, t),
+        "p_dg_ang":    lerp(0.02, 0.05, 1-t),
+        "p_dg_dem":    lerp(0.02, 0.05, t),
+    }
+
+# ========= level table =========
+class Level(NamedTuple):
+    level: int
+    mode: str        # 'Angel' | 'Neutral' | 'Demon'
+    band: str        # css font band ('band1'..'band10')
+    step: int        # 3-step intensity of the simple / ornate translators (0 = neutral)
+    intensity: int   # continuous-profile intensity (0 = neutral)
+    p_vowel: float = 0.0
+    p_dg: float = 0.0
+    p_oath: float = 0.0
+    p_pref: float = 0.0
+    p_suf: float = 0.0
+    p_orn: float = 0.0
+    p_glitch: float = 0.0
+    p_vowel_ang: float = 0.0
+    p_vowel_dem: float = 0.0
+    p_dg_ang: float = 0.0
+    p_dg_dem: float = 0.0
+
+def _build(c):
+    if c <= 39:
+        prof = angel_profile(c)
+        return Level(c, "Angel", band_for(c), 3 if c <= 13 else 2 if c <= 27 else 1, **prof)
+    if c <= 54:
+        return Level(c, "Neutral", band_for(c), 0, 0, **neutral_profile(c))
+    prof = demon_profile(c)
+    return Level(c, "Demon", band_for(c), 1 if c <= 69 else 2 if c <= 84 else 3, **prof)
+
+LEVELS = tuple(_build(c) for c in range(101))
+
+def level_for(corruption) -> Level:
+    """Row for ``corruption``: a lookup for ints 0..100, built on the fly (same formulas) for anything else."""
+    if corruption.__class__ is int and 0 <= corruption <= 100:
+        return LEVELS[corruption]
+    return _build(corruption)
+
+COLUMNS = MappingProxyType({
+    name: memoryview(array("b" if Level.__annotations__[name] is int else "d", (getattr(L, name) for L in LEVELS))).toreadonly()
+    for name in Level._fields if Level.__annotations__[name] in (int, float)
+})
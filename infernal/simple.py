@@ -0,0 +1,115 @@
+"""Simple angel/demon styling (vowel pass + demon digraphs) used by the voice apps and the first deterministic app."""
+import random
+from itertools import chain
+
+from .text import mark_insert, unmark_all, _rng
+from .glyphs import V_ANGEL, V_DEMON, DGR_DEMON_SIMPLE as DGR_DEMON
+from .profiles import level_for
+from .engine import Stylizer, compile_digraphs, insert_oath_affixes
+from .decoder import Folder, map_tokens, squeeze
+
+# ---------- compiled stylizers ----------
+_ANGEL = Stylizer(V_ANGEL)
+_DEMON = Stylizer(V_DEMON)
+_DGR_DEMON = compile_digraphs(DGR_DEMON)
+_AMEN, _PACT = "⟨amen⟩", "⟨by pact⟩"
+_AMEN_LEN, _PACT_LEN = len(mark_insert(_AMEN)), len(mark_insert(_PACT))
+
+def _pieces(sentence, corruption, rng):
+    # (pieces, mode, intensity); pieces is lazy, so rng is only drawn as far as the output is read
+    intensity = level_for(corruption).step
+    if corruption <= 39:
+        # Angelic side
+        # optional oath (position drawn from the same stream); the oath itself is not styled here
+        oath = None
+        if rng.random() < 0.06 * intensity:
+            at_front = rng.random() < 0.5
+            oath = mark_insert(_AMEN)
+        pieces = _ANGEL.iter_style(sentence, rng, 0.35 + 0.12*intensity)
+        if oath:
+            pieces = chain((oath,), pieces) if at_front else chain(pieces, (oath,))
+        return pieces, "Angel", intensity
+
+    if corruption <= 54:
+        return (sentence,), "Neutral", 0
+
+    # Demonic side
+    s = insert_oath_affixes(sentence, rng, 0.09 * intensity, _PACT)
+    return _DEMON.iter_style(s, rng, 0.35 + 0.12*intensity, digraphs=_DGR_DEMON), "Demon", intensity
+
+def _stylize(sentence, corruption, rng):
+    pieces, mode, intensity = _pieces(sentence, corruption, rng)
+    return "".join(pieces), mode, intensity
+
+def stylize_sentence_corruption(sentence, corruption=35, seed=None):
+    """
+    corruption: 0..100 (0=angel, 100=demon)
+    Returns stylized_text, voice_mode ('Angel'|'Neutral'|'Demon'), voice_intensity (1..3)
+    Draws from the global ``random`` stream; ``seed`` reseeds it first.
+    """
+    if seed:
+        random.seed(seed)
+    return _stylize(sentence, corruption, random)
+
+def stylize_deterministic(sentence:str, corruption:int):
+    """
+    corruption: 1..100 (1=most angelic, 100=most demonic)
+    Deterministic output for a given (sentence, corruption).
+    """
+    corruption = max(1, min(100, int(corruption)))
+    return _stylize(sentence, corruption, _rng(corruption, sentence))
+
+# ---------- inverse search ----------
+# glyphs only one side can add; a text keeps its own count of them under the other side's pass
+_ANGEL_SIG = tuple("āēīōūȳĀĒĪŌŪȲ")
+_DEMON_SIG = tuple("âêîôûŷÂÊÎÔÛŶðÐþÞʃƒƑ\u035f")
+
+def _count(s, sig):
+    return sum(map(s.count, sig))
+
+def _matches(pieces, target):
+    # stop at the first piece that doesn't line up
+    pos = 0
+    for p in pieces:
+        if not target.startswith(p, pos):
+            return False
+        pos += len(p)
+    return pos == len(target)
+
+def find_corruption(original:str, stylized:str, levels=range(1, 101)) -> list:
+    """
+    Every level k in ``levels`` with ``stylize_deterministic(original, k)[0] == stylized``.
+    Levels are pruned by mode first (40..54 return the input unchanged; macrons only come from the angel pass,
+    circumflexes / þ-style digraphs only from the demon pass; each pass changes the length by a known amount), then
+    each remaining level is generated lazily and dropped at its first mismatching piece.
+    """
+    n, d = len(stylized), len(stylized) - len(original)
+    angel_ok = (d in (0, _AMEN_LEN)) and _count(stylized, _DEMON_SIG) == _count(original, _DEMON_SIG)
+    base = len(_DGR_DEMON(original))
+    demon_ok = (n in (base, base + _PACT_LEN)) and _count(stylized, _ANGEL_SIG) == _count(original, _ANGEL_SIG)
+    found = []
+    for k in levels:
+        c = max(1, min(100, int(k)))  # clamped like stylize_deterministic
+        if c <= 39:
+            if not angel_ok: continue
+        elif c <= 54:
+            if stylized == original: found.append(k)
+            continue
+        elif not demon_ok:
+            continue
+        if _matches(_pieces(original, c, _rng(c, original))[0], stylized):
+            found.append(k)
+    return found
+
+# ---------- decoder (does NOT need the slider) ----------
+_FOLD = Folder([
+    ('ðe','the'), ('Ðe','The'), ('þ','th'), ('Þ','Th'), ('ʃ','sh'), ('ƒ','ph'), ('Ƒ','Ph'),
+    ('q͟u','qu'), ('Q͟u','Qu'), ('θ','th'), ('Θ','Th'), ('š','sh'), ('Š','Sh'), ('φ','ph'), ('Φ','Ph'),
+], ("âêîôûŷāēīōūȳ", "aeiouyaeiouy"))
+
+def decore_word(w):
+    return _FOLD(w)
+
+def reverse_translate(text):
+    # drops ⟨oath⟩ insertions; alnum words are folded once per distinct word
+    return squeeze(map_tokens(unmark_all(text), _FOLD.word, drop_oaths=True))
@@ -0,0 +1,49 @@
+"""Streamlit result caching for the app front-ends (this module imports ``streamlit``; the rest of the package does not).
+
+Streamlit reruns the whole script on every widget change, so the same (text, corruption, options) is encoded and the
+same paste decoded over and over, across reruns and across sessions. ``encode`` / ``decode`` memoize results with
+``st.cache_data``, keyed on the function, its arguments and :data:`infernal.ALGO_VERSION` (so a deploy that changes
+output never serves stale text), bounded by ``CACHE_ENTRIES`` and ``CACHE_TTL``. The translators' compiled tables and
+plan caches live at module level, so importing a module builds them once per server process for every session.
+
+``encode_incremental`` serves the main input box: a per-session :class:`~infernal.incremental.IncrementalEncoder`
+re-styles only the paragraphs changed since the previous rerun instead of the whole document on every keystroke.
+"""
+import importlib
+
+import streamlit as st
+
+from . import ALGO_VERSION
+from .incremental import IncrementalEncoder
+
+CACHE_TTL = 60 * 60   # seconds
+CACHE_ENTRIES = 1024  # per cached function
+
+def _resolve(func):
+    # "<module>.<function>" of the package; modules are per-process singletons, so this is a dict lookup after import
+    mod, fn = func.rsplit(".", 1)
+    return getattr(importlib.import_module(f".{mod}", __package__), fn)
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def _encode(func, text, corruption, opts, algo):
+    return _resolve(func)(text, corruption, **dict(opts))
+
+@st.cache_data(max_entries=CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+def _decode(func, text, opts, algo):
+    return _resolve(func)(text, **dict(opts))
+
+def encode(func:str, text:str, corruption:int, **opts):
+    """Cached ``<module>.<function>(text, corruption, **opts)``, e.g. ``encode("continuous.stylize_sentence", ...)``."""
+    return _encode(func, text, corruption, tuple(sorted(opts.items())), ALGO_VERSION)
+
+def encode_incremental(func:str, text:str, corruption:int, **opts):
+    """:func:`encode` paragraph by paragraph, re-styling only what changed since this session's previous call."""
+    encoders = st.session_state.setdefault("infernal_incremental", {})
+    enc = encoders.get(func)
+    if enc is None:
+        enc = encoders[func] = IncrementalEncoder(_resolve(func))
+    return enc.encode(text, corruption, **opts)
+
+def decode(func:str, text:str, **opts):
+    """Cached ``<module>.<function>(text, **opts)``, e.g. ``decode("continuous.decode_to_english", ...)``."""
+    return _decode(func, text, tuple(sorted(opts.items())), ALGO_VERSION)
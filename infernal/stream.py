@@ -0,0 +1,102 @@
+"""Generator-based encode / decode for inputs too large to hold as one string.
+
+Text is cut into lines (the line ending is kept as-is) and each line goes through :func:`stylize_sentence` /
+:func:`decode_to_english` exactly as a one-line paste would, so output per line is the same as the whole-string API and
+only one line is buffered at a time. A line longer than ``limit`` is cut, repeatedly, at the first whitespace run that
+reaches past ``limit`` characters; whitespace never sits inside a word, a ``q͟u`` digraph or a Zalgo stack, so no glyph
+is split. A run of more than ``4 * limit`` characters without whitespace is cut anyway, before a character that is not
+a combining mark, so the buffer stays bounded. A cut is only made once the text after it can't change it, so the cuts
+depend on the text alone, not on how it was split into chunks.
+"""
+import re, unicodedata
+
+from .continuous import stylize_sentence, decode_to_english
+
+DEFAULT_LIMIT = 1 << 16
+_SPACE_RUN = re.compile(r"[^\S\n]+")
+
+def _hard_cut(buf, at, final):
+    # first index from ``at`` that starts a new glyph (not a combining mark); if the marks run to the end, ``at`` for
+    # a whole line, else None (the glyph may continue in the next chunk)
+    for i in range(at, len(buf)):
+        if not unicodedata.combining(buf[i]):
+            return i
+    return at if final else None
+
+def _cut_points(buf, limit, final, scan=0):
+    """``(cuts, pos, scan)``: the ``(start, end)`` spans to cut ``buf`` at (a whitespace run, or empty for a hard cut),
+    the start of the uncut rest and, unless ``final``, where to resume searching once more text has arrived."""
+    cuts, pos = [], 0
+    while len(buf) - pos > limit:
+        m = _SPACE_RUN.search(buf, max(scan, pos + limit))
+        if m:
+            start = m.start()
+            while start > pos and buf[start-1].isspace():  # a run straddling the search start counts whole
+                start -= 1
+            if start <= pos + 4 * limit:
+                if m.end() == len(buf):  # trailing whitespace, or a run the next chunk may extend
+                    scan = m.start()
+                    break
+                if start == pos:  # leading whitespace: nothing to cut off
+                    scan = m.end()
+                    continue
+                cuts.append((start, m.end()))
+                pos = scan = m.end()
+                continue
+        if len(buf) - pos <= 4 * limit:
+            scan = len(buf)
+            break
+        at = _hard_cut(buf, pos + 4 * limit, final)
+        if at is None:
+            break
+        cuts.append((at, at))
+        pos, scan = at, (m.start() if m else len(buf))  # nothing to find before where this search ended
+    return cuts, pos, scan
+
+def _pieces(buf, cuts, pos):
+    for start, end in cuts:
+        yield buf[pos:start], buf[start:end]
+        pos = end
+
+def iter_units(chunks, limit=DEFAULT_LIMIT):
+    """Yield ``(content, sep)`` pairs: ``sep`` is the line ending or, for an over-long line, the whitespace run cut at
+    (``""`` for a hard cut)."""
+    buf, scan = "", 0  # buf: the unfinished line; buf[:scan] holds no cut point
+    for chunk in chunks:
+        buf += chunk
+        start = 0
+        while True:
+            nl = buf.find("\n", start)
+            if nl < 0: break
+            end = nl - 1 if nl > start and buf[nl-1] == "\r" else nl
+            line = buf[start:end]
+            cuts, pos, _ = _cut_points(line, limit, True)
+            yield from _pieces(line, cuts, 0)
+            yield line[pos:], buf[end:nl+1]
+            start, scan = nl + 1, 0
+        if start:
+            buf = buf[start:]
+        if len(buf) > limit:
+            cuts, pos, scan = _cut_points(buf, limit, False, scan)
+            if cuts:
+                yield from _pieces(buf, cuts, 0)
+                buf, scan = buf[pos:], scan - pos
+    if buf:
+        cuts, pos, _ = _cut_points(buf, limit, True)
+        yield from _pieces(buf, cuts, 0)
+        yield buf[pos:], ""
+
+def stylize_stream(chunks, corruption:int, *, archaic=False, latinisms=False, glitch_override=False,
+                   seed:str|None=None, limit=DEFAULT_LIMIT):
+    """Stylize an iterable of text chunks line by line; blank lines pass through unchanged."""
+    for content, sep in iter_units(chunks, limit):
+        if content.strip():
+            content = stylize_sentence(content, corruption, archaic=archaic, latinisms=latinisms,
+                                       glitch_override=glitch_override, seed=seed)[0]
+        yield content + sep
+
+def decode_stream(chunks, *, decode_archaic=False, strip_latinisms=True, limit=DEFAULT_LIMIT):
+    """Decode an iterable of text chunks line by line (whitespace runs an over-long line was cut at become one space)."""
+    for content, sep in iter_units(chunks, limit):
+        out = decode_to_english(content, decode_archaic=decode_archaic, strip_latinisms=strip_latinisms)
+        yield out + (sep if not sep or sep[-1] == "\n" else " ")
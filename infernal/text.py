@@ -0,0 +1,34 @@
+"""Tokenizer, insert markers and small text helpers shared by every translator."""
+import random, re
+
+# ---------- tokenizer & markers ----------
+TOK_RE = re.compile(r"(\w+|\s+|[^\w\s]+)", re.UNICODE)  # words | spaces | punctuation
+INV = "\u2063"  # invisible wrapper for inserts (prefix/suffix/oaths/latinisms), easy to strip
+
+def mark_insert(s):   return INV + s + INV
+def unmark_all(s):    return s.replace(INV, "")
+
+# ---------- header font ----------
+_FRAKTUR = str.maketrans(dict(zip(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    "𝔄𝔅ℭ𝔇𝔈𝔉𝔊ℌℑ𝔍𝔎𝔏𝔐𝔑𝔒𝔓𝔔ℜ𝔖𝔗𝔘𝔙𝔚𝔛𝔜ℨ𝔞𝔟𝔠𝔡𝔢𝔣𝔤𝔥𝔦𝔧𝔨𝔩𝔪𝔫𝔬𝔭𝔮𝔯𝔰𝔱𝔲𝔳𝔴𝔵𝔶𝔷",
+)))
+
+def to_fraktur(text):
+    return text.translate(_FRAKTUR)
+
+# ---------- case-preserving whole-word replace ----------
+def replace_ci_bound(text, src, dst):
+    def repl(m):
+        g = m.group(0)
+        if g.isupper():         return dst.upper()
+        if g[0].isupper():      return dst.capitalize()
+        return dst
+    return re.sub(rf"\b{re.escape(src)}\b", repl, text, flags=re.IGNORECASE)
+
+# ---------- deterministic RNG ----------
+def _rng(corruption:int, text:str, seed:str|None=None):
+    # Seeded only by corruption + plain text (+ optional user seed): reproducible and guessable with the same slider.
+    base = f"{corruption}|{len(text)}|{text[:128]}"
+    if seed: base += f"|seed:{seed}"
+    return random.Random(base)
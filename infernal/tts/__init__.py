@@ -0,0 +1,122 @@
+"""ElevenLabs text-to-speech for the voice apps. ``requests`` is imported on first call, not at import time.
+
+- ``cache``  content-addressed on-disk LRU + in-memory hot tier for synthesized audio
+- ``client`` pooled keep-alive session with connect/read timeouts and jittered retries (429 / 5xx / Retry-After)
+- ``stub``   local stand-in for the ElevenLabs endpoint (latency / error / size distributions, chunked streaming,
+             mid-stream disconnects); ``python -m infernal.tts.stub`` runs it standalone
+- ``loadtest`` N concurrent sessions through the apps' TTS path: throughput, tail latency, cache effectiveness
+- ``server`` local audio relay: the browser plays a streaming synthesis while it is still being generated
+- ``backends`` ElevenLabs / stub / browser backends behind an asyncio service: global and per-voice limits, fair
+               per-session queuing, circuit breaker, queue metrics
+- ``formats`` output formats / bitrates per use case, ffmpeg transcoding from a cached master
+"""
+import subprocess, time
+
+from .cache import AudioCache, audio_key, default_cache
+from .client import TTSClient, default_client
+from .formats import DEFAULT_FORMAT, PRESETS, format_for, ffmpeg, masters, transcode
+
+MODEL_ID = "eleven_multilingual_v2"
+_DEFAULT = object()
+
+# ================== ElevenLabs TTS ==================
+def tts_payload(text, stability=0.5, similarity=0.8, style=0.3, model_id=MODEL_ID):
+    """JSON body of a text-to-speech request (also the cache identity of the audio)."""
+    return {
+        "text": text,
+        "model_id": model_id,
+        "voice_settings": {
+            "stability": stability,
+            "similarity_boost": similarity,
+            "style": style,
+            "use_speaker_boost": True
+        }
+    }
+
+def _params(output_format):
+    return {"output_format": output_format} if output_format else None
+
+def _cache_key(voice_id, payload, output_format):
+    # the upstream default format keeps the key it had before formats were selectable
+    if output_format in (None, DEFAULT_FORMAT):
+        return audio_key(voice_id, payload)
+    return audio_key(voice_id, payload, output_format=output_format)
+
+def _post(api_key, voice_id, payload, output_format=None, timing=None, client=None):
+    return (client or default_client()).synthesize(api_key, voice_id, payload, params=_params(output_format),
+                                                   timing=timing)
+
+def _derive(cache, voice_id, payload, output_format, timing):
+    """``output_format`` transcoded from a better cached master, or ``None`` (no ffmpeg, no master, or it failed)."""
+    if cache is None or output_format is None or ffmpeg() is None:
+        return None
+    for master in masters(output_format):
+        data = cache.get(_cache_key(voice_id, payload, master), count=False)
+        if data is None: continue
+        t0 = time.perf_counter()
+        try:
+            out = transcode(data, output_format)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if timing is not None:
+            dt = time.perf_counter() - t0
+            timing.update(kind="transcode", voice_id=voice_id, chars=len(payload["text"]), ttfb_s=dt, total_s=dt,
+                          bytes=len(out), master=master)
+        return out
+    return None
+
+def tts_elevenlabs(text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *, output_format=None,
+                   cache=_DEFAULT, timing=None, client=None):
+    """
+    Returns bytes (mp3). Raises on error.
+    Served from ``cache`` (default: the shared on-disk cache; ``None`` disables it) when the same text, voice and
+    settings were synthesized before. ``output_format`` (see :mod:`infernal.tts.formats`) is a separate entry, and is
+    transcoded from a cached higher-quality master when ffmpeg is available. ``timing`` (a dict) receives
+    time-to-first-byte / total time of a network call. ``client`` defaults to the process-wide one.
+    """
+    payload = tts_payload(text, stability, similarity, style)
+    if cache is _DEFAULT:
+        cache = default_cache()
+    if cache is None:
+        return _post(api_key, voice_id, payload, output_format, timing, client)
+    return cache.get_or_create(_cache_key(voice_id, payload, output_format),
+                               lambda: _derive(cache, voice_id, payload, output_format, timing)
+                                       or _post(api_key, voice_id, payload, output_format, timing, client))
+
+def tts_stream(text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *, output_format=None,
+               cache=_DEFAULT, timing=None, client=None):
+    """
+    Yields mp3 chunks as the streaming endpoint produces them; a cached (or locally transcoded) clip comes back as one
+    chunk. The complete audio is stored in ``cache`` (same key as :func:`tts_elevenlabs`) once the stream has finished.
+    """
+    payload = tts_payload(text, stability, similarity, style)
+    if cache is _DEFAULT:
+        cache = default_cache()
+    key = _cache_key(voice_id, payload, output_format)
+    data = cache.get(key) if cache is not None else None
+    if data is not None:
+        if timing is not None:
+            timing.update(kind="cache", voice_id=voice_id, chars=len(text), ttfb_s=0.0, total_s=0.0, bytes=len(data))
+        yield data
+        return
+    data = _derive(cache, voice_id, payload, output_format, timing)
+    if data is not None:
+        cache.put(key, data)
+        yield data
+        return
+    parts = []
+    for chunk in (client or default_client()).stream(api_key, voice_id, payload, params=_params(output_format), timing=timing):
+        parts.append(chunk)
+        yield chunk
+    if cache is not None:
+        cache.put(key, b"".join(parts))
+
+def default_tts_params_for(voice_used, corruption):
+    if voice_used == "Angel":
+        return dict(stability=0.5, similarity=0.8, style=0.35)
+    if voice_used == "Demon":
+        # darker style; lower stability for rasp/texture at high corruption
+        return dict(stability=(0.35 if corruption >= 85 else 0.45),
+                    similarity=0.75,
+                    style=(0.65 if corruption >= 85 else 0.5))
+    return dict(stability=0.5, similarity=0.8, style=0.4)
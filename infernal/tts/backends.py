@@ -0,0 +1,525 @@
+"""Pluggable TTS backends behind one asyncio service with concurrency limits, fair queuing and a circuit breaker.
+
+    svc = default_service()                                   # backend from INFERNAL_TTS_BACKEND (default elevenlabs)
+    audio = svc.call(session_id, text, api_key, voice_id, **params)               # from any thread
+    for chunk in svc.iter_stream(session_id, text, api_key, voice_id): ...
+    audio = await svc.synthesize(session_id, text, api_key, voice_id)             # on the service loop
+    svc.stats()      # queue depth, wait percentiles, in flight per voice, breaker state
+
+Backends share a signature with :func:`infernal.tts.tts_elevenlabs`:
+
+- ``elevenlabs`` the pooled client and the shared audio cache
+- ``stub``       an in-process :class:`~infernal.tts.stub.StubServer` with its own client and no cache
+- ``browser``    no server audio at all: not a :class:`Backend` and no service (:func:`server_audio` is False);
+                 :meth:`BrowserBackend.html` is the Web Speech player the apps embed
+
+The service runs an event loop on one daemon thread; blocking HTTP runs on that loop's executor (``asyncio.to_thread``)
+so the pooled ``requests`` client keeps its connection reuse and retries. Every upstream call takes a slot from a
+global limit (``INFERNAL_TTS_CONCURRENCY``, default 8) and from its voice's limit (``INFERNAL_TTS_PER_VOICE``,
+default 4). Waiters queue per session and slots are handed out round-robin across sessions, so one session's long
+segmented passage cannot starve everyone else's short clip. After ``threshold`` consecutive upstream failures (429,
+5xx, network) the breaker opens and calls fail at once with :class:`CircuitOpen` for ``reset_after`` seconds, then
+one trial call decides whether it closes again. Cache hits skip the queue (their disk read runs off the loop).
+
+``python -m infernal.tts.backends`` runs :func:`selfcheck`: round-robin order, the per-voice limit and the breaker's
+open → half-open → closed path.
+"""
+import abc, asyncio, json, os, threading, time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from . import _DEFAULT, _cache_key, tts_elevenlabs, tts_payload, tts_stream
+from .cache import default_cache
+
+CONCURRENCY = int(os.environ.get("INFERNAL_TTS_CONCURRENCY", "8"))
+PER_VOICE = int(os.environ.get("INFERNAL_TTS_PER_VOICE", "4"))
+
+class CircuitOpen(RuntimeError):
+    """Upstream is failing; the call was refused without trying."""
+
+# ---------- circuit breaker ----------
+class CircuitBreaker:
+    def __init__(self, threshold:int=5, reset_after:float=30.0):
+        self.threshold, self.reset_after = threshold, reset_after
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+        self.counters = dict(opened=0, rejected=0)
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None: return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.reset_after else "open"
+
+    def check(self):
+        """Raise :class:`CircuitOpen` unless a call may go ahead (one trial call at a time once half-open)."""
+        with self._lock:
+            if self.opened_at is None: return
+            if time.monotonic() - self.opened_at >= self.reset_after and not self._trial:
+                self._trial = True
+                return
+            self.counters["rejected"] += 1
+        raise CircuitOpen(f"TTS upstream unhealthy; retrying after {self.reset_after:.0f} s")
+
+    def success(self):
+        with self._lock:
+            self.failures, self.opened_at, self._trial = 0, None, False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or (self.opened_at is None and self.failures >= self.threshold):
+                if self.opened_at is None or self._trial: self.counters["opened"] += 1
+                self.opened_at, self._trial = time.monotonic(), False
+
+def _unhealthy(e) -> bool:
+    # failures that say something about upstream, not about the request (a 401 / 422 does not trip the breaker)
+    from .segments import _retryable
+
+    return _retryable(e)
+
+# ---------- fair gate ----------
+class FairGate:
+    """Global and per-voice slots, handed out round-robin over per-session FIFO queues. Use on one event loop."""
+    def __init__(self, limit:int=CONCURRENCY, per_voice:int=PER_VOICE, samples:int=1024):
+        self.limit, self.per_voice = limit, per_voice
+        self.active = 0
+        self.by_voice = {}
+        self._queues = OrderedDict()  # session -> deque of (voice, future, enqueued at); order = next to serve
+        self._waits = deque(maxlen=samples)
+        self.counters = dict(granted=0, queued=0, max_depth=0)
+
+    @property
+    def depth(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def _free(self, voice):
+        return self.active < self.limit and self.by_voice.get(voice, 0) < self.per_voice
+
+    def _grant(self, voice):
+        self.active += 1
+        self.by_voice[voice] = self.by_voice.get(voice, 0) + 1
+        self.counters["granted"] += 1
+
+    def _dispatch(self):
+        while self.active < self.limit:
+            for session, q in self._queues.items():
+                while q and q[0][1].done():  # cancelled while waiting
+                    q.popleft()
+                if q and self._free(q[0][0]):
+                    voice, fut, t0 = q.popleft()
+                    self._queues.move_to_end(session)  # served: to the back of the line
+                    if not q: del self._queues[session]
+                    self._grant(voice)
+                    self._waits.append(time.monotonic() - t0)
+                    fut.set_result(None)
+                    break
+            else:
+                for session in [s for s, q in self._queues.items() if not q]:
+                    del self._queues[session]
+                return
+
+    async def acquire(self, session, voice):
+        if not self._queues and self._free(voice):
+            self._grant(voice)
+            self._waits.append(0.0)
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(session, deque()).append((voice, fut, time.monotonic()))
+        self.counters["queued"] += 1
+        self.counters["max_depth"] = max(self.counters["max_depth"], self.depth)
+        self._dispatch()  # the queue may only be waiting on other voices
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release(voice)  # granted just as the waiter went away
+            raise
+
+    def release(self, voice):
+        self.active -= 1
+        self.by_voice[voice] -= 1
+        if not self.by_voice[voice]: del self.by_voice[voice]
+        self._dispatch()
+
+    def stats(self) -> dict:
+        w = sorted(self._waits)
+        pct = lambda q: w[min(len(w) - 1, int(q * len(w)))] * 1e3 if w else None
+        return dict(depth=self.depth, sessions_waiting=len(self._queues), in_flight=self.active,
+                    in_flight_by_voice=dict(self.by_voice), limit=self.limit, per_voice=self.per_voice,
+                    wait_p50_ms=pct(0.50), wait_p95_ms=pct(0.95), wait_max_ms=w[-1] * 1e3 if w else None,
+                    **self.counters)
+
+# ---------- backends ----------
+async def _aiter(gen):
+    """Drive a blocking generator from the loop's executor, one item per hop."""
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next, gen, None)
+            if chunk is None: return
+            yield chunk
+    finally:
+        await asyncio.to_thread(gen.close)
+
+class Backend(abc.ABC):
+    """Server-side synthesis: what :class:`TTSService` queues and calls."""
+    name = "base"
+    audio = True
+
+    def cached(self, text, voice_id, stability=0.5, similarity=0.8, style=0.3, *, output_format=None) -> bytes|None:
+        """Audio already on hand for this request, without queuing (``None`` if there is none)."""
+        return None
+
+    @abc.abstractmethod
+    async def synthesize(self, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+                         output_format=None, timing=None) -> bytes:
+        """The complete audio for one request."""
+
+    async def stream(self, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+                     output_format=None, timing=None):
+        yield await self.synthesize(text, api_key, voice_id, stability, similarity, style,
+                                    output_format=output_format, timing=timing)
+
+    def close(self):
+        pass
+
+class ElevenLabsBackend(Backend):
+    name = "elevenlabs"
+
+    def __init__(self, *, client=None, cache=_DEFAULT):
+        self.client = client
+        self.cache = default_cache() if cache is _DEFAULT else cache
+
+    def cached(self, text, voice_id, stability=0.5, similarity=0.8, style=0.3, *, output_format=None):
+        if self.cache is None: return None
+        key = _cache_key(voice_id, tts_payload(text, stability, similarity, style), output_format)
+        # probe without counting a miss (the synthesis path looks again); a hit is now hot and is counted once
+        return self.cache.get(key) if self.cache.get(key, count=False) is not None else None
+
+    async def synthesize(self, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+                         output_format=None, timing=None):
+        return await asyncio.to_thread(tts_elevenlabs, text, api_key, voice_id, stability, similarity, style,
+                                       output_format=output_format, cache=self.cache, timing=timing,
+                                       client=self.client)
+
+    async def stream(self, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+                     output_format=None, timing=None):
+        gen = tts_stream(text, api_key, voice_id, stability, similarity, style, output_format=output_format,
+                         cache=self.cache, timing=timing, client=self.client)
+        async for chunk in _aiter(gen):
+            yield chunk
+
+class StubBackend(ElevenLabsBackend):
+    """ElevenLabs protocol against a private in-process stub (``stub_kw`` as :class:`StubServer`); no credits."""
+    name = "stub"
+
+    def __init__(self, *, cache=None, **stub_kw):
+        from .client import TTSClient
+        from .stub import StubServer
+
+        self.server = StubServer(**stub_kw).start()
+        super().__init__(client=TTSClient(self.server.url), cache=cache)
+
+    async def synthesize(self, text, api_key, voice_id, *args, **kw):
+        return await super().synthesize(text, api_key or "stub", voice_id, *args, **kw)
+
+    async def stream(self, text, api_key, voice_id, *args, **kw):
+        async for chunk in super().stream(text, api_key or "stub", voice_id, *args, **kw):
+            yield chunk
+
+    def close(self):
+        self.client.close()
+        self.server.stop()
+
+_WEB_SPEECH = """
+<div style="display:flex;gap:8px;align-items:center;margin:6px 0 12px;">
+  <button id="speakBtn" style="padding:8px 14px;border-radius:8px;border:1px solid #555;cursor:pointer;">Speak</button>
+  <button id="stopBtn" style="padding:8px 14px;border-radius:8px;border:1px solid #555;cursor:pointer;">Stop</button>
+  <span id="voiceStatus" style="margin-left:8px;color:#666;font-size:0.9em;"></span>
+</div>
+<script>
+(function() {
+  const data = __PAYLOAD__;
+  const txt = data.text || "";
+  const rate = Number(data.rate) || 1.0;
+  const pitch = Number(data.pitch) || 1.0;
+  const volume = Number(data.volume) || 1.0;
+  const hint = (data.voice_hint || "").toLowerCase();
+
+  const synth = window.speechSynthesis;
+  const status = document.getElementById("voiceStatus");
+  const speakBtn = document.getElementById("speakBtn");
+  const stopBtn = document.getElementById("stopBtn");
+
+  function pickVoice() {
+    let voices = synth.getVoices();
+    if (!voices || !voices.length) return null;
+    // Prefer en-* voices; then look for hint substring(s)
+    const en = voices.filter(v => /en(-|_|\\b)/i.test(v.lang) || /English/i.test(v.name));
+    let pool = en.length ? en : voices;
+    if (hint) {
+      const scored = pool.map(v => {
+        const h = v.name.toLowerCase() + " " + v.lang.toLowerCase();
+        let score = 0;
+        hint.split(/\\s+/).forEach(k => { if (k && h.includes(k)) score += 1; });
+        return {v, score};
+      });
+      scored.sort((a,b) => b.score - a.score);
+      return (scored[0] && scored[0].score>0) ? scored[0].v : pool[0];
+    }
+    return pool[0];
+  }
+
+  // Some browsers load voices async
+  function speakNow() {
+    if (!('speechSynthesis' in window)) {
+      status.textContent = "Voice not supported in this browser.";
+      return;
+    }
+    synth.cancel(); // stop anything ongoing
+    const u = new SpeechSynthesisUtterance(txt);
+    u.rate = rate;
+    u.pitch = pitch;
+    u.volume = volume;
+    let voice = pickVoice();
+    if (!voice) {
+      // try once after voiceschanged
+      synth.onvoiceschanged = () => {
+        voice = pickVoice();
+        if (voice) {
+          u.voice = voice;
+          synth.speak(u);
+          status.textContent = "Speaking with " + (voice.name || "default");
+        }
+      };
+    } else {
+      u.voice = voice;
+      synth.speak(u);
+      status.textContent = "Speaking with " + (voice.name || "default");
+    }
+    u.onend = () => { status.textContent = "Done."; };
+    u.onerror = () => { status.textContent = "Speech error."; };
+  }
+
+  speakBtn.onclick = () => speakNow();
+  stopBtn.onclick = () => { synth.cancel(); status.textContent = "Stopped."; };
+})();
+</script>
+"""
+
+class BrowserBackend:
+    """The visitor's browser speaks (Web Speech API); nothing is synthesized or queued on the server, so this is not
+    a :class:`Backend` and no :class:`TTSService` runs it."""
+    name = "browser"
+    audio = False
+
+    @staticmethod
+    def html(text:str, rate:float=1.0, pitch:float=1.0, volume:float=1.0, voice_hint:str="") -> str:
+        """Speak / Stop buttons reading ``text`` with the browser's speech synthesis (for ``components.html``)."""
+        payload = dict(text=text or "", rate=rate, pitch=pitch, volume=volume, voice_hint=voice_hint)
+        return _WEB_SPEECH.replace("__PAYLOAD__", json.dumps(payload).replace("</", "<\\/"))
+
+BACKENDS = {"elevenlabs": ElevenLabsBackend, "stub": StubBackend}  # server-side audio only
+
+def backend_for(name:str, **kw) -> Backend:
+    if name == BrowserBackend.name:
+        raise ValueError("the browser backend speaks client-side; embed BrowserBackend.html() instead")
+    try:
+        return BACKENDS[name](**kw)
+    except KeyError:
+        raise ValueError(f"unknown TTS backend {name!r} (one of {', '.join(BACKENDS)}, browser)") from None
+
+def server_audio() -> bool:
+    """False when ``INFERNAL_TTS_BACKEND=browser``: the apps then only embed the Web Speech player."""
+    return os.environ.get("INFERNAL_TTS_BACKEND", "elevenlabs") != BrowserBackend.name
+
+# ---------- service ----------
+class TTSService:
+    """One backend behind a :class:`FairGate` and a :class:`CircuitBreaker`, on its own event loop thread."""
+    def __init__(self, backend:Backend, *, limit:int=CONCURRENCY, per_voice:int=PER_VOICE, breaker=None):
+        self.backend = backend
+        self.gate = FairGate(limit, per_voice)
+        self.breaker = breaker or CircuitBreaker()
+        self.counters = dict(calls=0, cache_hits=0, failures=0)
+        self._loop = None
+        self._lock = threading.Lock()
+
+    # ---------- loop ----------
+    @property
+    def loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # blocking HTTP runs here: room for every slot plus the stream / cache hops around them
+                loop.set_default_executor(ThreadPoolExecutor(self.gate.limit + 4, thread_name_prefix="tts-io"))
+                threading.Thread(target=loop.run_forever, name="tts-service", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    # ---------- async API ----------
+    async def _enter(self, session, voice_id):
+        self.counters["calls"] += 1
+        self.breaker.check()
+        await self.gate.acquire(session, voice_id)
+
+    def _exit(self, voice_id, error=None):
+        self.gate.release(voice_id)
+        if error is not None and _unhealthy(error):
+            self.counters["failures"] += 1
+            self.breaker.failure()
+        else:
+            self.breaker.success()  # upstream answered, even if it refused the request
+
+    async def _cached(self, text, voice_id, stability, similarity, style, output_format):
+        # a cache hit reads a file of up to a few MB: off the loop, so other sessions' queues keep moving
+        return await asyncio.to_thread(self.backend.cached, text, voice_id, stability, similarity, style,
+                                       output_format=output_format)
+
+    async def synthesize(self, session, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+                         output_format=None, timing=None) -> bytes:
+        data = await self._cached(text, voice_id, stability, similarity, style, output_format)
+        if data is not None:
+            self.counters["cache_hits"] += 1
+            return data
+        await self._enter(session, voice_id)
+        try:
+            data = await self.backend.synthesize(text, api_key, voice_id, stability, similarity, style,
+                                                 output_format=output_format, timing=timing)
+        except Exception as e:
+            self._exit(voice_id, e)
+            raise
+        self._exit(voice_id)
+        return data
+
+    async def stream(self, session, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+                     output_format=None, timing=None):
+        data = await self._cached(text, voice_id, stability, similarity, style, output_format)
+        if data is not None:
+            self.counters["cache_hits"] += 1
+            yield data
+            return
+        await self._enter(session, voice_id)
+        error = None
+        try:
+            async for chunk in self.backend.stream(text, api_key, voice_id, stability, similarity, style,
+                                                   output_format=output_format, timing=timing):
+                yield chunk
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._exit(voice_id, error)
+
+    # ---------- blocking API (script threads, job workers) ----------
+    def call(self, session, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+             output_format=None, timing=None, **_) -> bytes:
+        """:meth:`synthesize` from a thread. Extra keywords (``cache=``, from :func:`tts_segments`) are ignored:
+        the backend owns its cache."""
+        return self._run(self.synthesize(session, text, api_key, voice_id, stability, similarity, style,
+                                         output_format=output_format, timing=timing))
+
+    def iter_stream(self, session, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *,
+                    output_format=None, timing=None):
+        """:meth:`stream` as a blocking generator; closing it early releases the slot."""
+        agen = self.stream(session, text, api_key, voice_id, stability, similarity, style,
+                           output_format=output_format, timing=timing)
+        try:
+            while True:
+                try:
+                    yield self._run(_anext(agen))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(agen.aclose())
+
+    async def _stats(self):
+        return dict(backend=self.backend.name, breaker=self.breaker.state, **self.counters,
+                    breaker_opened=self.breaker.counters["opened"], rejected=self.breaker.counters["rejected"],
+                    **self.gate.stats())
+
+    def stats(self) -> dict:
+        """Queue and breaker metrics for capacity sizing (from any thread; read on the loop)."""
+        return self._run(self._stats())
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self.backend.close()
+
+async def _anext(agen):
+    return await agen.__anext__()
+
+_default = None
+_default_lock = threading.Lock()
+
+def default_service() -> TTSService:
+    """Process-wide service; ``INFERNAL_TTS_BACKEND`` picks the backend (``elevenlabs`` or ``stub``; ``browser`` has
+    no service: check :func:`server_audio` first)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TTSService(backend_for(os.environ.get("INFERNAL_TTS_BACKEND", "elevenlabs")))
+        return _default
+
+# ---------- self-check ----------
+async def _check_gate():
+    gate, order = FairGate(limit=1, per_voice=1), []
+    await gate.acquire("hold", "v")
+    async def wait(session, voice):
+        await gate.acquire(session, voice)
+        order.append(session)
+    waiters = [asyncio.create_task(wait(s, "v")) for s in ("a", "a", "a", "b", "c")]
+    await asyncio.sleep(0)
+    for _ in range(len(waiters) + 1):
+        gate.release("v")
+        await asyncio.sleep(0)
+    assert order == ["a", "b", "c", "a", "a"], f"round-robin order {order}"
+    assert gate.active == 0 and not gate.depth
+
+    gate = FairGate(limit=4, per_voice=2)
+    for _ in range(2): await gate.acquire("s", "v1")
+    blocked = asyncio.create_task(gate.acquire("s", "v1"))
+    await asyncio.sleep(0)
+    assert not blocked.done() and gate.by_voice == {"v1": 2}, "third call on a voice must wait for its limit"
+    await asyncio.wait_for(gate.acquire("t", "v2"), 1)  # another voice still gets a global slot
+    gate.release("v1")
+    await asyncio.wait_for(blocked, 1)
+    assert gate.by_voice == {"v1": 2, "v2": 1}
+
+def _check_breaker():
+    b = CircuitBreaker(threshold=2, reset_after=0.05)
+    b.failure(); b.check()
+    b.failure()
+    assert b.state == "open"
+    try:
+        b.check()
+        raise AssertionError("an open breaker must refuse calls")
+    except CircuitOpen:
+        pass
+    time.sleep(0.06)
+    assert b.state == "half-open"
+    b.check()  # the one trial call
+    try:
+        b.check()
+        raise AssertionError("only one trial call while half-open")
+    except CircuitOpen:
+        pass
+    b.failure()  # the trial failed: open again
+    assert b.state == "open" and b.counters["opened"] == 2
+    time.sleep(0.06)
+    b.check(); b.success()
+    assert b.state == "closed" and b.failures == 0
+    b.check()
+
+def selfcheck():
+    """Behaviour checks of :class:`FairGate` and :class:`CircuitBreaker` (raises ``AssertionError``)."""
+    asyncio.run(_check_gate())
+    _check_breaker()
+
+if __name__ == "__main__":
+    selfcheck()
+    print("backends self-check ok")
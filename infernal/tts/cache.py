@@ -0,0 +1,181 @@
+"""Content-addressed TTS audio cache: a size-bounded LRU directory on disk behind an in-memory hot tier.
+
+Entries are keyed on the full synthesis request (text, voice id, model id, voice settings, and any other request
+option), so identical requests are answered without a network round trip and any change to the request is a new entry.
+Recency on disk is the file mtime, refreshed on every hit; when the directory grows past ``max_bytes`` the least
+recently used files are removed first.
+
+:func:`default_media` is a second, smaller store of finished clips keyed by the sha256 of their bytes; the audio relay
+serves it by URL (with the key as ETag) so the apps hand the browser a link instead of re-embedding the MP3.
+"""
+import hashlib, json, os, tempfile, threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 256 << 20
+DEFAULT_HOT_BYTES = 16 << 20
+DEFAULT_MEDIA_BYTES = 128 << 20
+_SUFFIX = ".audio"
+
+def audio_key(voice_id:str, payload:dict, **extra) -> str:
+    """sha256 over the canonical JSON of everything that shapes the audio."""
+    doc = {"voice_id": voice_id, "payload": payload, **extra}
+    blob = json.dumps(doc, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+def content_key(data:bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def default_cache_dir() -> str:
+    return os.environ.get("INFERNAL_TTS_CACHE") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "infernal", "tts")
+
+class AudioCache:
+    """Thread-safe two-tier cache of audio bytes by key (see :func:`audio_key`)."""
+    def __init__(self, root:str|None=None, max_bytes:int=DEFAULT_MAX_BYTES, hot_bytes:int=DEFAULT_HOT_BYTES):
+        self.root = root or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hot_bytes = hot_bytes
+        self._hot = OrderedDict()
+        self._hot_size = 0
+        self._lock = threading.Lock()
+        self.counters = dict(hits_hot=0, hits_disk=0, misses=0, puts=0, evictions=0)
+        os.makedirs(self.root, exist_ok=True)
+        self._disk_size = sum(size for _, _, size in self._scan())
+
+    # ---------- paths ----------
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + _SUFFIX)
+
+    def _scan(self):
+        for sub in os.scandir(self.root):
+            if not sub.is_dir(): continue
+            for f in os.scandir(sub.path):
+                if f.name.endswith(_SUFFIX):
+                    try:
+                        st = f.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield f.path, st.st_mtime_ns, st.st_size
+
+    # ---------- hot tier ----------
+    def _remember(self, key, data):
+        if len(data) > self.hot_bytes: return
+        old = self._hot.pop(key, None)
+        if old is not None: self._hot_size -= len(old)
+        self._hot[key] = data
+        self._hot_size += len(data)
+        while self._hot_size > self.hot_bytes:
+            _, dropped = self._hot.popitem(last=False)
+            self._hot_size -= len(dropped)
+
+    # ---------- API ----------
+    def get(self, key:str, *, count:bool=True) -> bytes|None:
+        """Bytes under ``key`` or ``None``; ``count=False`` probes without touching the hit / miss counters."""
+        with self._lock:
+            data = self._hot.get(key)
+            if data is not None:
+                self._hot.move_to_end(key)
+                if count: self.counters["hits_hot"] += 1
+                return data
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            if count:
+                with self._lock:
+                    self.counters["misses"] += 1
+            return None
+        try:
+            os.utime(path)  # recency for eviction
+        except FileNotFoundError:
+            pass  # evicted after the read: the bytes are still good
+        with self._lock:
+            if count: self.counters["hits_disk"] += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key:str, data:bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            try:
+                old = os.path.getsize(path)
+            except FileNotFoundError:
+                old = 0
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)  # never counted in _disk_size, so eviction would never find it
+            raise
+        with self._lock:
+            self.counters["puts"] += 1
+            self._disk_size += len(data) - old
+            self._remember(key, data)
+            over = self._disk_size > self.max_bytes
+        if over:
+            self._evict()
+
+    def get_or_create(self, key:str, make) -> bytes:
+        """Cached bytes for ``key``, or ``make()`` stored under it."""
+        data = self.get(key)
+        if data is None:
+            data = make()
+            self.put(key, data)
+        return data
+
+    def _evict(self):
+        # oldest mtime first until the directory is back under 90% of the cap
+        target = self.max_bytes * 9 // 10
+        for path, _, size in sorted(self._scan(), key=lambda e: e[1]):
+            with self._lock:
+                if self._disk_size <= target: break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            key = os.path.basename(path)[:-len(_SUFFIX)]
+            with self._lock:
+                self._disk_size -= size
+                self.counters["evictions"] += 1
+                dropped = self._hot.pop(key, None)
+                if dropped is not None: self._hot_size -= len(dropped)
+
+    def stats(self) -> dict:
+        with self._lock:
+            c = dict(self.counters)
+            lookups = c["hits_hot"] + c["hits_disk"] + c["misses"]
+            c.update(hit_rate=(c["hits_hot"] + c["hits_disk"]) / lookups if lookups else 0.0,
+                     disk_bytes=self._disk_size, hot_bytes=self._hot_size, hot_entries=len(self._hot))
+        return c
+
+    def clear(self):
+        for path, _, _ in list(self._scan()):
+            try: os.remove(path)
+            except FileNotFoundError: pass
+        with self._lock:
+            self._hot.clear(); self._hot_size = 0; self._disk_size = 0
+
+_default = None
+_default_lock = threading.Lock()
+
+def default_cache() -> AudioCache:
+    """Process-wide cache under :func:`default_cache_dir` (``INFERNAL_TTS_CACHE`` overrides the location)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = AudioCache()
+        return _default
+
+_media = None
+
+def default_media() -> AudioCache:
+    """Process-wide content-addressed store of finished clips, next to the cache directory (``tts-media``)."""
+    global _media
+    with _default_lock:
+        if _media is None:
+            root = os.path.join(os.path.dirname(os.path.abspath(default_cache_dir())), "tts-media")
+            _media = AudioCache(root, max_bytes=DEFAULT_MEDIA_BYTES, hot_bytes=DEFAULT_HOT_BYTES)
+        return _media
@@ -0,0 +1,156 @@
+"""Pooled, retrying HTTP client for the ElevenLabs text-to-speech API.
+
+One keep-alive ``requests.Session`` per client (connections are reused instead of paying TCP + TLS per request),
+separate connect / read timeouts, and retries on 429 / 5xx and on failed connects with full-jitter exponential backoff
+that honours ``Retry-After``. A request whose body may already have been processed (read timeout, dropped response) is
+not retried, since synthesis is billed per call. ``ELEVENLABS_BASE_URL`` points the default client at a stand-in server.
+
+Every synthesis appends a timing record to ``client.timings`` (time to first audio byte and total time, both including
+retries, plus bytes received); ``stream`` yields audio from the chunked ``/stream`` endpoint as it arrives.
+"""
+import os, random, threading, time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+ELEVEN_URL = "https://api.elevenlabs.io"
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+class TTSClient:
+    def __init__(self, base_url:str|None=None, *, pool_size:int=8, connect_timeout:float=3.05, read_timeout:float=60.0,
+                 retries:int=3, backoff:float=0.5, max_backoff:float=8.0, max_retry_after:float=30.0, verify=True):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.base_url = (base_url or os.environ.get("ELEVENLABS_BASE_URL") or ELEVEN_URL).rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries, self.backoff, self.max_backoff, self.max_retry_after = retries, backoff, max_backoff, max_retry_after
+        self.session = requests.Session()
+        self.verify = verify  # per request: a session-level value loses to REQUESTS_CA_BUNDLE
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._jitter = random.Random()  # never touch the global stream the persona translators draw from
+        self._lock = threading.Lock()
+        self.counters = dict(requests=0, retries=0, failures=0)
+        self.timings = deque(maxlen=256)
+
+    # ---------- backoff ----------
+    def _retry_after(self, value):
+        if not value: return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+
+    def _delay(self, attempt, retry_after=None):
+        ra = self._retry_after(retry_after)
+        if ra is not None:
+            return min(max(0.0, ra), self.max_retry_after)
+        with self._lock:
+            return self._jitter.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    # ---------- requests ----------
+    def request(self, method:str, path:str, *, stream=False, **kw):
+        """``session.request`` with timeouts and retries; returns the response (status < 400) or raises."""
+        import requests
+
+        url = self.base_url + path
+        kw.setdefault("timeout", self.timeout)
+        kw.setdefault("verify", self.verify)
+        for attempt in range(self.retries + 1):
+            self._count("requests")
+            try:
+                r = self.session.request(method, url, stream=stream, **kw)
+            except requests.ConnectionError as e:
+                # only a failed connect is safe to resend: a dropped response may already have been billed
+                if attempt == self.retries or not _connect_failed(e):
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                time.sleep(self._delay(attempt))
+                continue
+            except requests.RequestException:
+                self._count("failures")
+                raise
+            if r.status_code in RETRY_STATUS and attempt < self.retries:
+                delay = self._delay(attempt, r.headers.get("Retry-After"))
+                r.close()
+                self._count("retries")
+                time.sleep(delay)
+                continue
+            if r.status_code >= 400:
+                self._count("failures")
+            r.raise_for_status()
+            return r
+
+    # ---------- synthesis ----------
+    def _chunks(self, path, api_key, voice_id, payload, accept, params, chunk_size, timing, kind):
+        t = timing if timing is not None else {}
+        t.update(kind=kind, voice_id=voice_id, chars=len(payload.get("text", "")), ttfb_s=None, total_s=None, bytes=0)
+        with self._lock:
+            self.timings.append(t)
+        t0 = time.perf_counter()
+        headers = {"xi-api-key": api_key, "accept": accept}
+        with self.request("POST", path, stream=True, json=payload, headers=headers, params=params) as r:
+            for chunk in r.iter_content(chunk_size):
+                if not chunk: continue
+                if t["ttfb_s"] is None:
+                    t["ttfb_s"] = time.perf_counter() - t0
+                t["bytes"] += len(chunk)
+                yield chunk
+        t["total_s"] = time.perf_counter() - t0
+
+    def synthesize(self, api_key:str, voice_id:str, payload:dict, *, accept="audio/mpeg", params=None,
+                   timing:dict|None=None) -> bytes:
+        """POST ``/v1/text-to-speech/{voice_id}`` and return the audio bytes (``timing`` is filled in, if given)."""
+        return b"".join(self._chunks(f"/v1/text-to-speech/{voice_id}", api_key, voice_id, payload, accept, params,
+                                     1 << 16, timing, "full"))
+
+    def stream(self, api_key:str, voice_id:str, payload:dict, *, accept="audio/mpeg", params=None,
+               chunk_size:int=4096, timing:dict|None=None):
+        """Generator over audio chunks from ``/v1/text-to-speech/{voice_id}/stream`` as the server produces them."""
+        return self._chunks(f"/v1/text-to-speech/{voice_id}/stream", api_key, voice_id, payload, accept, params,
+                            chunk_size, timing, "stream")
+
+    def close(self):
+        self.session.close()
+
+def _connect_failed(exc):
+    # requests wraps urllib3's NewConnectionError / ConnectTimeoutError (possibly inside MaxRetryError)
+    import urllib3
+
+    seen = exc
+    while seen is not None:
+        if isinstance(seen, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError)):
+            return True
+        reason = getattr(seen, "reason", None)
+        if not isinstance(reason, BaseException):
+            reason = seen.args[0] if seen.args and isinstance(seen.args[0], BaseException) else None
+        seen = reason if reason is not seen else None
+    return False
+
+_default = None
+_default_lock = threading.Lock()
+
+def default_client() -> TTSClient:
+    """Process-wide client (one connection pool shared by every session)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TTSClient()
+        return _default
+
+def use_client(client:TTSClient|None) -> TTSClient|None:
+    """Replace the process-wide client (e.g. one pointed at a stub for a load test); returns the previous one."""
+    global _default
+    with _default_lock:
+        old, _default = _default, client
+        return old
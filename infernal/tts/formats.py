@@ -0,0 +1,51 @@
+"""Audio output formats: what to ask ElevenLabs for, per use case, and local transcoding between them.
+
+``output_format`` is sent as the query parameter of the same name. Every format other than the upstream default
+(``mp3_44100_128``) is its own cache entry. When ``ffmpeg`` is available (``INFERNAL_FFMPEG`` names another binary,
+``off`` disables it), a lower-quality variant is transcoded locally from a higher-quality master already in the cache,
+so it costs no upstream call.
+"""
+import os, shutil, subprocess
+
+FORMATS = {  # output_format -> (sample rate, kbps)
+    "mp3_22050_32": (22050, 32),
+    "mp3_44100_32": (44100, 32),
+    "mp3_44100_64": (44100, 64),
+    "mp3_44100_96": (44100, 96),
+    "mp3_44100_128": (44100, 128),
+    "mp3_44100_192": (44100, 192),
+}
+DEFAULT_FORMAT = "mp3_44100_128"
+PRESETS = {
+    "preview": "mp3_22050_32",    # Quick Test, prefetch-sized snippets
+    "mobile": "mp3_44100_64",     # playback on metered connections
+    "standard": DEFAULT_FORMAT,   # playback
+    "download": "mp3_44100_192",  # files people keep
+}
+
+def format_for(use:str) -> str:
+    """Output format of a preset name, or ``use`` itself if it already is a format."""
+    fmt = PRESETS.get(use, use)
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown output format {use!r}")
+    return fmt
+
+def masters(fmt:str) -> list:
+    """Formats a ``fmt`` variant can be derived from (better in rate and bitrate), best first."""
+    rate, kbps = FORMATS[fmt]
+    better = [f for f, (r, k) in FORMATS.items() if r >= rate and k >= kbps and f != fmt]
+    return sorted(better, key=lambda f: FORMATS[f], reverse=True)
+
+def ffmpeg() -> str|None:
+    name = os.environ.get("INFERNAL_FFMPEG", "ffmpeg")
+    return None if name.lower() in ("", "0", "off", "no") else shutil.which(name)
+
+def transcode(data:bytes, fmt:str, timeout:float=60.0) -> bytes:
+    """Re-encode MP3 ``data`` as ``fmt`` with ffmpeg (raises ``OSError`` / ``subprocess.SubprocessError``)."""
+    exe = ffmpeg()
+    if exe is None:
+        raise FileNotFoundError("ffmpeg not found")
+    rate, kbps = FORMATS[fmt]
+    cmd = [exe, "-hide_banner", "-loglevel", "error", "-i", "pipe:0", "-vn", "-map_metadata", "-1",
+           "-ar", str(rate), "-b:a", f"{kbps}k", "-f", "mp3", "pipe:1"]
+    return subprocess.run(cmd, input=data, capture_output=True, timeout=timeout, check=True).stdout
@@ -0,0 +1,224 @@
+"""Background TTS jobs shared by every Streamlit session.
+
+Synthesis runs on one process-wide thread pool instead of the script thread, so a session stays responsive while its
+audio is generated. The app keeps only the job id in ``st.session_state`` and polls :class:`Job` for progress.
+
+    job_id = default_jobs().submit_tts(stylized, api_key, voice_id, mode="segments", **params)
+    job = default_jobs().get(job_id)     # .done / .error / .progress() / .data() / .follow()
+    default_jobs().cancel(job_id)
+
+Identical requests (same account, text, voice, settings and mode) that are still in flight are coalesced: the second submitter
+gets the first one's job id and no second upstream call is made. ``cancel`` detaches one submitter; the job only stops,
+at its next chunk, once nobody is waiting for it. A session moving to a new request passes its previous job id as
+``replaces`` so the swap is atomic: resubmitting the running request keeps it going instead of cancelling it first. ``INFERNAL_TTS_WORKERS`` sizes the pool (default 4).
+
+A finished clip is written once to the content-addressed media store (:func:`~infernal.tts.cache.default_media`) and
+``job.media_key`` names it; the job then lets go of its in-memory chunks as soon as no relay reader is following them.
+
+Upstream calls go through a :class:`~infernal.tts.backends.TTSService` (default: :func:`default_service`), which
+queues them fairly by ``session`` under its concurrency limits and circuit breaker.
+"""
+import hashlib, os, secrets, threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from .cache import audio_key, content_key, default_media
+
+WORKERS = int(os.environ.get("INFERNAL_TTS_WORKERS", "4"))
+
+class Job:
+    """Audio chunks of one synthesis, appended by the worker and followed by any number of readers."""
+    def __init__(self, key=None, timing=None, store=None):
+        self.key = key
+        self.timing = timing if timing is not None else {}
+        self.store = store
+        self.done = False
+        self.cancelled = False
+        self.error = None
+        self.media_key = None
+        self.subscribers = 1
+        self._chunks = []
+        self._size = 0
+        self._followers = 0
+        self._cond = threading.Condition()
+
+    def _run(self, make):
+        chunks = None
+        try:
+            chunks = iter(make())
+            for chunk in chunks:
+                if self.cancelled: break
+                with self._cond:
+                    self._chunks.append(chunk)
+                    self._size += len(chunk)
+                    self._cond.notify_all()
+            if self.store is not None and not self.cancelled:
+                data = b"".join(self._chunks)
+                key = content_key(data)
+                self.store.put(key, data)
+                self.media_key = key
+        except Exception as e:
+            self.error = e
+        finally:
+            close = getattr(chunks, "close", None)
+            if close: close()  # a generator releases its HTTP response / segment pool
+            with self._cond:
+                self.done = True
+                self._release()
+                self._cond.notify_all()
+
+    def _release(self):
+        # called with the condition held: the media store has the clip and nobody is reading the chunks
+        if self.done and self.media_key is not None and not self._followers:
+            self._chunks = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def ok(self) -> bool:
+        return self.done and self.error is None and not self.cancelled
+
+    def progress(self) -> float|None:
+        """Fraction complete when the job knows its size (segmented synthesis), else ``None`` until done."""
+        if self.done: return 1.0
+        n = self.timing.get("segments")
+        return self.timing.get("segments_done", 0) / n if n else None
+
+    def follow(self):
+        """Every chunk so far, then new ones as they arrive, until the worker finishes (``None`` once released)."""
+        with self._cond:
+            if self._chunks is None: return None
+            self._followers += 1
+        return self._follow()
+
+    def _follow(self):
+        i = 0
+        try:
+            while True:
+                with self._cond:
+                    while i == len(self._chunks) and not self.done:
+                        self._cond.wait()
+                    new, finished = self._chunks[i:], self.done
+                i += len(new)
+                yield from new
+                if finished: return  # nothing is appended after done
+        finally:
+            with self._cond:
+                self._followers -= 1
+                self._release()
+
+    def data(self) -> bytes|None:
+        """The complete audio, or ``None`` while running / after a failure or cancellation."""
+        with self._cond:
+            if not self.ok: return None
+            if self._chunks is not None: return b"".join(self._chunks)
+        return self.store.get(self.media_key)
+
+def tts_job_key(text, voice_id, stability=0.5, similarity=0.8, style=0.3, *, mode="stream", output_format=None,
+                api_key:str|None=None) -> str:
+    """Coalescing key of a :meth:`JobManager.submit_tts` request. With ``api_key`` the key is scoped to that account
+    (by a hash, never the key itself), so one account's request never joins a job billed to another."""
+    from . import tts_payload
+
+    key = audio_key(voice_id, tts_payload(text, stability, similarity, style), mode=mode, output_format=output_format)
+    if api_key is None: return key
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16] + ":" + key
+
+class JobManager:
+    """Shared executor plus a registry of the ``keep`` most recent jobs."""
+    def __init__(self, workers:int=WORKERS, keep:int=64, store=None, service=None):
+        self.keep = keep
+        self.store = store if store is not None else default_media()
+        self.service = service
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-job")
+        self._jobs = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.counters = dict(submitted=0, coalesced=0, cancelled=0)
+
+    def submit(self, make, key=None, timing:dict|None=None, replaces:str|None=None) -> str:
+        """Run ``make()`` (an iterable of audio chunks) in the background; returns the job id. An unfinished job
+        with the same ``key`` is joined instead of starting another; the submitter then leaves ``replaces``."""
+        with self._lock:
+            job_id = self._inflight.get(key) if key is not None else None
+            job = self._jobs.get(job_id)
+            if job is not None and not job.done and not job.cancelled:
+                if job_id != replaces:
+                    job.subscribers += 1
+                    self._detach(replaces)
+                self.counters["coalesced"] += 1
+                return job_id
+            self._detach(replaces)
+            job_id, job = secrets.token_hex(16), Job(key, timing, self.store)
+            self._jobs[job_id] = job
+            if key is not None:
+                self._inflight[key] = job_id
+            self.counters["submitted"] += 1
+            for old in [i for i, j in self._jobs.items() if j.done][:max(0, len(self._jobs) - self.keep)]:
+                del self._jobs[old]
+        self._pool.submit(self._run, job_id, job, make)
+        return job_id
+
+    def _run(self, job_id, job, make):
+        try:
+            job._run(make)
+        finally:
+            with self._lock:
+                if job.key is not None and self._inflight.get(job.key) == job_id:
+                    del self._inflight[job.key]
+
+    def submit_tts(self, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *, mode="stream",
+                   output_format:str|None=None, session=None, timing:dict|None=None, replaces:str|None=None) -> str:
+        """Background streamed (``mode="stream"``), segmented (``"segments"``) or whole-file (``"full"``) synthesis
+        through the service, queued as ``session`` and coalesced with identical in-flight requests."""
+        from .backends import default_service
+        from .segments import tts_segments
+
+        svc = self.service or default_service()
+        timing = timing if timing is not None else {}
+        key = tts_job_key(text, voice_id, stability, similarity, style, mode=mode, output_format=output_format,
+                          api_key=api_key)
+        args = (text, api_key, voice_id, stability, similarity, style)
+        if mode == "stream":
+            make = lambda: svc.iter_stream(session, *args, output_format=output_format, timing=timing)
+        elif mode == "segments":
+            make = lambda: tts_segments(*args, output_format=output_format, timing=timing, synth=partial(svc.call, session))
+        elif mode == "full":
+            make = lambda: (svc.call(session, *args, output_format=output_format, timing=timing),)
+        else:
+            raise ValueError(f"unknown mode {mode!r}")
+        return self.submit(make, key, timing, replaces)
+
+    def get(self, job_id:str|None) -> Job|None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id:str):
+        """Detach one submitter; the job stops once it has none left."""
+        with self._lock:
+            self._detach(job_id)
+
+    def _detach(self, job_id):
+        # called with the lock held
+        job = self._jobs.get(job_id)
+        if job is None or job.done: return
+        job.subscribers -= 1
+        if job.subscribers <= 0:
+            job.cancelled = True
+            self.counters["cancelled"] += 1
+            if self._inflight.get(job.key) == job_id:
+                del self._inflight[job.key]
+
+_default = None
+_default_lock = threading.Lock()
+
+def default_jobs() -> JobManager:
+    """Process-wide job manager (one executor for every session)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = JobManager()
+        return _default
@@ -0,0 +1,207 @@
+"""TTS load test: N concurrent sessions driving the apps' synthesis path against a stand-in server.
+
+    python -m infernal.tts.loadtest                               # in-process stub, 8 sessions x 20 requests
+    python -m infernal.tts.loadtest --sessions 32 --mode stream --error-rate 0.05 --disconnect-rate 0.02 -o run.json
+    python -m infernal.tts.loadtest --url http://127.0.0.1:8765   # a stub started with python -m infernal.tts.stub
+
+Every session is a thread that speaks passages drawn from a fixed pool of stylized texts, with Zipf-weighted
+popularity so that some requests repeat (``--speakable`` sends their speakable renditions instead, as the apps do,
+and reports the change in characters and bytes sent). ``--limit`` routes every call through a
+:class:`~infernal.tts.backends.TTSService` with that global concurrency (``--per-voice`` per voice), one queue per
+session, and adds its queue depth and wait percentiles to the report: the numbers for sizing those limits. Each request goes through the same functions the voice apps use
+(``tts_elevenlabs`` / ``tts_stream`` / ``tts_segments``) with a shared pooled client and a fresh on-disk cache. The
+report covers throughput, latency and time to first audio percentiles (upstream only: cache hits are left out), errors
+by type, client retries and cache effectiveness. No real API credits are spent unless ``--url`` points at the real service.
+"""
+import argparse, json, random, tempfile, threading, time
+from collections import Counter
+from functools import partial
+
+from .. import continuous
+from ..speech import speakable, speech_savings
+from ..bench import corpus
+from . import tts_elevenlabs, tts_stream
+from .backends import ElevenLabsBackend, TTSService
+from .cache import AudioCache
+from .client import TTSClient, use_client
+from .formats import DEFAULT_FORMAT, format_for
+from .segments import tts_segments
+
+MODES = ("full", "stream", "segments")
+
+def text_pool(n:int, seed:int=11) -> list:
+    """``n`` stylized passages of 60..900 characters at assorted corruption levels."""
+    rnd = random.Random(seed)
+    return [continuous.stylize_sentence(corpus(rnd.randint(60, 900), seed=seed + i), rnd.randint(0, 100))[0]
+            for i in range(n)]
+
+def _pct(vals, q):
+    return sorted(vals)[min(len(vals) - 1, int(q * len(vals)))] * 1e3 if vals else None
+
+def _share(flags):
+    return sum(flags) / len(flags) if flags else None
+
+def _call(mode, text, cache, timing, output_format=None, service=None, session=None):
+    # the apps' paths; "stream" drains the generator the way the relay does
+    if service is not None:
+        args = (text, "load-test", "stub-voice")
+        if mode == "full":
+            return service.call(session, *args, output_format=output_format, timing=timing)
+        if mode == "stream":
+            return b"".join(service.iter_stream(session, *args, output_format=output_format, timing=timing))
+        return b"".join(tts_segments(*args, output_format=output_format, timing=timing,
+                                     synth=partial(service.call, session)))
+    if mode == "full":
+        return tts_elevenlabs(text, "load-test", "stub-voice", output_format=output_format, cache=cache, timing=timing)
+    make = tts_stream if mode == "stream" else tts_segments
+    return b"".join(make(text, "load-test", "stub-voice", output_format=output_format, cache=cache, timing=timing))
+
+def run(url:str, *, sessions:int=8, requests:int=20, mode:str="full", texts:int=40, zipf:float=1.1,
+        think:float=0.0, seed:int=0, cache_dir:str|None=None, output_format:str|None=None,
+        speak:bool=False, limit:int|None=None, per_voice:int|None=None) -> dict:
+    pool = text_pool(texts)
+    speech = None
+    if speak:
+        sv = [speech_savings(t) for t in pool]
+        total = lambda k: sum(v[k] for v in sv)
+        speech = dict(chars=total("spoken") / total("stylized") - 1, bytes=total("spoken_bytes") / total("stylized_bytes") - 1)
+        pool = [speakable(t) for t in pool]
+    weights = [1 / (k + 1) ** zipf for k in range(len(pool))]
+    cache = AudioCache(cache_dir or tempfile.mkdtemp(prefix="tts-load-"))
+    client = TTSClient(url, pool_size=max(8, sessions), backoff=0.2, max_retry_after=5.0)
+    previous = use_client(client)
+    service = None
+    if limit:
+        service = TTSService(ElevenLabsBackend(client=client, cache=cache), limit=limit, per_voice=per_voice or limit)
+    rows, lock = [], threading.Lock()
+
+    def session(i):
+        rnd = random.Random(seed * 1000 + i)
+        for _ in range(requests):
+            text = rnd.choices(pool, weights)[0]
+            timing = {}
+            t0 = time.perf_counter()
+            try:
+                audio = _call(mode, text, cache, timing, output_format, service, f"load-{i}")
+                err = None
+            except Exception as e:
+                audio, err = b"", type(e).__name__
+            # no timing at all: tts_elevenlabs answered from the cache; segmented requests mix both, per segment
+            kind = timing.get("kind", "cache")
+            if kind == "segments":
+                ttfb, upstream = timing.get("upstream_ttfb_s"), timing.get("upstream_segments", 0) > 0
+            else:
+                ttfb, upstream = None if kind == "cache" else timing.get("ttfb_s"), kind != "cache"
+            row = dict(chars=len(text), bytes=len(audio), latency_s=time.perf_counter() - t0, error=err,
+                       ttfb_s=ttfb, upstream=upstream)  # first audio: upstream only
+            with lock:
+                rows.append(row)
+            if think: time.sleep(rnd.expovariate(1 / think))
+
+    t0 = time.perf_counter()
+    try:
+        threads = [threading.Thread(target=session, args=(i,), name=f"load-{i}") for i in range(sessions)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+    finally:
+        wall = time.perf_counter() - t0
+        queue = service.stats() if service else None
+        if service: service.close()
+        use_client(previous)
+        client.close()
+
+    ok = [r for r in rows if r["error"] is None]
+    lat = [r["latency_s"] for r in ok]
+    ttfb = [r["ttfb_s"] for r in ok if r["ttfb_s"] is not None]
+    cs = cache.stats()
+    return {
+        "mode": mode, "format": output_format or DEFAULT_FORMAT, "sessions": sessions, "requests": len(rows), "ok": len(ok), "wall_s": wall,
+        "req_per_s": len(ok) / wall, "chars_per_s": sum(r["chars"] for r in ok) / wall,
+        "audio_mb_per_s": sum(r["bytes"] for r in ok) / wall / 1e6, "speakable": speech,
+        "p50_ms": _pct(lat, 0.50), "p95_ms": _pct(lat, 0.95), "p99_ms": _pct(lat, 0.99),
+        "ttfb_p50_ms": _pct(ttfb, 0.50), "ttfb_p95_ms": _pct(ttfb, 0.95),
+        "errors": dict(Counter(r["error"] for r in rows if r["error"])),
+        "served_without_upstream": _share([r["upstream"] is False for r in ok if r["upstream"] is not None]),
+        "client": dict(client.counters), "queue": queue,
+        "cache": {k: cs[k] for k in ("hits_hot", "hits_disk", "misses", "puts", "hit_rate", "disk_bytes")},
+    }
+
+def _fmt(r):
+    ms = lambda v: "-" if v is None else f"{v:.0f}"
+    lines = [
+        f"{r['mode']} ({r['format']}): {r['sessions']} sessions, {r['ok']}/{r['requests']} ok in {r['wall_s']:.1f} s",
+        f"  throughput  {r['req_per_s']:.1f} req/s  {r['chars_per_s']:.0f} chars/s  {r['audio_mb_per_s']:.2f} MB/s audio",
+        f"  latency     p50 {ms(r['p50_ms'])} ms  p95 {ms(r['p95_ms'])} ms  p99 {ms(r['p99_ms'])} ms",
+        f"  first audio p50 {ms(r['ttfb_p50_ms'])} ms  p95 {ms(r['ttfb_p95_ms'])} ms",
+        f"  cache       hit rate {r['cache']['hit_rate']:.0%}  served without upstream "
+        f"{'-' if r['served_without_upstream'] is None else format(r['served_without_upstream'], '.0%')}",
+        f"  client      {r['client']}  errors {r['errors'] or '-'}",
+    ]
+    if r["queue"] is not None:
+        q, ms = r["queue"], (lambda v: "-" if v is None else f"{v:.0f}")
+        lines.append(f"  queue       limit {q['limit']} ({q['per_voice']}/voice)  max depth {q['max_depth']}  "
+                     f"wait p50 {ms(q['wait_p50_ms'])} ms  p95 {ms(q['wait_p95_ms'])} ms  breaker {q['breaker']}")
+    if r["speakable"] is not None:
+        lines.insert(2, f"  speakable   {r['speakable']['chars']:+.1%} characters, {r['speakable']['bytes']:+.1%} bytes "
+                        f"vs the stylized pool")
+    return "\n".join(lines)
+
+def main(argv=None):
+    from .stub import StubServer
+
+    ap = argparse.ArgumentParser(prog="python -m infernal.tts.loadtest", description=__doc__.splitlines()[0])
+    ap.add_argument("--url", default=None, help="server to load (default: start an in-process stub)")
+    ap.add_argument("--sessions", type=int, default=8)
+    ap.add_argument("--requests", type=int, default=20, help="requests per session")
+    ap.add_argument("--mode", default="full", help="comma list of " + ", ".join(MODES))
+    ap.add_argument("--texts", type=int, default=40, help="distinct passages in the pool")
+    ap.add_argument("--zipf", type=float, default=1.1, help="popularity skew of the pool (0 = uniform)")
+    ap.add_argument("--think", type=float, default=0.0, help="mean seconds between a session's requests")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--speakable", action="store_true", help="send the speakable renditions, as the apps do")
+    ap.add_argument("--limit", type=int, default=None, help="route through a TTS service with this concurrency")
+    ap.add_argument("--per-voice", type=int, default=None, help="its per-voice limit (default: --limit)")
+    ap.add_argument("--format", default=None, help="output format or preset (preview, mobile, standard, download)")
+    g = ap.add_argument_group("in-process stub")
+    g.add_argument("--latency", type=float, default=0.3)
+    g.add_argument("--jitter", type=float, default=0.5)
+    g.add_argument("--char-latency", type=float, default=0.0005)
+    g.add_argument("--error-rate", type=float, default=0.0)
+    g.add_argument("--disconnect-rate", type=float, default=0.0)
+    g.add_argument("--size-jitter", type=float, default=0.1)
+    g.add_argument("--chunk-delay", type=float, default=0.02)
+    ap.add_argument("-o", "--output", default=None, help="write the results as JSON")
+    args = ap.parse_args(argv)
+
+    try:
+        fmt = format_for(args.format) if args.format else None
+    except ValueError as e:
+        ap.error(str(e))
+    modes = args.mode.split(",")
+    for m in modes:
+        if m not in MODES: ap.error(f"unknown mode {m!r}")
+    stub = None
+    if args.url is None:
+        stub = StubServer(latency=args.latency, jitter=args.jitter, char_latency=args.char_latency,
+                          error_rate=args.error_rate, retry_after=0, disconnect_rate=args.disconnect_rate,
+                          size_jitter=args.size_jitter, chunk_delay=args.chunk_delay, seed=args.seed).start()
+    results = []
+    try:
+        for m in modes:
+            before = dict(stub.counters) if stub else {}
+            r = run(args.url or stub.url, sessions=args.sessions, requests=args.requests, mode=m, texts=args.texts,
+                    zipf=args.zipf, think=args.think, seed=args.seed, output_format=fmt,
+                    speak=args.speakable, limit=args.limit, per_voice=args.per_voice)
+            if stub:
+                r["stub"] = {k: v - before[k] for k, v in stub.counters.items()}
+            results.append(r)
+            print(_fmt(r))
+    finally:
+        if stub: stub.stop()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+        print(f"wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""MPEG-1/2 Layer III framing: enough to join clips on frame boundaries and to build silent test audio.
+
+Only the 4-byte frame headers are parsed (bitrate, sample rate, padding). ID3v2 tags are skipped by their declared size,
+and a Xing/Info header frame (VBR / LAME metadata) is recognised so it can be dropped when clips are concatenated.
+"""
+_BITRATE = {  # kbps by bitrate index, Layer III
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # MPEG-1
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),      # MPEG-2 (and 2.5)
+}
+_RATE = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def frame_len(h) -> int:
+    """Length of the Layer III frame whose 4-byte header is ``h``, or 0 if it is not a valid header."""
+    if h[0] != 0xFF or h[1] & 0xE0 != 0xE0: return 0
+    version, layer = (h[1] >> 3) & 3, (h[1] >> 1) & 3
+    bi, si, pad = h[2] >> 4, (h[2] >> 2) & 3, (h[2] >> 1) & 1
+    if version == 1 or layer != 1 or bi in (0, 15) or si == 3: return 0
+    br = _BITRATE[3 if version == 3 else 2][bi] * 1000
+    sr = _RATE[version][si]
+    return (144 if version == 3 else 72) * br // sr + pad
+
+def _is_info(data, pos, h):
+    # Xing / Info (VBR / LAME) header sits right after the side information of the first frame
+    mono = h[3] >> 6 == 3
+    off = (21 if mono else 36) if (h[1] >> 3) & 3 == 3 else (13 if mono else 21)
+    return data[pos + off:pos + off + 4] in (b"Xing", b"Info")
+
+def _id3v2_len(data):
+    if data[:3] != b"ID3" or len(data) < 10: return 0
+    size = 0
+    for b in data[6:10]:
+        size = size << 7 | (b & 0x7F)
+    return 10 + size + (10 if data[5] & 0x10 else 0)
+
+def frames(data:bytes) -> tuple:
+    """``(id3, audio)``: the leading ID3v2 tag and the run of complete MPEG audio frames (Xing/Info frame dropped)."""
+    tag = _id3v2_len(data)
+    pos, n = tag, len(data)
+    while pos + 4 <= n and not frame_len(data[pos:pos + 4]):
+        pos += 1  # resync on the first frame header
+    start = pos
+    if pos + 4 <= n and _is_info(data, pos, data[pos:pos + 4]):
+        start = pos = pos + frame_len(data[pos:pos + 4])
+    while pos + 4 <= n:
+        size = frame_len(data[pos:pos + 4])
+        if not size or pos + size > n: break
+        pos += size
+    return data[:tag], data[start:pos]
+
+def join_mp3(parts) -> bytes:
+    """Concatenate MP3 files on frame boundaries, keeping only the first file's ID3v2 tag."""
+    out = []
+    for i, part in enumerate(parts):
+        tag, audio = frames(part)
+        if i == 0: out.append(tag)
+        out.append(audio)
+    return b"".join(out)
+
+def frame_header(rate:int, kbps:int, mono:bool=False) -> bytes:
+    """Header of an unpadded, CRC-less Layer III frame at ``rate`` Hz and ``kbps`` (MPEG-1 or MPEG-2 by rate)."""
+    version = next(v for v, rates in _RATE.items() if rate in rates)
+    bi = _BITRATE[3 if version == 3 else 2].index(kbps)
+    si = _RATE[version].index(rate)
+    return bytes((0xFF, 0xE0 | version << 3 | 1 << 1 | 1, bi << 4 | si << 2, 0xC4 if mono else 0x64))
+
+def samples_per_frame(rate:int) -> int:
+    return 1152 if rate in _RATE[3] else 576
@@ -0,0 +1,114 @@
+"""Speculative TTS prefetch: synthesize into the audio cache once the input has settled.
+
+Opt-in per session. Every rerun reports the request the Generate button *would* send (:meth:`Prefetcher.observe`);
+a polling fragment calls :meth:`Prefetcher.tick`, which submits it as a background job (:mod:`infernal.tts.jobs`)
+once it has been unchanged for ``debounce`` seconds. A later click on the same request either joins the still running
+job or is a cache hit. Spending is bounded by a per-session character budget and a global cap on prefetches in flight.
+
+Accounting, per session and process-wide: ``issued`` prefetches, ``hits`` (a click on a prefetched request),
+``misses`` (a click on anything else) and ``wasted`` (the input moved on from a prefetched request without a click).
+"""
+import threading, time
+
+from .jobs import default_jobs, tts_job_key
+
+DEBOUNCE = 1.5        # seconds the request must stay unchanged
+SESSION_CHARS = 5000  # characters a session may prefetch
+MAX_INFLIGHT = 2      # prefetch jobs running at once, all sessions together
+PREFETCH_SESSION = "prefetch"
+
+class Prefetcher:
+    def __init__(self, jobs=None, *, debounce:float=DEBOUNCE, session_chars:int=SESSION_CHARS,
+                 max_inflight:int=MAX_INFLIGHT):
+        self.jobs = jobs or default_jobs()
+        self.debounce, self.session_chars, self.max_inflight = debounce, session_chars, max_inflight
+        self._inflight = set()
+        self._lock = threading.Lock()
+        self.counters = dict(issued=0, hits=0, misses=0, wasted=0, skipped_budget=0, skipped_busy=0, chars=0)
+
+    @staticmethod
+    def session(state) -> dict:
+        """Per-session bookkeeping kept in ``state`` (``st.session_state``)."""
+        return state.setdefault("tts_prefetch", dict(key=None, since=0.0, pending=set(), spent=set(), skipped=None, chars=0,
+                                                     issued=0, hits=0, misses=0, wasted=0))
+
+    def _bump(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def observe(self, state, text, voice_id, stability=0.5, similarity=0.8, style=0.3, *, mode="stream",
+                output_format=None):
+        """Record the current request; restarts the debounce window when it changed."""
+        s = self.session(state)
+        key = tts_job_key(text, voice_id, stability, similarity, style, mode=mode, output_format=output_format)
+        if key != s["key"]:
+            if s["key"] in s["pending"]:
+                s["pending"].discard(s["key"])
+                s["wasted"] += 1
+                self._bump("wasted")
+            s["key"], s["since"] = key, time.monotonic()
+        return key
+
+    def tick(self, state, text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *, mode="stream",
+             output_format=None, debounce:float|None=None) -> str|None:
+        """Submit the observed request if it has settled and the budgets allow; returns the job id if submitted."""
+        s = self.session(state)
+        key = self.observe(state, text, voice_id, stability, similarity, style, mode=mode, output_format=output_format)
+        if key in s["spent"] or time.monotonic() - s["since"] < (self.debounce if debounce is None else debounce):
+            return None
+        if s["chars"] + len(text) > self.session_chars:
+            if s["skipped"] != key:  # count each request once, not every tick
+                s["skipped"] = key
+                self._bump("skipped_budget")
+            return None
+        with self._lock:
+            self._inflight = {j for j in self._inflight if not getattr(self.jobs.get(j), "done", True)}
+            if len(self._inflight) >= self.max_inflight:
+                self.counters["skipped_busy"] += 1
+                return None
+            # every prefetch queues as one "session", so together they get a fair share, not one per visitor
+            job_id = self.jobs.submit_tts(text, api_key, voice_id, stability, similarity, style, mode=mode,
+                                          output_format=output_format, session=PREFETCH_SESSION)
+            self._inflight.add(job_id)
+            self.counters["issued"] += 1
+            self.counters["chars"] += len(text)
+        s["pending"].add(key)
+        s["spent"].add(key)
+        s["issued"] += 1
+        s["chars"] += len(text)
+        return job_id
+
+    def clicked(self, state, text, voice_id, stability=0.5, similarity=0.8, style=0.3, *, mode="stream",
+                output_format=None) -> bool:
+        """Account for a Generate click; True when the request had been prefetched."""
+        s = self.session(state)
+        key = tts_job_key(text, voice_id, stability, similarity, style, mode=mode, output_format=output_format)
+        hit = key in s["pending"]
+        s["pending"].discard(key)  # used: no longer counts as waste
+        s["spent"].add(key)        # and no longer worth prefetching
+        name = "hits" if hit else "misses"
+        s[name] += 1
+        self._bump(name)
+        return hit
+
+    def stats(self, state=None) -> dict:
+        """Process-wide counters (or one session's, given its ``state``) with the hit rate over clicks."""
+        if state is None:
+            with self._lock:
+                c = dict(self.counters)
+        else:
+            s = self.session(state)
+            c = {k: s[k] for k in ("issued", "hits", "misses", "wasted", "chars")}
+        clicks = c["hits"] + c["misses"]
+        c["hit_rate"] = c["hits"] / clicks if clicks else 0.0
+        return c
+
+_default = None
+_default_lock = threading.Lock()
+
+def default_prefetcher() -> Prefetcher:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Prefetcher()
+        return _default
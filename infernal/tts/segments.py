@@ -0,0 +1,148 @@
+"""Sentence-chunked, concurrent synthesis of long passages.
+
+A long stylized text is cut on sentence boundaries into segments of at most ``max_chars`` characters. Cuts never fall
+inside an ``⟨oath⟩`` or an INV-wrapped insert, and an insert that trails a sentence stays with that sentence. The
+segments are synthesized on a bounded thread pool, each through :func:`infernal.tts.tts_elevenlabs`, so each one is
+cached on its own and a repeated or edited passage only pays for the sentences that changed. A segment that fails is
+retried by itself, a few times, before the whole synthesis fails. Only failures the HTTP client gives up on at once
+(a read timeout, a dropped response, a 5xx outside ``RETRY_STATUS``) are retried here; 429 / 503 and failed connects
+have already been retried by the client, and retrying them again would multiply its attempts.
+
+The MP3 parts are joined on frame boundaries. Every ID3 tag and Xing/Info header is dropped except the first part's
+ID3v2 tag, along with any stray bytes before the first frame sync and any truncated last frame. ``tts_segments``
+yields the parts in order as soon as each one (and all before it) is ready, so the relay can start playback early.
+"""
+import re, time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+from ..text import INV
+from .mp3 import frames, join_mp3  # join_mp3 re-exported (it lived here before the mp3 helpers moved)
+
+MAX_CHARS = 400
+WORKERS = 4
+RETRIES = 2
+
+# ---------- segmentation ----------
+_PROTECTED = re.compile(f"{INV}[^{INV}]*{INV}|⟨[^⟩]*⟩")
+_END = re.compile(f"[.!?…]+[\"'”’)\\]»]*(?:[ \\t]*(?:{INV}[^{INV}]*{INV}|⟨[^⟩]*⟩))*(?=\\s|$)")
+_SPACE = re.compile(r"\s+")
+
+def _inside(spans, starts, i):
+    k = bisect_right(starts, i) - 1
+    return k >= 0 and spans[k][0] < i < spans[k][1]
+
+def split_sentences(text:str) -> list:
+    """Sentences of ``text`` (whitespace between them dropped); protected inserts are never split."""
+    spans = [m.span() for m in _PROTECTED.finditer(text)]
+    starts = [a for a, _ in spans]
+    out, pos = [], 0
+    for m in _END.finditer(text):
+        if _inside(spans, starts, m.start()): continue
+        piece = text[pos:m.end()].strip()
+        if piece: out.append(piece)
+        pos = m.end()
+    tail = text[pos:].strip()
+    if tail: out.append(tail)
+    return out
+
+def _hard_split(sentence, max_chars, spans, starts):
+    # an over-long sentence: cut at the last whitespace (outside inserts) before the limit
+    out = []
+    while len(sentence) > max_chars:
+        cut = None
+        for m in _SPACE.finditer(sentence, 0, max_chars + 1):
+            if not _inside(spans, starts, m.start()): cut = m
+        if cut is None or cut.start() == 0: break
+        out.append(sentence[:cut.start()])
+        sentence = sentence[cut.end():]
+        spans = [m.span() for m in _PROTECTED.finditer(sentence)]
+        starts = [a for a, _ in spans]
+    out.append(sentence)
+    return out
+
+def split_segments(text:str, max_chars:int=MAX_CHARS) -> list:
+    """Consecutive sentences packed greedily into segments of at most ``max_chars`` (longer sentences are cut at
+    whitespace)."""
+    segs, cur = [], ""
+    for s in split_sentences(text):
+        pieces = [s]
+        if len(s) > max_chars:
+            spans = [m.span() for m in _PROTECTED.finditer(s)]
+            pieces = _hard_split(s, max_chars, spans, [a for a, _ in spans])
+        for p in pieces:
+            if cur and len(cur) + 1 + len(p) <= max_chars:
+                cur += " " + p
+            else:
+                if cur: segs.append(cur)
+                cur = p
+    if cur: segs.append(cur)
+    return segs
+
+# ---------- synthesis ----------
+def _retryable(e):
+    import requests
+
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        return e.response.status_code == 429 or e.response.status_code >= 500
+    return isinstance(e, requests.RequestException)
+
+def _client_retried(e):
+    # what TTSClient.request has already retried before raising
+    import requests
+    from .client import RETRY_STATUS, _connect_failed
+
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        return e.response.status_code in RETRY_STATUS
+    return isinstance(e, requests.ConnectionError) and _connect_failed(e)
+
+def _synth_one(synth, seg, args, kw, retries, backoff, timing):
+    for attempt in range(retries + 1):
+        try:
+            return synth(seg, *args, timing=timing, **kw)
+        except Exception as e:
+            if attempt == retries or not _retryable(e) or _client_retried(e): raise
+            time.sleep(backoff * 2 ** attempt)
+
+def tts_segments(text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, *, max_chars:int=MAX_CHARS,
+                 workers:int=WORKERS, retries:int=RETRIES, backoff:float=0.5, timing:dict|None=None, synth=None,
+                 **tts_kw):
+    """
+    Yields the MP3 of ``text`` segment by segment, in order and framed so that ``b"".join`` is one valid file.
+    Segments run ``workers`` at a time, each through ``synth`` (default ``tts_elevenlabs``; a
+    :class:`~infernal.tts.backends.TTSService` passes its gated call) with ``tts_kw`` (e.g. ``cache=``).
+    ``timing`` also counts the ``upstream_segments`` (the rest were cache hits) and ``upstream_ttfb_s``, when the
+    first of them was yielded (``None`` if every segment came from the cache).
+    """
+    if synth is None:
+        from . import tts_elevenlabs as synth
+    segs = split_segments(text, max_chars) or [text]
+    t = timing if timing is not None else {}
+    t.update(kind="segments", chars=len(text), segments=len(segs), segments_done=0, upstream_segments=0, ttfb_s=None,
+             upstream_ttfb_s=None, total_s=None, bytes=0)
+    t0 = time.perf_counter()
+    args = (api_key, voice_id, stability, similarity, style)
+    seg_timings = [{} for _ in segs]  # left empty by a cache hit
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(segs))), thread_name_prefix="tts-seg")
+    try:
+        futures = [pool.submit(_synth_one, synth, s, args, tts_kw, retries, backoff, st)
+                   for s, st in zip(segs, seg_timings)]
+        for i, f in enumerate(futures):
+            tag, audio = frames(f.result())
+            piece = tag + audio if i == 0 else audio
+            if t["ttfb_s"] is None:
+                t["ttfb_s"] = time.perf_counter() - t0
+            if seg_timings[i]:
+                t["upstream_segments"] += 1
+                if t["upstream_ttfb_s"] is None:
+                    t["upstream_ttfb_s"] = time.perf_counter() - t0
+            t["bytes"] += len(piece)
+            t["segments_done"] = i + 1
+            yield piece
+        t["total_s"] = time.perf_counter() - t0
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def synthesize_long(text, api_key, voice_id, stability=0.5, similarity=0.8, style=0.3, **kw) -> bytes:
+    """Whole-file form of :func:`tts_segments`."""
+    return b"".join(tts_segments(text, api_key, voice_id, stability, similarity, style, **kw))
@@ -0,0 +1,168 @@
+"""Local audio relay so the browser can play TTS audio while it is still being synthesized.
+
+``st.audio`` only takes complete bytes (or a URL), so a streamed synthesis runs as a background job
+(:mod:`infernal.tts.jobs`) and the player is pointed at the relay:
+
+    job_id = default_jobs().submit_tts(text, api_key, voice_id, mode="stream")
+    st.audio(default_relay().url(job_id), format="audio/mpeg", autoplay=True)
+
+``GET /audio/<job id>`` replays what the job has buffered and then follows new chunks with chunked transfer encoding,
+so playback starts with the first frames; once the job is finished the same URL redirects to the clip's media URL.
+
+``GET /media/<sha256>`` serves a finished clip from the content-addressed media store with the key as ``ETag``,
+``Cache-Control: immutable`` (the bytes behind a key never change), ``304`` revalidation and byte ranges for seeking;
+``?download=1`` adds ``Content-Disposition: attachment``. The apps keep only that key in the session.
+
+Configuration: the relay is opt-in, since the browser has to reach it. Without it the apps embed the finished bytes,
+which works for every viewer. ``INFERNAL_TTS_RELAY_URL`` is the base URL the browser should use (a route to the relay
+through the deploy's proxy, over HTTPS if the page is) and turns the relay on. ``INFERNAL_TTS_RELAY=on`` turns it on
+at its bind address, which only works when the app is viewed on the same machine (local development).
+``INFERNAL_TTS_RELAY=off`` keeps it off even with a URL. ``INFERNAL_TTS_RELAY_HOST`` / ``INFERNAL_TTS_RELAY_PORT``
+choose the bind address (default ``127.0.0.1``, any free port).
+"""
+import os, re, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .cache import default_media
+from .jobs import default_jobs
+
+_PATH = re.compile(r"^/audio/([0-9a-f]{32})$")
+_MEDIA = re.compile(r"^/media/([0-9a-f]{64})(\?download=1)?$")
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *a):
+        pass
+
+    def do_HEAD(self):
+        m = _MEDIA.match(self.path)
+        if not m:
+            return self.send_error(405)
+        self._media(m, head=True)
+
+    def do_GET(self):
+        m = _MEDIA.match(self.path)
+        if m:
+            return self._media(m)
+        m = _PATH.match(self.path)
+        job = self.server.relay.jobs.get(m.group(1)) if m else None
+        if job is None or job.cancelled:
+            return self.send_error(404)
+        chunks = job.follow() if job.media_key is None else None
+        if chunks is None:  # finished (and possibly released meanwhile): the stored clip
+            if job.media_key is None:
+                return self.send_error(404)
+            self.send_response(302)
+            self.send_header("Location", f"/media/{job.media_key}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        try:
+            for chunk in chunks:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        except (BrokenPipeError, ConnectionResetError):
+            return  # the player went away; the job keeps filling for the download
+        finally:
+            chunks.close()
+        if not job.ok:
+            self.close_connection = True  # no terminating chunk: the browser sees a truncated stream
+            return
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _media(self, m, head=False):
+        key = m.group(1)
+        etag = f'"{key}"'
+        if etag in (self.headers.get("If-None-Match") or ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        data = self.server.relay.media.get(key)
+        if data is None:
+            return self.send_error(404)
+        start, end, status = 0, len(data), 200
+        r = _RANGE.match(self.headers.get("Range") or "")
+        if r and (r.group(1) or r.group(2)):
+            if r.group(1):
+                start, end = int(r.group(1)), min(len(data), int(r.group(2)) + 1 if r.group(2) else len(data))
+            else:
+                start = max(0, len(data) - int(r.group(2)))
+            if start >= end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(end - start))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(data)}")
+        if m.group(2):
+            self.send_header("Content-Disposition", 'attachment; filename="voice.mp3"')
+        self.end_headers()
+        if not head:
+            self.wfile.write(data[start:end])
+
+class AudioRelay:
+    """Threaded relay server in front of a :class:`~infernal.tts.jobs.JobManager` (default: the shared one)."""
+    def __init__(self, host:str="127.0.0.1", port:int=0, public_url:str|None=None, jobs=None, media=None):
+        self.jobs = jobs or default_jobs()
+        self.media = media if media is not None else default_media()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.relay = self
+        self.base_url = (public_url or f"http://{host}:{self.httpd.server_address[1]}").rstrip("/")
+        threading.Thread(target=self.httpd.serve_forever, name="tts-relay", daemon=True).start()
+
+    def url(self, job_id:str) -> str:
+        """Live (then redirecting) URL of a job."""
+        return f"{self.base_url}/audio/{job_id}"
+
+    def media_url(self, key:str, download:bool=False) -> str:
+        """Cacheable URL of a finished clip in the media store."""
+        return f"{self.base_url}/media/{key}" + ("?download=1" if download else "")
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+_default = None
+_default_lock = threading.Lock()
+
+def relay_enabled() -> bool:
+    """Opted in by ``INFERNAL_TTS_RELAY_URL`` or ``INFERNAL_TTS_RELAY=on`` (and not turned off)."""
+    flag = os.environ.get("INFERNAL_TTS_RELAY", "").lower()
+    if flag in ("0", "off", "false", "no"):
+        return False
+    return flag in ("1", "on", "true", "yes") or bool(os.environ.get("INFERNAL_TTS_RELAY_URL"))
+
+def default_relay() -> AudioRelay|None:
+    """Process-wide relay configured from the environment, or ``None`` unless opted in (:func:`relay_enabled`) or
+    when the port can't be bound."""
+    global _default
+    if not relay_enabled():
+        return None
+    with _default_lock:
+        if _default is None:
+            try:
+                _default = AudioRelay(os.environ.get("INFERNAL_TTS_RELAY_HOST", "127.0.0.1"),
+                                      int(os.environ.get("INFERNAL_TTS_RELAY_PORT", "0")),
+                                      os.environ.get("INFERNAL_TTS_RELAY_URL") or None)
+            except OSError:
+                return None
+        return _default
@@ -0,0 +1,193 @@
+"""Local stand-in for the ElevenLabs text-to-speech endpoint.
+
+    with StubServer(latency=0.05, fail=[429, 503]) as stub:
+        client = TTSClient(stub.url)
+        audio = client.synthesize("key", "voice", tts_payload("hello"))
+
+    python -m infernal.tts.stub --port 8765 --latency 0.4 --jitter 0.5 --error-rate 0.05 --disconnect-rate 0.02
+    ELEVENLABS_BASE_URL=http://127.0.0.1:8765 streamlit run Demon4.py
+
+``POST /v1/text-to-speech/{voice_id}`` (``xi-api-key`` header and a JSON body with ``text`` required, as upstream)
+answers with a silent but well-formed MP3: an ID3v2 tag followed by Layer III frames in the requested
+``output_format`` (default ``mp3_44100_128``), about 78 ms of audio per 3 characters of text times a size factor drawn
+from ``1 ± size_jitter``. ``.../stream`` sends the same bytes with
+chunked transfer encoding, ``chunk_size`` bytes every ``chunk_delay`` seconds.
+
+Time to the response is ``latency`` × a log-normal factor of spread ``jitter`` (median 1) plus ``char_latency`` per
+character. With probability ``error_rate`` the request fails with a status drawn from ``error_statuses`` (with
+``retry_after``, if set), and with probability ``disconnect_rate`` a streamed response is cut off halfway without its
+terminating chunk. ``fail`` queues statuses to serve, in order, before any of that. ``seed`` makes the draws
+repeatable. Pass ``certfile`` / ``keyfile`` to serve HTTPS so TLS setup is part of what a client measures.
+"""
+import argparse, json, random, re, ssl, threading, time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .formats import DEFAULT_FORMAT, FORMATS
+from .mp3 import frame_header, frame_len, samples_per_frame
+
+_PATH = re.compile(r"^/v1/text-to-speech/([^/?]+)(/stream)?$")
+_ID3 = b"ID3\x04\x00\x00\x00\x00\x00\x00"           # empty ID3v2.4 tag
+_SECONDS_PER_CHAR = 1152 / 44100 / 3
+
+def fake_mp3(text:str, scale:float=1.0, output_format:str=DEFAULT_FORMAT) -> bytes:
+    rate, kbps = FORMATS[output_format]
+    h = frame_header(rate, kbps)
+    frame = h + bytes(frame_len(h) - 4)  # silent
+    n = round(len(text) * _SECONDS_PER_CHAR * scale * rate / samples_per_frame(rate))
+    return _ID3 + frame * max(1, n)
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # load tests open many connections at once
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def log_message(self, *a):
+        pass
+
+    def _reply(self, status, body=b"", ctype="application/json", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in headers:
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        url = urlsplit(self.path)
+        m = _PATH.match(url.path)
+        if not m:
+            return self._reply(404, b'{"detail":"not found"}')
+        fmt = parse_qs(url.query).get("output_format", [DEFAULT_FORMAT])[0]
+        if fmt not in FORMATS:
+            return self._reply(422, b'{"detail":"unsupported output_format"}')
+        if not self.headers.get("xi-api-key"):
+            return self._reply(401, b'{"detail":"missing xi-api-key"}')
+        try:
+            text = json.loads(body)["text"]
+        except (ValueError, KeyError, TypeError):
+            return self._reply(422, b'{"detail":"bad body"}')
+        streaming = bool(m.group(2))
+        status, wait, scale, cut = stub._draw(len(text), streaming)
+        if wait:
+            time.sleep(wait)
+        if status != 200:
+            extra = [("Retry-After", str(stub.retry_after))] if stub.retry_after is not None else []
+            return self._reply(status, b'{"detail":"stub failure"}', headers=extra)
+        audio = fake_mp3(text, scale, fmt)
+        if not streaming:
+            return self._reply(200, audio, "audio/mpeg")
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        end = len(audio) // 2 if cut else len(audio)
+        for i in range(0, end, stub.chunk_size):
+            if i and stub.chunk_delay:
+                time.sleep(stub.chunk_delay)
+            piece = audio[i:min(i + stub.chunk_size, end)]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+        if cut:
+            self.close_connection = True
+            return
+        self.wfile.write(b"0\r\n\r\n")
+
+class StubServer:
+    """Threaded stub on ``127.0.0.1`` (ephemeral port by default); ``url`` is its base URL. Context manager."""
+    def __init__(self, *, latency:float=0.0, jitter:float=0.0, char_latency:float=0.0, error_rate:float=0.0,
+                 error_statuses=(429, 500, 503), retry_after=None, size_jitter:float=0.0, disconnect_rate:float=0.0,
+                 fail=(), chunk_size:int=4096, chunk_delay:float=0.0, seed=None, port:int=0, certfile=None,
+                 keyfile=None):
+        self.latency, self.jitter, self.char_latency = latency, jitter, char_latency
+        self.error_rate, self.error_statuses, self.retry_after = error_rate, tuple(error_statuses), retry_after
+        self.size_jitter, self.disconnect_rate = size_jitter, disconnect_rate
+        self.chunk_size, self.chunk_delay = chunk_size, chunk_delay
+        self._fail = deque(fail)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counters = dict(requests=0, failures=0, disconnects=0)
+        self.httpd = _Server(("127.0.0.1", port), _Handler)
+        self.httpd.stub = self
+        scheme = "http"
+        if certfile:
+            ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ctx.load_cert_chain(certfile, keyfile)
+            self.httpd.socket = ctx.wrap_socket(self.httpd.socket, server_side=True)
+            scheme = "https"
+        self.url = f"{scheme}://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = None
+
+    def _draw(self, chars, streaming):
+        """(status, seconds to wait, audio size factor, cut the stream) for one request."""
+        with self._lock:
+            rng = self._rng
+            self.counters["requests"] += 1
+            if self._fail:
+                status = self._fail.popleft()
+            elif self.error_rate and rng.random() < self.error_rate:
+                status = rng.choice(self.error_statuses)
+            else:
+                status = 200
+            wait = self.latency * (rng.lognormvariate(0.0, self.jitter) if self.jitter else 1.0)
+            wait += self.char_latency * chars
+            scale = rng.uniform(1 - self.size_jitter, 1 + self.size_jitter) if self.size_jitter else 1.0
+            cut = streaming and status == 200 and self.disconnect_rate and rng.random() < self.disconnect_rate
+            if status != 200: self.counters["failures"] += 1
+            if cut: self.counters["disconnects"] += 1
+        return status, wait, scale, bool(cut)
+
+    def fail(self, *statuses):
+        """Queue statuses to serve before the next successes."""
+        with self._lock:
+            self._fail.extend(statuses)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="tts-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m infernal.tts.stub", description=__doc__.splitlines()[0])
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.3, help="median seconds before the response")
+    ap.add_argument("--jitter", type=float, default=0.5, help="log-normal spread of the latency")
+    ap.add_argument("--char-latency", type=float, default=0.0005, help="extra seconds per character")
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--retry-after", default=None)
+    ap.add_argument("--size-jitter", type=float, default=0.1)
+    ap.add_argument("--disconnect-rate", type=float, default=0.0)
+    ap.add_argument("--chunk-delay", type=float, default=0.05)
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args(argv)
+    stub = StubServer(latency=args.latency, jitter=args.jitter, char_latency=args.char_latency,
+                      error_rate=args.error_rate, retry_after=args.retry_after, size_jitter=args.size_jitter,
+                      disconnect_rate=args.disconnect_rate, chunk_delay=args.chunk_delay, seed=args.seed,
+                      port=args.port)
+    print(f"stub listening on {stub.url} (ELEVENLABS_BASE_URL={stub.url})")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.httpd.server_close()
+        print(stub.counters)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Record what the original single-file apps produced, for ``test_baseline.py``.
+
+    python tests/make_baseline.py [<commit>]    # default: the first commit, before the cores moved into ``infernal``
+
+Every ``Demon*.py`` of that commit is loaded without its UI (only its imports, assignments, functions and classes are
+run, minus streamlit / requests and anything touching ``st``) and its encoders and decoders are run over ``INPUTS`` at
+``LEVELS``. Only a digest per case is stored.
+"""
+import ast, hashlib, json, os, random, subprocess, sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OUT = os.path.join(HERE, "baseline.json")
+
+INPUTS = [
+    "The thirty sisters whisper that the shepherd has phoned the philosopher.",
+    "I am the one who knocks; thou shalt not pass!  My, mine & yours...",
+    "Quick quiet queens quarrel over the quaint quilt in the Theatre of Shadows.",
+    "Hello, world. THE END? the end! Sh... shh. Ph.D. thesis #42 (v2.0).",
+    "We behold our doom, and you shall bear your burden by the pact of old.",
+    "Zealous wizards juggle 7 fizzy jugs - naïve café owners watch, aghast.",
+    "line one\nline two\n\n  indented\tand tabbed  ",
+    "",
+]
+LEVELS = [1, 10, 25, 35, 40, 50, 60, 66, 75, 85, 95, 100]
+PERSONAS = ("Baal", "Mephisto", "Imp")
+SEEDS = (0, 7)
+
+def load(commit, script):
+    """Top-level imports, constants, functions and classes of ``script`` at ``commit``, without the page."""
+    src = subprocess.run(["git", "show", f"{commit}:{script}"], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(HERE)).stdout
+    ns = {"__name__": "baseline_" + script[:-3]}
+    for node in ast.parse(src).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            names = [a.name for a in node.names] if isinstance(node, ast.Import) else [node.module or ""]
+            if any(n.split(".")[0] in ("streamlit", "requests") for n in names): continue
+        elif not isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Assign, ast.AnnAssign)):
+            continue
+        elif any(isinstance(n, ast.Name) and n.id == "st" for n in ast.walk(node)):
+            continue
+        try:
+            exec(compile(ast.Module([node], []), script, "exec"), ns)
+        except NameError:
+            pass  # a value computed from the page's widgets
+    return ns
+
+def digest(values) -> str:
+    return hashlib.sha256(repr(values).encode("utf-8")).hexdigest()[:24]
+
+def seeded(f, seed, *args, **kw):
+    random.seed(seed)
+    return f(*args, **kw)
+
+def cases(apps):
+    """``{name: [(input index, thunk), ...]}``; ``apps`` maps a script name to its namespace (baseline or current)."""
+    out = {}
+    def add(name, thunks):
+        out.setdefault(name, []).extend(thunks)
+
+    for i, s in enumerate(INPUTS):
+        d = apps["Demon.py"]
+        add("persona.demon_stylize_sentence", [(i, lambda d=d, s=s, p=p, n=n, seed=seed:
+            seeded(d["demon_stylize_sentence"], seed, s, p, n, n > 1, n > 1, n == 3))
+            for p in PERSONAS for n in (1, 2, 3) for seed in SEEDS])
+        add("persona.de_demonify_sentence", [(i, lambda d=d, s=s, a=a: d["de_demonify_sentence"](s, a, a))
+                                             for a in (False, True)])
+
+        for app in ("Demon2.py", "Demon3.py"):
+            d = apps[app]
+            add(f"angelic.stylize_sentence_corruption ({app})", [(i, lambda d=d, s=s, p=p, c=c, seed=seed:
+                seeded(d["stylize_sentence_corruption"], seed, s, p, c, c > 50, c > 50, c > 90, c == 60))
+                for p in PERSONAS for c in LEVELS for seed in SEEDS])
+
+        for app in ("Demon4.py", "Demon5.py"):
+            d = apps[app]
+            add(f"simple.stylize_sentence_corruption ({app})", [(i, lambda d=d, s=s, c=c:
+                seeded(d["stylize_sentence_corruption"], None, s, c, f"k{c}")) for c in LEVELS])
+
+        d = apps["Demon6.py"]
+        add("simple.stylize_deterministic", [(i, lambda d=d, s=s, c=c: d["stylize_sentence_corruption"](s, c))
+                                             for c in LEVELS])
+
+        for app in ("Demon7.py", "Demon8.py", "Demon9.py"):
+            d = apps[app]
+            add(f"stylize_sentence_corruption ({app})", [(i, lambda d=d, s=s, c=c: d["stylize_sentence_corruption"](s, c))
+                                                         for c in LEVELS])
+
+        for app in ("Demon10.py", "Demon11.py"):
+            d = apps[app]
+            add(f"continuous.stylize_sentence ({app})", [(i, lambda d=d, s=s, c=c, a=a, seed=seed:
+                d["stylize_sentence"](s, c, archaic=a, latinisms=a, glitch_override=c == 66, seed=seed))
+                for c in LEVELS for a in (False, True) for seed in (None, "seed")])
+
+    # decoders: plain text, the ornate encoder's output and a fancy-font rendition
+    stylize = apps["Demon7.py"]["stylize_sentence_corruption"]
+    texts = [s for s in INPUTS] + [stylize(s, c)[0] for s in INPUTS for c in (25, 75, 100)]
+    texts += [apps["Demon7.py"]["to_fraktur"](s) for s in INPUTS]
+    decoders = [("simple.reverse_translate (Demon4.py)", "Demon4.py", "reverse_translate", {}),
+                ("simple.reverse_translate (Demon6.py)", "Demon6.py", "reverse_translate", {}),
+                ("ornate.reverse_translate", "Demon7.py", "reverse_translate", {}),
+                ("angelic.de_demonify_sentence", "Demon2.py", "de_demonify_sentence", {}),
+                ("decode_to_english (Demon8.py)", "Demon8.py", "decode_to_english", {}),
+                ("decode_to_english (Demon9.py)", "Demon9.py", "decode_to_english", {}),
+                ("continuous.decode_to_english", "Demon10.py", "decode_to_english", dict(decode_archaic=True))]
+    for name, app, func, kw in decoders:
+        f = apps[app][func]
+        add(name, [(k, lambda f=f, t=t, kw=kw: f(t, **kw)) for k, t in enumerate(texts)])
+    return out
+
+def digests(apps) -> dict:
+    groups = {}
+    for name, thunks in cases(apps).items():
+        per = groups.setdefault(name, {})
+        for i, thunk in thunks:
+            per.setdefault(str(i), []).append(thunk())
+    return {name: {i: digest(v) for i, v in per.items()} for name, per in groups.items()}
+
+APPS = ["Demon.py"] + [f"Demon{n}.py" for n in range(2, 12)]
+
+def main(commit=None):
+    if commit is None:
+        commit = subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], capture_output=True, text=True,
+                                check=True, cwd=os.path.dirname(HERE)).stdout.split()[0]
+    apps = {a: load(commit, a) for a in APPS}
+    with open(OUT, "w", encoding="utf-8") as f:
+        json.dump(dict(commit=commit, digests=digests(apps)), f, indent=1, sort_keys=True)
+        f.write("\n")
+    print(f"wrote {OUT} from {commit[:12]}")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,53 @@
+import random
+
+from infernal.stream import iter_units, stylize_stream, decode_stream
+
+def chunked(text, rng):
+    i = 0
+    while i < len(text):
+        n = rng.randint(1, 40)
+        yield text[i:i+n]
+        i += n
+
+def sample(rng, n=4000):
+    words = ["the", "thirty", "sisters", "whisper", "q͟u", "á̴̖", "x" * 90, "\t", "  "]
+    out = []
+    while len(out) < n:
+        out.append(rng.choice(words))
+        out.append(rng.choice([" ", " ", "   ", "\t", "\n", "\r\n", ""]))
+    return "".join(out)
+
+def test_units_join_back():
+    rng = random.Random(1)
+    text = sample(rng)
+    units = list(iter_units([text], limit=50))
+    assert "".join(c + s for c, s in units) == text
+
+def test_units_do_not_depend_on_chunking():
+    rng = random.Random(2)
+    for limit in (7, 20, 50):
+        text = sample(rng)
+        whole = list(iter_units([text], limit=limit))
+        for _ in range(5):
+            assert list(iter_units(chunked(text, rng), limit=limit)) == whole
+        assert list(iter_units(text, limit=limit)) == whole  # one character per chunk
+
+def test_units_bounded():
+    text = ("a" + "́" * 3) * 500 + " tail"
+    units = list(iter_units([text], limit=10))
+    assert all(len(c) <= 4 * 10 + 4 for c, _ in units)
+    assert "".join(c + s for c, s in units) == text
+    assert all(not c or c[0] != "́" for c, _ in units)  # never split before a combining mark
+
+def test_long_line_cut_after_limit():
+    line = " ".join(["word"] * 100)
+    units = list(iter_units([line], limit=30))
+    assert all(30 <= len(c) <= 34 for c, _ in units[:-1])
+    assert all(s == " " for _, s in units[:-1])
+
+def test_stream_does_not_depend_on_chunking():
+    rng = random.Random(3)
+    text = sample(rng, 1500)
+    whole = "".join(stylize_stream([text], 80, seed="s", limit=100))
+    assert "".join(stylize_stream(chunked(text, rng), 80, seed="s", limit=100)) == whole
+    assert "".join(decode_stream([whole], limit=100)) == "".join(decode_stream(chunked(whole, rng), limit=100))
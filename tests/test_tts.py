@@ -0,0 +1,133 @@
+"""TTS client, relay and segment joins against the local stub (no network, no credits)."""
+import time
+
+import pytest
+import requests
+
+from infernal.tts import tts_elevenlabs, tts_payload
+from infernal.tts.backends import selfcheck
+from infernal.tts.cache import AudioCache
+from infernal.tts.client import TTSClient
+from infernal.tts.jobs import JobManager
+from infernal.tts.mp3 import frames
+from infernal.tts.segments import tts_segments
+from infernal.tts.server import AudioRelay
+from infernal.tts.stub import StubServer, fake_mp3
+
+TEXT = "The thirty sisters whisper. Thus bound, the shepherd phoned. Behold the end of the pact."
+
+@pytest.fixture
+def stub():
+    with StubServer() as s:
+        yield s
+
+def client_for(stub, **kw):
+    kw.setdefault("backoff", 0.01)
+    return TTSClient(stub.url, **kw)
+
+# ---------- client ----------
+@pytest.mark.parametrize("statuses", [(429,), (503,), (429, 503)])
+def test_retries_429_and_503(stub, statuses):
+    stub.fail(*statuses)
+    c = client_for(stub)
+    assert c.synthesize("key", "voice", tts_payload(TEXT)) == fake_mp3(TEXT)
+    assert stub.counters["requests"] == len(statuses) + 1
+    assert c.counters["retries"] == len(statuses)
+
+def test_gives_up_after_retries(stub):
+    stub.fail(503, 503, 503)
+    with pytest.raises(requests.HTTPError) as e:
+        client_for(stub, retries=2).synthesize("key", "voice", tts_payload(TEXT))
+    assert e.value.response.status_code == 503
+    assert stub.counters["requests"] == 3
+
+def test_no_retry_on_400(stub):
+    stub.fail(400)
+    with pytest.raises(requests.HTTPError) as e:
+        client_for(stub).synthesize("key", "voice", tts_payload(TEXT))
+    assert e.value.response.status_code == 400
+    assert stub.counters["requests"] == 1
+
+def test_no_retry_on_read_timeout():
+    with StubServer(latency=0.5) as stub:
+        with pytest.raises(requests.ReadTimeout):
+            client_for(stub, read_timeout=0.1).synthesize("key", "voice", tts_payload(TEXT))
+        assert stub.counters["requests"] == 1  # the body may have been billed: not resent
+
+def test_retry_after_is_honoured():
+    with StubServer(retry_after="0.3", fail=[503]) as stub:
+        t0 = time.perf_counter()
+        client_for(stub, backoff=0.0).synthesize("key", "voice", tts_payload(TEXT))
+        assert time.perf_counter() - t0 >= 0.3
+    with StubServer(retry_after="30", fail=[429]) as stub:
+        t0 = time.perf_counter()
+        client_for(stub, max_retry_after=0.1).synthesize("key", "voice", tts_payload(TEXT))
+        assert time.perf_counter() - t0 < 5  # capped at max_retry_after
+
+# ---------- relay ----------
+@pytest.fixture
+def relay(tmp_path):
+    store = AudioCache(str(tmp_path))
+    r = AudioRelay(jobs=JobManager(workers=2, store=store), media=store)
+    yield r
+    r.close()
+
+def test_relay_streams_the_stored_clip(relay):
+    with StubServer(chunk_size=1024, chunk_delay=0.01) as stub:
+        c = client_for(stub)
+        job_id = relay.jobs.submit(lambda: c.stream("key", "voice", tts_payload(TEXT)))
+        live = requests.get(relay.url(job_id), timeout=10)
+        job = relay.jobs.get(job_id)
+        for _ in range(100):
+            if job.done and job.media_key: break
+            time.sleep(0.02)
+    assert live.status_code == 200 and not live.history and job.ok  # served live, not redirected
+    assert live.content == relay.media.get(job.media_key) == fake_mp3(TEXT)
+
+    r = requests.get(relay.url(job_id), allow_redirects=False, timeout=10)
+    assert r.status_code == 302 and r.headers["Location"] == f"/media/{job.media_key}"
+    assert requests.get(relay.url(job_id), timeout=10).content == live.content
+
+def test_media_conditional_range_and_head(relay):
+    data = fake_mp3(TEXT)
+    key = "ab" * 32
+    relay.media.put(key, data)
+    url = relay.media_url(key)
+
+    r = requests.get(url, timeout=10)
+    assert r.status_code == 200 and r.content == data and r.headers["ETag"] == f'"{key}"'
+    assert requests.get(url, headers={"If-None-Match": r.headers["ETag"]}, timeout=10).status_code == 304
+
+    r = requests.get(url, headers={"Range": "bytes=10-109"}, timeout=10)
+    assert r.status_code == 206 and r.content == data[10:110]
+    assert r.headers["Content-Range"] == f"bytes 10-109/{len(data)}"
+    assert requests.get(url, headers={"Range": "bytes=-16"}, timeout=10).content == data[-16:]
+    assert requests.get(url, headers={"Range": f"bytes={len(data)}-"}, timeout=10).status_code == 416
+
+    r = requests.head(url, timeout=10)
+    assert r.status_code == 200 and r.content == b"" and int(r.headers["Content-Length"]) == len(data)
+    assert "attachment" in requests.head(relay.media_url(key, download=True), timeout=10).headers["Content-Disposition"]
+    assert requests.get(relay.media_url("cd" * 32), timeout=10).status_code == 404
+
+# ---------- segments ----------
+def test_segments_join_on_frame_boundaries(stub):
+    c = client_for(stub)
+    synth = lambda text, *a, **kw: tts_elevenlabs(text, *a, client=c, **kw)
+    timing = {}
+    out = b"".join(tts_segments(TEXT, "key", "voice", max_chars=30, cache=None, synth=synth, timing=timing))
+    assert timing["segments"] > 1 and timing["upstream_segments"] == timing["segments"]
+    tag, audio = frames(out)
+    assert tag + audio == out  # one ID3 tag, then nothing but whole frames
+    assert out.count(b"ID3") == 1
+
+def test_segments_drop_stray_bytes_and_truncated_frames():
+    clip = fake_mp3("segment")
+    messy = lambda text, *a, **kw: b"junk" + clip + frames(clip)[1][:100]  # ends inside a frame
+    timing = {}
+    out = b"".join(tts_segments(TEXT, "key", "voice", max_chars=30, synth=messy, timing=timing))
+    tag, audio = frames(out)
+    assert tag + audio == out
+    assert audio == frames(clip)[1] * timing["segments"]
+
+def test_backends_selfcheck():
+    selfcheck()